@@ -0,0 +1,66 @@
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+import gen
+import plot
+
+def triangles_from_edges(n, edges):
+    # The former way of plot.py to find the triangles: every triple of pairwise adjacent vertices
+    adj = defaultdict(set)
+    for a, b in edges:
+        adj[a].add(b)
+        adj[b].add(a)
+
+    triangles = set()
+    for a in range(n):
+        for b in adj[a]:
+            for c in adj[b]:
+                if c in adj[a] and len({a, b, c}) == 3:
+                    triangles.add(tuple(sorted((a, b, c))))
+
+    return triangles
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the rendering of triangulations by plot.py for random polygons of increasing sizes.")
+    parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    parser.add_argument("--triangulate", default="./triangulate", help="Path to the triangulate executable")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'vertices':>9} {'read':>8} {'polygon':>8} {'monotone':>9} {'triangles':>10} {'edge search':>12}  (seconds)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            polygon_path = os.path.join(directory, "polygon.bin")
+            result_path = os.path.join(directory, "result.bin")
+            gen.write_vertices_to_binary_file(gen.generate_random_polygons(1, size, rng), polygon_path)
+            subprocess.run([args.triangulate, "--no-plot", "--binary", polygon_path, result_path], check=True)
+
+            with open(result_path, "rb") as f:
+                data = f.read()
+
+            start = time.perf_counter()
+            points, monotone_edges, edges, triangles = plot.read_result(data)
+            read_time = time.perf_counter() - start
+
+            polygon_time = timed(plot.plot_polygon, points, os.path.join(directory, "vertices.png"))
+            monotone_time = timed(plot.plot_monotone_edges, points, monotone_edges, os.path.join(directory, "monotone_edges.png"))
+            triangles_time = timed(plot.plot_triangulation, points, edges, triangles, os.path.join(directory, "triangulation.png"), rng)
+            search_time = timed(triangles_from_edges, len(points), edges.tolist())
+
+            print(f"{size:>9} {read_time:>8.3f} {polygon_time:>8.3f} {monotone_time:>9.3f} {triangles_time:>10.3f} {search_time:>12.3f}")
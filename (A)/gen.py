@@ -1,31 +1,99 @@
-import os
-import random
+import argparse
 import math
-import sys
+import os
+
+import numpy as np
+
+BINARY_HEADER = np.dtype([("magic", "S8"), ("version", "<u4"), ("reserved", "<u4"), ("n_polygons", "<u8"), ("n_vertices", "<u8")])
+
+def generate_random_polygons(n_polygons, n_sides, rng, xy_range=(0, 100)):
+    # Random points sorted by angle around their centroid, for all the polygons at once: shape (n_polygons, n_sides, 2)
+    vertices = rng.uniform(*xy_range, size=(n_polygons, n_sides, 2))
+    centered = vertices - vertices.mean(axis=1, keepdims=True)
+    order = np.argsort(np.arctan2(centered[..., 1], centered[..., 0]), axis=1)
+    return np.take_along_axis(vertices, order[..., None], axis=1)
+
+def generate_star_polygons(n_polygons, n_sides, rng, center, radius):
+    # One vertex per angular sector, at 0.5 to 1 times the radius: the disc of half the radius lies inside each polygon
+    angles = (np.arange(n_sides) + rng.uniform(0.1, 0.9, size=(n_polygons, n_sides))) * (2 * math.pi / n_sides)
+    distances = rng.uniform(0.5, 1.0, size=(n_polygons, n_sides)) * radius
+    return np.stack((center[..., 0, None] + distances * np.cos(angles), center[..., 1, None] + distances * np.sin(angles)), axis=-1)
+
+def generate_polygons_with_holes(n_polygons, n_sides, n_holes, hole_sides, rng, xy_range=(0, 100)):
+    # Star-shaped outlines with star-shaped holes on a grid inside the square inscribed in their inner disc
+    radius = (xy_range[1] - xy_range[0]) / 2
+    centers = np.full((n_polygons, 2), xy_range[0] + radius)
+    outlines = generate_star_polygons(n_polygons, n_sides, rng, centers, radius)
 
-def generate_random_polygon(n_sides, xy_range=(0, 100)):
-    vertices = []
-    for _ in range(n_sides):
-        x = random.uniform(*xy_range)
-        y = random.uniform(*xy_range)
-        vertices.append((x, y))
+    grid_size = math.ceil(math.sqrt(n_holes))
+    cell_size = 0.7 * radius / grid_size
+    rows, columns = np.divmod(np.arange(n_holes), grid_size)
+    hole_centers = centers[:, None] - 0.35 * radius + (np.column_stack((columns, rows)) + 0.5) * cell_size
+    holes = generate_star_polygons(n_polygons * n_holes, hole_sides, rng, hole_centers.reshape(-1, 2), 0.45 * cell_size)
 
-    centroid_x = sum(x for x, _ in vertices) / n_sides
-    centroid_y = sum(y for _, y in vertices) / n_sides
-    vertices.sort(key=lambda point: math.atan2(point[1] - centroid_y, point[0] - centroid_x))
+    return outlines, holes.reshape(n_polygons, n_holes, hole_sides, 2)
 
-    return vertices
+def place_on_grid(polygons, xy_range=(0, 100)):
+    # Moves polygon i of the leading axis to its own cell of a square grid, so that the polygons do not overlap
+    grid_size = math.ceil(math.sqrt(len(polygons)))
+    rows, columns = np.divmod(np.arange(len(polygons)), grid_size)
+    offsets = np.column_stack((columns, rows)) * 1.1 * (xy_range[1] - xy_range[0])
+    return polygons + offsets.reshape((len(polygons),) + (1,) * (polygons.ndim - 2) + (2,))
 
-def write_vertices_to_file(vertices, filename):
-    with open(os.path.join("./tests", filename) , 'w') as f:
-        for x, y in vertices[:-1]:
-            f.write(f"{x:.6f} {y:.6f}\n")
-        f.write(f"{vertices[-1][0]:.6f} {vertices[-1][1]:.6f}")
+def write_vertices_to_file(polygons, filename):
+    # One "x y" line per vertex, polygons separated by an empty line, formatted in a single operation
+    sizes = [len(polygon) for polygon in polygons]
+    line_formats = ["%.6f %.6f\n" * size for size in sizes]
+    text = "\n".join(line_formats) % tuple(np.concatenate(polygons).ravel().tolist())
+    with open(os.path.join("./tests", filename), 'w') as f:
+        f.write(text[:-1])
+
+def write_vertices_to_binary_file(polygons, filename):
+    # Binary polygon file: header (magic, version, reserved, polygon count, vertex count), offset table, float64 coordinates
+    offsets = np.zeros(len(polygons) + 1, dtype="<u8")
+    np.cumsum([len(polygon) for polygon in polygons], out=offsets[1:])
+    header = np.array([(b"POLYGONS", 1, 0, len(polygons), offsets[-1])], dtype=BINARY_HEADER)
+    with open(os.path.join("./tests", filename), 'wb') as f:
+        f.write(header.tobytes())
+        f.write(offsets.tobytes())
+        f.write(np.concatenate(polygons).astype("<f8").tobytes())
+
+def write_polygons(polygons, filename):
+    if filename.endswith(".bin"):
+        write_vertices_to_binary_file(polygons, filename)
+    else:
+        write_vertices_to_file(polygons, filename)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate random polygons, as text or binary (.bin) polygon files in tests/.")
+    parser.add_argument("sides", type=int, help="Number of vertices of each polygon (of each outline with --holes)")
+    parser.add_argument("filename", nargs="?", default="new.txt", help="Output file, binary if it ends in .bin (default: new.txt)")
+    parser.add_argument("-n", "--polygons", type=int, default=1, help="Number of polygons, laid out on a grid without overlapping")
+    parser.add_argument("--holes", type=int, default=0, help="Number of holes in each polygon, for the triangulator of polygons with holes")
+    parser.add_argument("--hole-sides", type=int, default=8, help="Number of vertices of each hole")
+    parser.add_argument("--seed", type=int, help="Seed of the random generator, for reproducible files")
+    parser.add_argument("--separate", action="store_true", help="Write each polygon (with its holes) to its own numbered file")
+    args = parser.parse_args()
+
+    if args.sides < 3 or args.hole_sides < 3: parser.error("polygons need at least 3 vertices")
+
     os.makedirs("tests", exist_ok=True)
-    n = int(input("Enter number of sides: "))
-    filename = sys.argv[1] if len(sys.argv) > 1 else "new.txt"
-    polygon_vertices = generate_random_polygon(n)
-    write_vertices_to_file(polygon_vertices, filename)
-    print(f"Generated {n} vertices and wrote them to tests/{filename}")
+    rng = np.random.default_rng(args.seed)
+
+    if args.holes:
+        outlines, holes = generate_polygons_with_holes(args.polygons, args.sides, args.holes, args.hole_sides, rng)
+        outlines, holes = place_on_grid(outlines), place_on_grid(holes)
+        groups = [[outline, *polygon_holes] for outline, polygon_holes in zip(outlines, holes)]
+    else:
+        groups = [[polygon] for polygon in place_on_grid(generate_random_polygons(args.polygons, args.sides, rng))]
+
+    if args.separate:
+        stem, extension = os.path.splitext(args.filename)
+        for i, group in enumerate(groups):
+            write_polygons(group, f"{stem}_{i:0{len(str(len(groups) - 1))}d}{extension}")
+    else:
+        write_polygons([polygon for group in groups for polygon in group], args.filename)
+
+    n_vertices = sum(len(polygon) for group in groups for polygon in group)
+    destination = f"{len(groups)} files tests/{stem}_*{extension}" if args.separate else f"tests/{args.filename}"
+    print(f"Generated {n_vertices} vertices in {len(groups)} polygons and wrote them to {destination}")
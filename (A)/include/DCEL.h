@@ -1,5 +1,8 @@
 #pragma once
 
+#include <algorithm>
+#include <array>
+#include <cmath>
 #include <set>
 #include <utility>
 #include <vector>
@@ -117,6 +120,9 @@ class DCEL {
 
     std::set<Edge> binary_search_tree;
 
+    // Whether the vertices were stored in the reverse of the order they were given in
+    bool reversed = false;
+
     explicit DCEL(std::vector<Vertex>& vertices);
     DCEL(std::vector<Vertex>& vertices, const std::vector<std::pair<int, int>>& edge_list);
 
@@ -127,3 +133,4 @@ class DCEL {
 
 DCEL split_monotone(DCEL &dcel);
 DCEL triangulate(DCEL& dcel);
+std::vector<std::array<int, 3>> get_triangles(const DCEL& dcel);
@@ -0,0 +1,22 @@
+#pragma once
+
+#if defined(_WIN32)
+#define TRIANGULATION_API extern "C" __declspec(dllexport)
+#else
+#define TRIANGULATION_API extern "C" __attribute__((visibility("default")))
+#endif
+
+// C interface of the triangulator, loaded by the Python bindings (triangulation.py).
+//
+// A polygon is given as n_vertices (x, y) float64 pairs, in either orientation, and the results refer to its
+// vertices by their index in this array. Each function returns the number of rows written, or -1 if the polygon
+// could not be processed, in which case triangulation_last_error describes why.
+
+// Writes the diagonals splitting the polygon into y-monotone pieces, as pairs of vertex indices (at most n - 3).
+TRIANGULATION_API int triangulation_split_monotone(const double* coordinates, int n_vertices, int* diagonals);
+
+// Writes the triangles of the polygon, as counter-clockwise triples of vertex indices (n - 2).
+TRIANGULATION_API int triangulation_triangulate(const double* coordinates, int n_vertices, int* triangles);
+
+// Describes the last error of the calling thread.
+TRIANGULATION_API const char* triangulation_last_error();
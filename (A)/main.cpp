@@ -1,61 +1,257 @@
 #include "DCEL.h"
 
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <iomanip>
+#include <sstream>
 #include <iostream>
 #include <fstream>
+#include <stdexcept>
+#include <string>
 
-int main(int argc, char* argv[]) {
-    if (argc != 3) {
-        std::cerr << "Usage: " << argv[0] << " <input_file> <output_folder>" << std::endl;
-        return 1;
-    }
+#ifdef _WIN32
+#include <fcntl.h>
+#include <io.h>
+#define popen _popen
+#define pclose _pclose
+#define PIPE_WRITE_MODE "wb"
+#else
+#define PIPE_WRITE_MODE "w"
+#endif
 
-    std::ifstream input(argv[1]);
-    std::string output_folder(argv[2]);
+// Reads the first polygon of a binary polygon file: a header (magic bytes "POLYGONS", uint32 version, uint32 reserved,
+// uint64 polygon count, uint64 vertex count), n_polygons + 1 uint64 vertex offsets, then float64 x y pairs (little-endian).
+bool read_binary_polygon(std::ifstream& input, std::vector<Vertex>& vertices) {
+    char magic[8];
+    uint32_t version, reserved;
+    uint64_t n_polygons, n_vertices;
 
-    if (!input.is_open()) {
-        std::cerr << "Error opening file: " << argv[1] << std::endl;
-        return 1;
-    }
+    input.read(magic, sizeof(magic));
+    if (!input || std::memcmp(magic, "POLYGONS", sizeof(magic)) != 0) return false;
 
-    std::ofstream original_vertices("./__vertices__.txt");
-    std::ofstream monotone_edges("./__monotone_edges__.txt");
-    std::ofstream triangulated_edges("./__triangulated_edges__.txt");
+    input.read(reinterpret_cast<char*>(&version), sizeof(version));
+    input.read(reinterpret_cast<char*>(&reserved), sizeof(reserved));
+    input.read(reinterpret_cast<char*>(&n_polygons), sizeof(n_polygons));
+    input.read(reinterpret_cast<char*>(&n_vertices), sizeof(n_vertices));
+    if (!input || version != 1 || n_polygons == 0) return false;
 
-    std::vector<Vertex> vertices;
+    std::vector<uint64_t> offsets(n_polygons + 1);
+    input.read(reinterpret_cast<char*>(offsets.data()), static_cast<std::streamsize>(offsets.size() * sizeof(uint64_t)));
 
-    while (!input.eof()) {
+    std::vector<double> coordinates(2 * (offsets[1] - offsets[0]));
+    input.seekg(static_cast<std::streamoff>(2 * offsets[0] * sizeof(double)), std::ios::cur);
+    input.read(reinterpret_cast<char*>(coordinates.data()), static_cast<std::streamsize>(coordinates.size() * sizeof(double)));
+    if (!input) return false;
+
+    for (size_t i = 0; i < coordinates.size(); i += 2) vertices.emplace_back(coordinates[i], coordinates[i + 1]);
+    return true;
+}
+
+// Reads a text polygon file, one "x y" vertex per line. Blank lines are only allowed around the polygon, since a blank
+// line between vertices starts another polygon, which this triangulator cannot process.
+void read_text_polygon(std::istream& input, std::vector<Vertex>& vertices) {
+    std::string line;
+    bool blank_line_after_vertices = false;
+
+    for (int line_number = 1; std::getline(input, line); line_number++) {
+        if (line.find_first_not_of(" \t\r") == std::string::npos) {
+            blank_line_after_vertices = !vertices.empty();
+            continue;
+        }
+
+        if (blank_line_after_vertices) {
+            throw std::runtime_error("Line " + std::to_string(line_number) + " starts a second polygon, but only a single polygon can be triangulated");
+        }
+
+        std::istringstream fields(line);
         long double x, y;
-        input >> x >> y;
+        std::string rest;
+        if (!(fields >> x >> y) || fields >> rest) throw std::runtime_error("Line " + std::to_string(line_number) + " does not hold two numbers: " + line);
+
         vertices.emplace_back(x, y);
     }
+}
 
+// The vertices of the polygon in input order, the edges of its monotone partition and of its triangulation as pairs of
+// indices in these vertices, and its triangles as counter-clockwise triples of indices.
+struct TriangulationResult {
+    std::vector<Vertex> vertices;
+    std::vector<std::pair<int, int>> monotone_edges;
+    std::vector<std::pair<int, int>> triangulated_edges;
+    std::vector<std::array<int, 3>> triangles;
+};
+
+TriangulationResult triangulate_polygon(std::vector<Vertex>& vertices) {
+    TriangulationResult result;
+    result.vertices = vertices;
+
+    const int n = static_cast<int>(vertices.size());
     DCEL dcel(vertices);
 
-    original_vertices << dcel.vertices.size() << "\n";
-    for (const auto& it : dcel.vertices) {
-        original_vertices << it.x << " " << it.y << "\n";
-    }
+    // The DCEL reverses the vertices of some polygons, the result refers to them in input order
+    const bool reversed = dcel.reversed;
+    const auto input_index = [&](const int index) {return reversed ? n - 1 - index : index;};
 
     DCEL monotone_dcel = split_monotone(dcel);
+    for (const auto& it : monotone_dcel.edges) result.monotone_edges.emplace_back(input_index(it.v1 -> index), input_index(it.v2 -> index));
+
+    DCEL triangulate_dcel = triangulate(monotone_dcel);
+    for (const auto& it : triangulate_dcel.edges) result.triangulated_edges.emplace_back(input_index(it.v1 -> index), input_index(it.v2 -> index));
+
+    for (const auto& it : get_triangles(triangulate_dcel)) result.triangles.push_back({input_index(it[0]), input_index(it[1]), input_index(it[2])});
+
+    return result;
+}
 
-    monotone_edges << monotone_dcel.edges.size() << "\n";
-    for (const auto& it : monotone_dcel.edges) {
-        monotone_edges << it.v1 -> index << " " << it.v2 -> index << "\n";
+void write_json_edges(std::ostream& output, const std::vector<std::pair<int, int>>& edges) {
+    output << "[";
+    for (size_t i = 0; i < edges.size(); i++) output << (i ? ", [" : "[") << edges[i].first << ", " << edges[i].second << "]";
+    output << "]";
+}
+
+// {"vertices": [[x, y], ...], "monotone_edges": [[a, b], ...], "triangulated_edges": [[a, b], ...], "triangles": [[a, b, c], ...]}
+void write_json_result(std::ostream& output, const TriangulationResult& result) {
+    output << std::setprecision(17) << "{\"vertices\": [";
+    for (size_t i = 0; i < result.vertices.size(); i++) {
+        output << (i ? ", [" : "[") << static_cast<double>(result.vertices[i].x) << ", " << static_cast<double>(result.vertices[i].y) << "]";
     }
 
-    DCEL triangulate_dcel = triangulate(monotone_dcel);
+    output << "], \"monotone_edges\": ";
+    write_json_edges(output, result.monotone_edges);
+    output << ", \"triangulated_edges\": ";
+    write_json_edges(output, result.triangulated_edges);
+
+    output << ", \"triangles\": [";
+    for (size_t i = 0; i < result.triangles.size(); i++) {
+        const auto& it = result.triangles[i];
+        output << (i ? ", [" : "[") << it[0] << ", " << it[1] << ", " << it[2] << "]";
+    }
+    output << "]}\n";
+}
 
-    triangulated_edges << triangulate_dcel.edges.size() << "\n";
-    for (const auto& it : triangulate_dcel.edges) {
-        triangulated_edges << it.v1 -> index << " " << it.v2 -> index << "\n";
+void write_binary_edges(std::ostream& output, const std::vector<std::pair<int, int>>& edges) {
+    std::vector<int32_t> indices;
+    indices.reserve(2 * edges.size());
+    for (const auto& it : edges) {
+        indices.push_back(it.first);
+        indices.push_back(it.second);
     }
+    output.write(reinterpret_cast<const char*>(indices.data()), static_cast<std::streamsize>(indices.size() * sizeof(int32_t)));
+}
+
+// Binary result: a header (magic bytes "TRIANGLE", uint32 version, uint32 reserved, uint64 vertex, monotone edge,
+// triangulated edge and triangle counts), the float64 x y pairs of the vertices, the int32 index pairs of the monotone
+// edges and of the triangulated edges, then the int32 index triples of the triangles (little-endian).
+void write_binary_result(std::ostream& output, const TriangulationResult& result) {
+    const uint32_t version = 2, reserved = 0;
+    const uint64_t counts[4] = {result.vertices.size(), result.monotone_edges.size(), result.triangulated_edges.size(), result.triangles.size()};
 
-    original_vertices.close();
-    monotone_edges.close();
-    triangulated_edges.close();
+    output.write("TRIANGLE", 8);
+    output.write(reinterpret_cast<const char*>(&version), sizeof(version));
+    output.write(reinterpret_cast<const char*>(&reserved), sizeof(reserved));
+    output.write(reinterpret_cast<const char*>(counts), sizeof(counts));
 
-    system(std::string("python3 plot.py " + output_folder).c_str());
-    system("rm __vertices__.txt");
-    system("rm __monotone_edges__.txt");
-    system("rm __triangulated_edges__.txt");
-}
\ No newline at end of file
+    std::vector<double> coordinates;
+    coordinates.reserve(2 * result.vertices.size());
+    for (const auto& it : result.vertices) {
+        coordinates.push_back(static_cast<double>(it.x));
+        coordinates.push_back(static_cast<double>(it.y));
+    }
+    output.write(reinterpret_cast<const char*>(coordinates.data()), static_cast<std::streamsize>(coordinates.size() * sizeof(double)));
+
+    write_binary_edges(output, result.monotone_edges);
+    write_binary_edges(output, result.triangulated_edges);
+
+    std::vector<int32_t> indices;
+    indices.reserve(3 * result.triangles.size());
+    for (const auto& it : result.triangles) indices.insert(indices.end(), it.begin(), it.end());
+    output.write(reinterpret_cast<const char*>(indices.data()), static_cast<std::streamsize>(indices.size() * sizeof(int32_t)));
+}
+
+bool ends_with(const std::string& text, const std::string& suffix) {
+    return text.size() >= suffix.size() && text.compare(text.size() - suffix.size(), suffix.size(), suffix) == 0;
+}
+
+int usage(const char* program) {
+    std::cerr << "Usage: " << program << " <input_file> <output_folder>" << std::endl;
+    std::cerr << "       " << program << " --no-plot [--json | --binary] <input_file> [<output_file> | -]" << std::endl;
+    return 1;
+}
+
+int main(int argc, char* argv[]) {
+    bool plot = true, binary = false, format_given = false;
+    std::vector<std::string> arguments;
+
+    for (int i = 1; i < argc; i++) {
+        const std::string argument(argv[i]);
+        if (argument == "--no-plot") plot = false;
+        else if (argument == "--json" || argument == "--binary") {
+            binary = argument == "--binary";
+            format_given = true;
+        }
+        else arguments.push_back(argument);
+    }
+
+    if (plot ? arguments.size() != 2 || format_given : arguments.empty() || arguments.size() > 2) return usage(argv[0]);
+
+    std::ifstream input(arguments[0], std::ios::binary);
+
+    if (!input.is_open()) {
+        std::cerr << "Error opening file: " << arguments[0] << std::endl;
+        return 1;
+    }
+
+    try {
+        std::vector<Vertex> vertices;
+
+        if (!read_binary_polygon(input, vertices)) {
+            vertices.clear();
+            input.clear();
+            input.seekg(0);
+            read_text_polygon(input, vertices);
+        }
+
+        const TriangulationResult result = triangulate_polygon(vertices);
+
+        if (plot) {
+            // plot.py reads the binary result from its standard input
+            FILE* pipe = popen(("python3 plot.py " + arguments[1]).c_str(), PIPE_WRITE_MODE);
+            if (!pipe) {
+                std::cerr << "Error running plot.py" << std::endl;
+                return 1;
+            }
+
+            std::ostringstream output;
+            write_binary_result(output, result);
+            const std::string bytes = output.str();
+            fwrite(bytes.data(), 1, bytes.size(), pipe);
+
+            return pclose(pipe) == 0 ? 0 : 1;
+        }
+
+        const std::string output_path = arguments.size() == 2 ? arguments[1] : "-";
+        if (!format_given) binary = ends_with(output_path, ".bin");
+
+        if (output_path == "-") {
+#ifdef _WIN32
+            if (binary) _setmode(_fileno(stdout), _O_BINARY);
+#endif
+            std::ios::sync_with_stdio(false);
+            binary ? write_binary_result(std::cout, result) : write_json_result(std::cout, result);
+            return std::cout.flush() ? 0 : 1;
+        }
+
+        std::ofstream output(output_path, binary ? std::ios::binary : std::ios::out);
+        if (!output.is_open()) {
+            std::cerr << "Error opening file: " << output_path << std::endl;
+            return 1;
+        }
+
+        binary ? write_binary_result(output, result) : write_json_result(output, result);
+        return output ? 0 : 1;
+    } catch (const std::exception& e) {
+        std::cerr << e.what() << '\n';
+        return 1;
+    }
+}
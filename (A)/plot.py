@@ -1,90 +1,85 @@
+import json
+import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 import os
-import random
+import struct
 import sys
+from matplotlib.collections import LineCollection, PolyCollection
 
-output_folder = sys.argv[1]
-
-os.makedirs(output_folder, exist_ok=True)
-
-# --- Read points ---
-with open("./__vertices__.txt", "r") as f:
-    n = int(f.readline())
-    points = [list(map(float, f.readline().split())) for _ in range(n)]
-
-# --- Plot 1: Vertices (Polygon) ---
-plt.figure(figsize=(8,8))
-for i in range(n):
-    xvals = [points[i-1][0], points[i][0]]
-    yvals = [points[i-1][1], points[i][1]]
-    plt.plot(xvals, yvals, color="black")
-
-plt.title("Original Polygon")
-plt.axis("off")
-plt.savefig(os.path.join(output_folder, "vertices.png"))
-plt.close()
-
-# --- Plot 2: Monotone Edges (Black lines) ---
-plt.figure(figsize=(8,8))
-with open("./__monotone_edges__.txt", "r") as f:
-    m = int(f.readline())
-    for _ in range(m):
-        a, b = map(int, f.readline().split())
-        xvals = [points[a][0], points[b][0]]
-        yvals = [points[a][1], points[b][1]]
-        plt.plot(xvals, yvals, color="black")
-
-plt.title("Monotone Partition (Edges)")
-plt.axis("off")
-plt.savefig(os.path.join(output_folder, "monotone_edges.png"))
-plt.close()
-
-# --- Plot 3: Triangulated with colored faces ---
-plt.figure(figsize=(8,8))
-with open("./__triangulated_edges__.txt", "r") as f:
-    m = int(f.readline())
-    edges = []
-    for _ in range(m):
-        a, b = map(int, f.readline().split())
-        edges.append((a, b))
-
-from collections import defaultdict
-
-adj = defaultdict(set)
-for a, b in edges:
-    adj[a].add(b)
-    adj[b].add(a)
-
-visited_triangles = set()
-
-def sorted_triangle(t1, t2, t3):
-    return tuple(sorted([t1,t2,t3]))
-
-for a in range(len(points)):
-    for b in adj[a]:
-        for c in adj[b]:
-            if c in adj[a] and len({a,b,c}) == 3:
-                triangle = sorted_triangle(a,b,c)
-                if triangle not in visited_triangles:
-                    visited_triangles.add(triangle)
-                    # Random soft color
-                    color = (random.uniform(0.5, 1.0), random.uniform(0.5, 1.0), random.uniform(0.5, 1.0))
-                    xvals = [points[triangle[0]][0], points[triangle[1]][0], points[triangle[2]][0]]
-                    yvals = [points[triangle[0]][1], points[triangle[1]][1], points[triangle[2]][1]]
-                    plt.fill(xvals, yvals, color=color, alpha=0.6)
-
-# Plot black edges again
-for (a, b) in edges:
-    xvals = [points[a][0], points[b][0]]
-    yvals = [points[a][1], points[b][1]]
-    plt.plot(
-        xvals, yvals,
-        color="black",    # or color="#333333" for softer gray
-        linewidth=0.5,    # thinner line
-        alpha=0.5         # half-transparent
-    )
-
-plt.title("Triangulated Polygon")
-plt.axis("off")
-plt.savefig(os.path.join(output_folder, "triangulation.png"))
-plt.close()
+RESULT_MAGIC = b"TRIANGLE"
+RESULT_VERSION = 2
+RESULT_HEADER = struct.Struct("<8sIIQQQQ")
+
+def read_result(data):
+    # Binary result of `triangulate --no-plot --binary` (the format written in main.cpp), or its JSON result, as arrays:
+    # the (n, 2) vertices, the (m, 2) monotone edges, the (k, 2) triangulated edges and the (n - 2, 3) triangles
+    if not data.startswith(RESULT_MAGIC):
+        result = json.loads(data)
+        return (np.array(result["vertices"], dtype=np.float64).reshape(-1, 2),
+                np.array(result["monotone_edges"], dtype=np.int32).reshape(-1, 2),
+                np.array(result["triangulated_edges"], dtype=np.int32).reshape(-1, 2),
+                np.array(result["triangles"], dtype=np.int32).reshape(-1, 3))
+
+    _, version, _, *counts = RESULT_HEADER.unpack_from(data)
+    if version != RESULT_VERSION: raise ValueError(f"Unsupported result version {version}")
+
+    arrays = []
+    offset = RESULT_HEADER.size
+    for count, dtype, columns in zip(counts, ("<f8", "<i4", "<i4", "<i4"), (2, 2, 2, 3)):
+        arrays.append(np.frombuffer(data, dtype=dtype, count=columns * count, offset=offset).reshape(-1, columns))
+        offset += arrays[-1].nbytes
+
+    return tuple(arrays)
+
+def save_figure(axes, title, path):
+    axes.autoscale_view()
+    axes.set_title(title)
+    axes.axis("off")
+    axes.figure.savefig(path)
+    plt.close(axes.figure)
+
+def plot_polygon(points, path):
+    axes = plt.figure(figsize=(8,8)).add_subplot()
+    closed = np.concatenate((points, points[:1]))
+    axes.plot(closed[:, 0], closed[:, 1], color="black")
+    save_figure(axes, "Original Polygon", path)
+
+def plot_monotone_edges(points, monotone_edges, path):
+    axes = plt.figure(figsize=(8,8)).add_subplot()
+    axes.add_collection(LineCollection(points[monotone_edges], colors="black"))
+    save_figure(axes, "Monotone Partition (Edges)", path)
+
+def plot_triangulation(points, edges, triangles, path, rng=None):
+    # All the triangles in one collection, with random soft colors, then all the edges in one collection
+    rng = rng or np.random.default_rng()
+    axes = plt.figure(figsize=(8,8)).add_subplot()
+    colors = rng.uniform(0.5, 1.0, size=(len(triangles), 3))
+    axes.add_collection(PolyCollection(points[triangles], facecolors=colors, edgecolors="none", alpha=0.6))
+    axes.add_collection(LineCollection(points[edges], colors="black", linewidths=0.5, alpha=0.5))
+    save_figure(axes, "Triangulated Polygon", path)
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        sys.exit("Usage: python3 plot.py <output_folder> [<result_file>], the result being read from the standard input by default")
+
+    matplotlib.use("Agg")
+    output_folder = sys.argv[1]
+
+    os.makedirs(output_folder, exist_ok=True)
+
+    # --- Read the triangulation ---
+    if len(sys.argv) == 3:
+        with open(sys.argv[2], "rb") as f:
+            points, monotone_edges, edges, triangles = read_result(f.read())
+    else:
+        points, monotone_edges, edges, triangles = read_result(sys.stdin.buffer.read())
+
+    # --- Plot 1: Vertices (Polygon) ---
+    plot_polygon(points, os.path.join(output_folder, "vertices.png"))
+
+    # --- Plot 2: Monotone Edges (Black lines) ---
+    plot_monotone_edges(points, monotone_edges, os.path.join(output_folder, "monotone_edges.png"))
+
+    # --- Plot 3: Triangulated with colored faces ---
+    plot_triangulation(points, edges, triangles, os.path.join(output_folder, "triangulation.png"))
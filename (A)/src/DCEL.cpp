@@ -1,5 +1,7 @@
 #include "DCEL.h"
 
+#include <stdexcept>
+
 DCEL::DCEL(std::vector<Vertex>& vertices) {
     const int n = static_cast<int>(vertices.size());
 
@@ -9,7 +11,10 @@ DCEL::DCEL(std::vector<Vertex>& vertices) {
     const auto mx_next = mx == vertices.end() - 1 ? vertices.begin() : mx + 1;
 
     mx -> set_type(*mx_prev, *mx_next);
-    if (mx -> type == Vertex::SPLIT) reverse(vertices.begin(), vertices.end());
+    if (mx -> type == Vertex::SPLIT) {
+        std::reverse(vertices.begin(), vertices.end());
+        reversed = true;
+    }
 
     // Set up vertices and their types
     this -> vertices = std::move(vertices);
@@ -117,6 +122,7 @@ DCEL::DCEL(std::vector<Vertex>& vertices, const std::vector<std::pair<int, int>>
         const HalfEdge* curr = head -> next;
 
         while (curr != head) {
+            if (!curr) throw std::runtime_error("The edges do not form a planar subdivision");
             done[curr->index] = true;
             curr = curr->next;
         }
@@ -138,5 +144,7 @@ void DCEL::remove_search_edge(const int index) {
 }
 
 int DCEL::find_previous_index(const Vertex& v) const {
-    return (--binary_search_tree.lower_bound(Edge(-1, const_cast<Vertex*>(&v), const_cast<Vertex*>(&v), nullptr))) -> index;
+    const auto next = binary_search_tree.lower_bound(Edge(-1, const_cast<Vertex*>(&v), const_cast<Vertex*>(&v), nullptr));
+    if (next == binary_search_tree.begin()) throw std::runtime_error("No edge found to the left of a vertex");
+    return std::prev(next) -> index;
 }
\ No newline at end of file
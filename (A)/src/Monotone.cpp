@@ -69,8 +69,11 @@ DCEL split_monotone(DCEL &dcel) {
 
     VertexHandling::n = sz;
     VertexHandling::dcel = &dcel;
-    VertexHandling::helper = new std::vector<int>(sz, -1);
-    VertexHandling::diagonals = new std::vector<std::pair<int, int>>();
+    std::vector<int> helper(sz, -1);
+    std::vector<std::pair<int, int>> diagonals;
+
+    VertexHandling::helper = &helper;
+    VertexHandling::diagonals = &diagonals;
 
     std::priority_queue<Vertex> event_points;
     for (int i = 0; i < sz; i++) event_points.emplace(dcel.vertices[i]);
@@ -82,10 +85,10 @@ DCEL split_monotone(DCEL &dcel) {
     }
 
     std::vector<std::pair<int, int>> edges;
-    edges.reserve(sz + VertexHandling::diagonals -> size());
+    edges.reserve(sz + diagonals.size());
 
     for (int i = 0; i < sz; i++) edges.emplace_back(i, (i + 1) % sz);
-    for (std::pair<int, int> p : *VertexHandling::diagonals) edges.emplace_back(p);
+    for (std::pair<int, int> p : diagonals) edges.emplace_back(p);
 
     return {dcel.vertices, edges};
 }
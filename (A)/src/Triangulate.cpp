@@ -78,5 +78,27 @@ DCEL triangulate(DCEL &dcel) {
     for (const auto& it : dcel.edges) new_edges.emplace_back(it.v1 -> index, it.v2 -> index);
     for (const auto& it : diagonals) new_edges.emplace_back(it);
 
+    // The last vertex of each piece is also joined to its neighbors along the boundary: keep each edge once
+    for (auto& it : new_edges) if (it.first > it.second) std::swap(it.first, it.second);
+    std::sort(new_edges.begin(), new_edges.end());
+    new_edges.erase(std::unique(new_edges.begin(), new_edges.end()), new_edges.end());
+
     return {dcel.vertices, new_edges};
+}
+
+std::vector<std::array<int, 3>> get_triangles(const DCEL& dcel) {
+    // The faces of a triangulated DCEL are its triangles, counter-clockwise, and the outer face, clockwise
+    std::vector<std::array<int, 3>> triangles;
+    triangles.reserve(dcel.vertices.size() - 2);
+
+    for (const HalfEdge* head : dcel.faces) {
+        const Vertex* a = head -> origin;
+        const Vertex* b = head -> next -> origin;
+        const Vertex* c = head -> next -> next -> origin;
+
+        if (head -> next -> next -> next != head || !Vertex::counter_clockwise(*a, *b, *c)) continue;
+        triangles.push_back({a -> index, b -> index, c -> index});
+    }
+
+    return triangles;
 }
\ No newline at end of file
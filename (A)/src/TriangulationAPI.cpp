@@ -0,0 +1,87 @@
+#include "TriangulationAPI.h"
+
+#include <exception>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+
+#include "DCEL.h"
+
+namespace {
+    // split_monotone keeps the state of its sweep in globals, so the calls are serialized
+    std::mutex triangulation_mutex;
+    thread_local std::string last_error;
+
+    std::vector<Vertex> read_vertices(const double* coordinates, const int n_vertices) {
+        if (n_vertices < 3) throw std::invalid_argument("A polygon needs at least 3 vertices");
+
+        std::vector<Vertex> vertices;
+        vertices.reserve(n_vertices);
+        for (int i = 0; i < n_vertices; i++) vertices.emplace_back(coordinates[2 * i], coordinates[2 * i + 1]);
+
+        return vertices;
+    }
+
+    // Index in the input array of a vertex of the DCEL, which reverses the vertices of some polygons
+    int input_index(const int index, const bool reversed, const int n_vertices) {
+        return reversed ? n_vertices - 1 - index : index;
+    }
+
+    // Runs one of the functions below, turning the exceptions into an error code and message
+    template <typename Function>
+    int run(Function function) {
+        try {
+            std::lock_guard<std::mutex> lock(triangulation_mutex);
+            return function();
+        } catch (const std::exception& error) {
+            last_error = error.what();
+            return -1;
+        }
+    }
+}
+
+int triangulation_split_monotone(const double* coordinates, const int n_vertices, int* diagonals) {
+    return run([&] {
+        std::vector<Vertex> vertices = read_vertices(coordinates, n_vertices);
+        DCEL dcel(vertices);
+        const bool reversed = dcel.reversed;
+
+        // The edges of the monotone subdivision are the edges of the polygon followed by the diagonals
+        const DCEL monotone_dcel = split_monotone(dcel);
+        const int n_diagonals = static_cast<int>(monotone_dcel.edges.size()) - n_vertices;
+        if (n_diagonals > n_vertices - 3) throw std::runtime_error("Too many diagonals: the polygon is probably not simple");
+
+        for (int i = 0; i < n_diagonals; i++) {
+            const Edge& edge = monotone_dcel.edges[n_vertices + i];
+            diagonals[2 * i] = input_index(edge.v1 -> index, reversed, n_vertices);
+            diagonals[2 * i + 1] = input_index(edge.v2 -> index, reversed, n_vertices);
+        }
+
+        return n_diagonals;
+    });
+}
+
+int triangulation_triangulate(const double* coordinates, const int n_vertices, int* triangles) {
+    return run([&] {
+        std::vector<Vertex> vertices = read_vertices(coordinates, n_vertices);
+        DCEL dcel(vertices);
+        const bool reversed = dcel.reversed;
+
+        DCEL monotone_dcel = split_monotone(dcel);
+        const DCEL triangulated_dcel = triangulate(monotone_dcel);
+
+        const std::vector<std::array<int, 3>> faces = get_triangles(triangulated_dcel);
+        const int n_triangles = static_cast<int>(faces.size());
+        if (n_triangles != n_vertices - 2) throw std::runtime_error("Wrong number of triangles: the polygon is probably not simple");
+
+        for (int i = 0; i < n_triangles; i++) {
+            for (int j = 0; j < 3; j++) triangles[3 * i + j] = input_index(faces[i][j], reversed, n_vertices);
+        }
+
+        return n_triangles;
+    });
+}
+
+const char* triangulation_last_error() {
+    return last_error.c_str();
+}
@@ -0,0 +1,73 @@
+import glob
+import os
+import shutil
+import subprocess
+
+import numpy as np
+import pytest
+
+import triangulation
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# A square without two vertices at the same height, which the monotone partition does not always handle
+SQUARE = np.array([[0.0, 0.0], [3.0, 1.0], [2.0, 4.0], [-1.0, 3.0]])
+POLYGON = np.array([[0.0, 0.0], [6.0, 0.2], [6.3, 4.0], [1.0, 4.5], [4.0, 2.0], [0.5, 3.2]])
+
+
+@pytest.fixture(scope="module", autouse=True)
+def library(tmp_path_factory):
+    # Use the library built with CMake if there is one, else compile it from the sources like CMakeLists.txt does
+    try:
+        return triangulation.load_library()
+    except OSError:
+        pass
+
+    compiler = shutil.which(os.environ.get("CXX", "c++"))
+    if compiler is None: pytest.skip(f"{triangulation.LIBRARY_NAME} is not built and no C++ compiler was found")
+
+    path = str(tmp_path_factory.mktemp("build") / triangulation.LIBRARY_NAME)
+    sources = sorted(glob.glob(os.path.join(DIRECTORY, "src", "*.cpp")))
+    subprocess.run([compiler, "-std=c++14", "-O2", "-shared", "-fPIC", "-I", os.path.join(DIRECTORY, "include"), *sources, "-o", path], check=True)
+
+    return triangulation.load_library(path)
+
+
+def signed_areas(vertices, triangles):
+    a, b, c = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+    return ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])) / 2
+
+
+def polygon_area(vertices):
+    x, y = vertices[:, 0], vertices[:, 1]
+    return abs(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2
+
+
+@pytest.mark.parametrize("vertices", [SQUARE, SQUARE[::-1], POLYGON, POLYGON[::-1]], ids=["square", "reversed square", "polygon", "reversed polygon"])
+def test_triangulate_returns_counter_clockwise_triangles_in_input_order(vertices):
+    triangles = triangulation.triangulate(vertices)
+
+    assert triangles.dtype == np.int32 and triangles.shape == (len(vertices) - 2, 3)
+    assert sorted(set(triangles.ravel().tolist())) == list(range(len(vertices)))
+
+    # The indices refer to the given rows: the triangles are counter-clockwise there and cover the polygon
+    areas = signed_areas(vertices, triangles)
+    assert np.all(areas > 0)
+    assert areas.sum() == pytest.approx(polygon_area(vertices))
+
+
+def test_split_monotone_returns_diagonals_in_input_order():
+    # The merge vertex 4, whose two neighbours lie above it, is joined to vertex 1 below it
+    assert triangulation.split_monotone(POLYGON).tolist() == [[4, 1]]
+    assert triangulation.split_monotone(POLYGON[::-1]).tolist() == [[1, 4]]
+    assert triangulation.split_monotone(SQUARE).shape == (0, 2)
+
+
+@pytest.mark.parametrize("vertices, message", [
+    (np.array([[0.0, 0.0], [1.0, 0.5]]), "at least 3 vertices"),
+    (np.array([[0.0, 0.0], [2.0, 2.1], [2.2, 0.1], [0.1, 2.3]]), "not simple"),
+])
+def test_invalid_polygons_raise_value_error(vertices, message):
+    for function in (triangulation.triangulate, triangulation.split_monotone):
+        with pytest.raises(ValueError, match=message):
+            function(vertices)
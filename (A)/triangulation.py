@@ -0,0 +1,56 @@
+import ctypes
+import os
+import sys
+
+import numpy as np
+
+LIBRARY_NAMES = {"win32": "triangulation.dll", "darwin": "libtriangulation.dylib"}
+LIBRARY_NAME = LIBRARY_NAMES.get(sys.platform, "libtriangulation.so")
+
+_library = None
+
+def load_library(path=None):
+    # The library is looked up in $TRIANGULATION_LIBRARY, next to this script, then in the build directory
+    global _library
+    directory = os.path.dirname(os.path.abspath(__file__))
+    candidates = [path, os.environ.get("TRIANGULATION_LIBRARY"), os.path.join(directory, LIBRARY_NAME), os.path.join(directory, "build", LIBRARY_NAME)]
+
+    for candidate in filter(None, candidates):
+        if os.path.exists(candidate):
+            break
+    else:
+        raise OSError(f"{LIBRARY_NAME} not found, build it with CMake (see README.md) or set TRIANGULATION_LIBRARY")
+
+    library = ctypes.CDLL(candidate)
+    for function in (library.triangulation_split_monotone, library.triangulation_triangulate):
+        function.argtypes = [np.ctypeslib.ndpointer(np.float64, flags="C_CONTIGUOUS"), ctypes.c_int, np.ctypeslib.ndpointer(np.int32, flags="C_CONTIGUOUS")]
+        function.restype = ctypes.c_int
+    library.triangulation_last_error.restype = ctypes.c_char_p
+
+    _library = library
+    return library
+
+def _call(function_name, vertices, columns, capacity):
+    library = _library or load_library()
+    vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    if vertices.ndim != 2 or vertices.shape[1] != 2: raise ValueError("vertices must be an (n, 2) array")
+
+    result = np.empty((max(capacity(len(vertices)), 0), columns), dtype=np.int32)
+    count = getattr(library, function_name)(vertices, len(vertices), result)
+    if count < 0: raise ValueError(library.triangulation_last_error().decode())
+
+    return result[:count]
+
+def split_monotone(vertices):
+    """
+    Splits a simple polygon, given as an (n, 2) array of vertices in either orientation, into y-monotone pieces.
+    Returns the diagonals added, as a (k, 2) int32 array of vertex indices.
+    """
+    return _call("triangulation_split_monotone", vertices, 2, lambda n: n - 3)
+
+def triangulate(vertices):
+    """
+    Triangulates a simple polygon, given as an (n, 2) array of vertices in either orientation.
+    Returns the triangles, as an (n - 2, 3) int32 array of counter-clockwise vertex indices.
+    """
+    return _call("triangulation_triangulate", vertices, 3, lambda n: n - 2)
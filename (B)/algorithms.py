@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+from array import array
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, cast
 from random import shuffle
 
+import numpy as np
+
 from vertex import *
 from triangle import *
 from node import *
 from trapezoid import *
 from monotone_mountain import *
-from monotone_vertex import *
+from trapezoid_store import CompactSearchStructure
 
 
 if TYPE_CHECKING:
     from polygonal_area import PolygonalArea
+    from profiling import TriangulationProfile
 
 
-def triangulate_polygonal_area(polygonal_area: PolygonalArea) -> list[Triangle]:
+def triangulate_polygonal_area(polygonal_area: PolygonalArea, compact: bool = False, as_indices: bool = False, profile: TriangulationProfile | None = None) -> list[Triangle] | np.ndarray:
     """
     Triangulates a polygonal area.
 
@@ -26,22 +31,41 @@ def triangulate_polygonal_area(polygonal_area: PolygonalArea) -> list[Triangle]:
 
     Args:
         polygonal_area (PolygonalArea): The polygonal area to be triangulated.
+        compact (bool): Whether to store the search structure and the trapezoids in integer columns (a
+            CompactSearchStructure) instead of Node and Trapezoid objects.
+        as_indices (bool): Whether to return the triangles as an index array instead of Triangle objects.
+        profile (TriangulationProfile | None): A profile receiving the time and memory spent in each stage and the
+            structural counters of the run. Nothing is measured when omitted.
 
     Returns:
-        list[Triangle]: A list of triangles resulting from the triangulation of the polygonal area.
+        list[Triangle] | np.ndarray: A list of triangles resulting from the triangulation of the polygonal area or,
+        if `as_indices` is set, an (n_triangles, 3) int32 array of counter-clockwise vertex indices into the
+        vertices of the polygonal area (see PolygonalArea.get_vertex_indices).
     """
-    trapezoids = trapezoidation(polygonal_area)
+    stage = nullcontext if profile is None else profile.stage
+
+    with stage("trapezoidation"):
+        trapezoids = trapezoidation(polygonal_area, compact, profile)
+
+    with stage("select_inside_trapezoids"):
+        inside_trapezoids = select_inside_trapezoids(trapezoids)
 
-    inside_trapezoids = select_inside_trapezoids(trapezoids)
+    with stage("make_monotone_mountains"):
+        monotone_mountains = make_monotone_mountains(inside_trapezoids, polygonal_area.get_vertex_indices())
 
-    monotone_mountains = make_monotone_mountains(inside_trapezoids)
+    with stage("make_triangles"):
+        if as_indices:
+            triangles = make_triangle_indices(monotone_mountains)
+        else:
+            triangles = make_triangles(monotone_mountains)
 
-    triangles = make_triangles(monotone_mountains)
+    if profile is not None:
+        profile.record(inside_trapezoids=len(inside_trapezoids), monotone_mountains=len(monotone_mountains), triangles=len(triangles))
 
     return triangles
 
 
-def trapezoidation(polygonal_area: PolygonalArea) -> list[Trapezoid]:
+def trapezoidation(polygonal_area: PolygonalArea, compact: bool = False, profile: TriangulationProfile | None = None) -> list[Trapezoid]:
     """
     Divides the 2D space into trapezoids according to the polygonal area.
 
@@ -50,8 +74,15 @@ def trapezoidation(polygonal_area: PolygonalArea) -> list[Trapezoid]:
     For each edge, both vertices are first inserted (if not already inserted), then the
     edge itself is inserted.
 
+    The state shared by the trapezoids (a DecompositionContext, or the TrapezoidStore in compact mode)
+    belongs to this decomposition only and is released along with the returned trapezoids.
+
     Args:
         polygonal_area (PolygonalArea): The polygonal area to use for trapezoid decomposition of the 2D space.
+        compact (bool): Whether to store the search structure and the trapezoids in integer columns (a
+            CompactSearchStructure), in which case the returned trapezoids are CompactTrapezoid handles exposing
+            the accessors of Trapezoid.
+        profile (TriangulationProfile | None): A profile receiving the counters describing the decomposition.
 
     Returns:
         list[Trapezoid]: All the trapezoids resulting from the decomposition of the 2D space.
@@ -59,14 +90,62 @@ def trapezoidation(polygonal_area: PolygonalArea) -> list[Trapezoid]:
     edges: list[Edge] = polygonal_area.get_edges()
     shuffle(edges)
 
-    search_tree = Node(trapezoid=Trapezoid())
-    already_inserted: set[Vertex] = set()
+    search_structure = build_search_structure(edges, compact)
+    trapezoids = search_structure.get_all_traps()
+
+    if profile is not None:
+        node_count, depth = search_structure.get_node_count_and_depth()
+        context = trapezoids[0].context
+        profile.record(
+            edges=len(edges),
+            dag_nodes=node_count,
+            dag_depth=depth,
+            max_query_depth=search_structure.search_stats.max_depth,
+            trapezoids=len(trapezoids),
+            trapezoids_created=context.trapezoids_created,
+            trapezoids_merged=context.trapezoids_merged,
+        )
+
+    return trapezoids
+
+
+def build_search_structure(edges: list[Edge], compact: bool = False) -> Node | CompactSearchStructure:
+    """
+    Builds the search structure of the trapezoidal decomposition by inserting the edges in the given order.
+
+    Args:
+        edges (list[Edge]): The edges to insert, already in the (randomized) insertion order.
+        compact (bool): Whether to store the search structure and the trapezoids in integer columns, in which case
+            the structure is a CompactSearchStructure instead of a tree of Node objects.
+
+    Returns:
+        Node | CompactSearchStructure: The root of the search structure, whose leaves are the trapezoids of the decomposition.
+    """
+    if compact: search_tree = CompactSearchStructure(3 * len(edges) + 1)
+    else: search_tree = Node(trapezoid=Trapezoid(context=DecompositionContext()))
+
+    insert_edges(search_tree, edges, set())
+
+    return search_tree
+
 
+def insert_edges(search_tree: Node | CompactSearchStructure, edges: list[Edge], already_inserted: set[Vertex], touched_trapezoids: list[Trapezoid] | None = None) -> None:
+    """
+    Inserts edges into an existing search structure, in the given order.
+
+    Args:
+        search_tree (Node | CompactSearchStructure): The root of the search structure to update.
+        edges (list[Edge]): The edges to insert.
+        already_inserted (set[Vertex]): The vertices already in the search structure, updated with the inserted ones.
+        touched_trapezoids (list[Trapezoid] | None): If given, extended with every trapezoid created, split or merged
+            away by the insertions, possibly several times. The other trapezoids keep their vertices and edges.
+    """
     def insert_vertex_if_necessary(vertex: Vertex) -> bool:
         if vertex in already_inserted:
             return False
 
-        search_tree.insert_vertex(vertex)
+        split_trapezoids = search_tree.insert_vertex(vertex)
+        if touched_trapezoids is not None: touched_trapezoids.extend(split_trapezoids)
         already_inserted.add(vertex)
         return True
 
@@ -74,9 +153,9 @@ def trapezoidation(polygonal_area: PolygonalArea) -> list[Trapezoid]:
         top_just_inserted = insert_vertex_if_necessary(edge.top_vertex)
         bottom_just_inserted = insert_vertex_if_necessary(edge.bottom_vertex)
 
-        search_tree.insert_edge(edge, top_just_inserted, bottom_just_inserted)
-
-    return search_tree.get_all_traps()
+        split_trapezoid_couples = search_tree.insert_edge(edge, top_just_inserted, bottom_just_inserted)
+        if touched_trapezoids is not None:
+            for trap_couple in split_trapezoid_couples: touched_trapezoids.extend(trap_couple)
 
 
 def select_inside_trapezoids(all_trapezoids: list[Trapezoid]) -> list[Trapezoid]:
@@ -86,107 +165,118 @@ def select_inside_trapezoids(all_trapezoids: list[Trapezoid]) -> list[Trapezoid]
     return [trap for trap in all_trapezoids if trap.is_inside()]
 
 
-def make_monotone_mountains(
-    trapezoids: list[Trapezoid],
-) -> list[MonotoneMountain]:
+def make_monotone_mountains(trapezoids: list[Trapezoid], vertex_indices: dict[Vertex, int]) -> MonotoneMountains:
     """
     Transforms a trapezoids partition of the polygonal area into a monotone mountains partition of the same area.
+
+    The chain of each mountain is walked from the bottom vertex of its base edge, following at each vertex the link
+    of that mountain, and written right after the previous chain. Together with the single pass of
+    group_vertices_by_mountain, this takes time linear in the number of inside trapezoids.
+
+    Args:
+        trapezoids (list[Trapezoid]): The trapezoids inside the polygonal area.
+        vertex_indices (dict[Vertex, int]): The index of each vertex of the polygonal area, which the chains of the
+            mountains refer to (see PolygonalArea.get_vertex_indices).
     """
-    above_vertex_by_base_edge: dict[Edge, dict[Vertex, Vertex]] = (
-        group_vertices_by_mountain(trapezoids)
-    )
+    bases, link_mountains, link_tops, previous_links, last_link_by_vertex = group_vertices_by_mountain(trapezoids, vertex_indices)
+    chain_vertices = array("i")
+    offsets = [0]
 
-    monotone_mountains: list[MonotoneMountain] = []
+    for mountain, base in enumerate(bases):
+        vertex = vertex_indices[base.bottom_vertex]
 
-    for base, above_vertex_mapping in above_vertex_by_base_edge.items():
-        below_monotone_vertex: MonotoneVertex | None = None
-        current_vertex = base.bottom_vertex
-        monotone_mountain_created = False
+        while True:
+            chain_vertices.append(vertex)
 
-        while current_vertex is not None:
-            current_monotone_vertex = MonotoneVertex(
-                vertex=current_vertex, below=below_monotone_vertex
-            )
-            if below_monotone_vertex:
-                below_monotone_vertex.above = current_monotone_vertex
+            link = last_link_by_vertex[vertex]
+            while link != -1 and link_mountains[link] != mountain: link = previous_links[link]
+            if link == -1: break
 
-            above_vertex = above_vertex_mapping.get(current_vertex, None)
-            current_vertex = above_vertex
-            below_monotone_vertex = current_monotone_vertex
+            vertex = link_tops[link]
 
-            if not monotone_mountain_created:
-                monotone_mountains.append(
-                    MonotoneMountain(current_monotone_vertex, base)
-                )
-                monotone_mountain_created = True
+        offsets.append(len(chain_vertices))
 
-    return monotone_mountains
+    return MonotoneMountains(list(vertex_indices), bases, chain_vertices, np.array(offsets, dtype=np.int64))
 
 
-def group_vertices_by_mountain(
-    trapezoids: list[Trapezoid],
-) -> dict[Edge, dict[Vertex, Vertex]]:
+def group_vertices_by_mountain(trapezoids: list[Trapezoid], vertex_indices: dict[Vertex, int]) -> tuple[list[Edge], array, array, array, array]:
     """
-    Performs the first part of the transformation of a trapezoids partition into
-    a monotone mountains partition.
+    Performs the first part of the transformation of a trapezoids partition into a monotone mountains partition,
+    in one pass over the trapezoids.
+
+    Each side of a trapezoid which is a mountain base links the bottom vertex of the trapezoid to its top vertex in
+    the chain of that mountain. The links leaving each vertex are chained from the last one found.
+
+    Returns:
+        tuple[list[Edge], array, array, array, array]: The base edge of each monotone mountain; for each link, its
+        mountain, the index of its top vertex and the previous link leaving the same vertex, or -1; and for each
+        vertex, the last link leaving it, or -1.
     """
-    above_vertex_by_base_edge: dict[Edge, dict[Vertex, Vertex]] = defaultdict(dict)
+    mountain_by_base: dict[Edge, int] = {}
+    link_mountains, link_tops, previous_links = array("i"), array("i"), array("i")
+    last_link_by_vertex = array("i", [-1]) * len(vertex_indices)
 
     for trap in trapezoids:
-        mountain_bases: list[Edge] = []
+        bottom_index = vertex_indices[cast(Vertex, trap.bottom_vertex)]
+        top_index = vertex_indices[cast(Vertex, trap.top_vertex)]
 
         for edge in [trap.left_edge, trap.get_right_edge()]:
             edge = cast(Edge, edge)
-            if (
-                trap.bottom_vertex != edge.bottom_vertex
-                or trap.top_vertex != edge.top_vertex
-            ):
-                mountain_bases.append(edge)
+            if trap.bottom_vertex != edge.bottom_vertex or trap.top_vertex != edge.top_vertex:
+                link_mountains.append(mountain_by_base.setdefault(edge, len(mountain_by_base)))
+                link_tops.append(top_index)
+                previous_links.append(last_link_by_vertex[bottom_index])
+                last_link_by_vertex[bottom_index] = len(link_tops) - 1
+
+    return list(mountain_by_base), link_mountains, link_tops, previous_links, last_link_by_vertex
 
-        for mountain_base in mountain_bases:
-            above_vertex_by_base_edge[mountain_base][
-                cast(Vertex, trap.bottom_vertex)
-            ] = cast(Vertex, trap.top_vertex)
 
-    return above_vertex_by_base_edge
+def make_triangles(monotone_mountains: MonotoneMountains) -> list[Triangle]:
+    """
+    Generates triangles from monotone mountains.
+    """
+    vertices = monotone_mountains.vertices
+    return [Triangle((vertices[a], vertices[b], vertices[c])) for a, b, c in make_triangle_indices(monotone_mountains).tolist()]
 
 
-def make_triangles(monotone_mountains: list[MonotoneMountain]) -> list[Triangle]:
+def make_triangle_indices(monotone_mountains: MonotoneMountains) -> np.ndarray:
     """
-    Generates triangles from a list of monotone mountains.
+    Generates the triangles of monotone mountains as an (n_triangles, 3) int32 array of counter-clockwise vertex indices.
     """
-    triangles: list[Triangle] = []
+    triangle_indices = array("i")
 
-    for monotone_mountain in monotone_mountains:
-        triangulate_monotone_mountain(monotone_mountain, triangles)
+    for index in range(len(monotone_mountains)):
+        triangulate_monotone_mountain(monotone_mountains, index, triangle_indices)
 
-    return triangles
+    return np.frombuffer(triangle_indices, dtype=np.intc).reshape(-1, 3).astype(np.int32, copy=False)
 
 
-def triangulate_monotone_mountain(mountain, triangles):
+def triangulate_monotone_mountain(mountains: MonotoneMountains, index: int, triangle_indices: array) -> None:
     """
-    Decomposes a monotone mountain into triangles, append the resulting triangles in the ⁠ triangles ⁠ list provided as argument.
+    Decomposes a monotone mountain into triangles, appending the counter-clockwise vertex indices of each resulting
+    triangle to the flat `triangle_indices` array provided as argument. The links of the chain of the mountain are
+    consumed: the cut vertices are unlinked from the `above` and `below` arrays of the mountains.
     """
-    if mountain.is_degenerated(): return
+    if mountains.is_degenerated(index): return
 
-    first_non_base_vertex = cast(MonotoneVertex, mountain.bottom_vertex.above)
+    vertices, chain, above, below = mountains.vertices, mountains.chain_vertices, mountains.above, mountains.below
+    base = mountains.bases[index]
+    bottom, top = mountains.offsets[index], mountains.offsets[index + 1] - 1
 
-    convex_order = counter_clockwise(mountain.base.top_vertex, mountain.base.bottom_vertex, first_non_base_vertex.vertex,)
+    convex_order = counter_clockwise(base.top_vertex, base.bottom_vertex, vertices[chain[bottom + 1]])
 
-    current_vertex = first_non_base_vertex
+    current = bottom + 1
 
-    while not current_vertex.is_base_vertex():
-        below = cast(MonotoneVertex, current_vertex.below)
-        above = cast(MonotoneVertex, current_vertex.above)
-        current_vertex_convex = counter_clockwise(below.vertex, current_vertex.vertex, above.vertex) == convex_order
+    while current != top:
+        below_position, above_position = below[current], above[current]
+        below_index, current_index, above_index = chain[below_position], chain[current], chain[above_position]
+        current_vertex_convex = counter_clockwise(vertices[below_index], vertices[current_index], vertices[above_index]) == convex_order
 
         if not current_vertex_convex:
-            current_vertex = above
+            current = above_position
             continue
 
-        vertices_counter_clockwise = (below.vertex, current_vertex.vertex, above.vertex) if convex_order else (below.vertex, above.vertex, current_vertex.vertex)
-
-        triangles.append(Triangle(vertices_counter_clockwise))
-        below.above = above
-        above.below = below
-        current_vertex = above if below.is_base_vertex() else below
\ No newline at end of file
+        triangle_indices.extend((below_index, current_index, above_index) if convex_order else (below_index, above_index, current_index))
+        above[below_position] = above_position
+        below[above_position] = below_position
+        current = above_position if below_position == bottom else below_position
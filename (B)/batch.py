@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import math
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence, Sized
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import numpy as np
+
+from algorithms import *
+from polygonal_area import PolygonalArea
+
+PolygonSet = Sequence[Sequence[tuple[float, float]]]
+
+CHUNKS_PER_WORKER = 4
+
+
+def triangulate_batch(
+    polygon_sets: Iterable[PolygonSet],
+    max_workers: int | None = None,
+    chunk_vertices: int = 20000,
+    executor: Executor | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    Triangulates many independent polygonal areas on a pool of worker processes.
+
+    Each polygon set is a list of polygons (the outlines and holes of one polygonal area), each polygon
+    being a sequence of (x, y) coordinates or an (n, 2) array. Consecutive small polygon sets are grouped
+    into chunks of about `chunk_vertices` vertices so that each inter-process round trip carries enough
+    work, and only a bounded number of chunks is in flight at any time.
+
+    Each chunk runs on a single worker, so an input split into few large chunks keeps most workers idle: with
+    fewer chunks than workers, adding workers brings no speedup. When the polygon sets are given as a sized
+    collection, the chunks are therefore made small enough to give each worker about CHUNKS_PER_WORKER of
+    them. For a lazy iterable, whose size is unknown, `chunk_vertices` should be chosen accordingly.
+
+    Args:
+        polygon_sets (Iterable[PolygonSet]): The polygonal areas to triangulate, consumed lazily.
+        max_workers (int | None): Number of worker processes, used to size the pool created when no executor
+            is given, to size the chunks and to bound the number of chunks in flight. Defaults to the number of
+            workers of the given executor if it tells it, as the standard executors do, else to the number of CPUs.
+        chunk_vertices (int): Minimum number of vertices sent to a worker in one task, lowered as explained above
+            when the number of polygon sets is known.
+        executor (Executor | None): An existing executor to submit the tasks to instead of a new process pool.
+
+    Yields:
+        np.ndarray: For each polygon set, in input order, an (n_triangles, 3) int32 array of indices into the
+        vertices of the set, numbered in the order of the polygons and of their vertices.
+    """
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            yield from triangulate_batch(polygon_sets, max_workers, chunk_vertices, pool)
+        return
+
+    worker_count = max_workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    max_in_flight = 2 * worker_count
+    in_flight = deque()
+
+    if isinstance(polygon_sets, Sized):
+        total_vertices = sum(len(polygon) for polygon_set in polygon_sets for polygon in polygon_set)
+        chunk_vertices = min(chunk_vertices, max(1, math.ceil(total_vertices / (CHUNKS_PER_WORKER * worker_count))))
+
+    for chunk in split_in_chunks(polygon_sets, chunk_vertices):
+        in_flight.append(executor.submit(triangulate_chunk, chunk))
+
+        if len(in_flight) >= max_in_flight:
+            yield from in_flight.popleft().result()
+
+    while in_flight:
+        yield from in_flight.popleft().result()
+
+
+def split_in_chunks(polygon_sets: Iterable[PolygonSet], chunk_vertices: int) -> Iterator[list[list[np.ndarray]]]:
+    """
+    Groups consecutive polygon sets into chunks holding at least `chunk_vertices` vertices (except the last one).
+    """
+    chunk: list[list[np.ndarray]] = []
+    vertices_in_chunk = 0
+
+    for polygon_set in polygon_sets:
+        polygons = [np.asarray(polygon, dtype=np.float64).reshape(-1, 2) for polygon in polygon_set]
+        chunk.append(polygons)
+        vertices_in_chunk += sum(len(polygon) for polygon in polygons)
+
+        if vertices_in_chunk >= chunk_vertices:
+            yield chunk
+            chunk = []
+            vertices_in_chunk = 0
+
+    if chunk:
+        yield chunk
+
+
+def triangulate_chunk(chunk: list[list[np.ndarray]]) -> list[np.ndarray]:
+    """
+    Triangulates every polygon set of a chunk. This is the task run by the worker processes.
+    """
+    return [triangulate_polygon_set(polygons) for polygons in chunk]
+
+
+def triangulate_polygon_set(polygons: list[np.ndarray]) -> np.ndarray:
+    """
+    Triangulates one polygonal area given by coordinate arrays and returns the triangles as vertex indices.
+    """
+    vertex_polygons = [[Vertex(x, y) for x, y in polygon.tolist()] for polygon in polygons]
+    return triangulate_polygonal_area(PolygonalArea(vertex_polygons), as_indices=True)
@@ -0,0 +1,719 @@
+import argparse
+import importlib.util
+import json
+import math
+import os
+import random
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from algorithms import *
+from batch import triangulate_batch
+from polygon_generators import GENERATORS, polygon_with_holes, star_polygon
+from polygon_io import BinaryPolygons, read_polygons, write_binary_polygons
+from polygonal_area import PolygonalArea
+from predicates import counting_predicates, is_above, is_right_of_edge, orientation
+from rasterizer import iter_tiles, rasterize_points, rasterize_segments, rasterize_triangles
+from trapezoidal_map import TrapezoidalMap
+
+
+def near_collinear_polygon(n_vertices: int) -> list[Vertex]:
+    """
+    Generates a thin polygon whose two long chains have all their vertices on (rounded) straight lines.
+    """
+    half = max(n_vertices // 2, 2)
+    bottom_chain = [Vertex(index / 10, 0.3 * (index / 10) + 0.1) for index in range(half)]
+    top_chain = [Vertex(index / 10 + 0.05, 0.3 * (index / 10) + 0.1 + 1 / 3) for index in reversed(range(half))]
+
+    return bottom_chain + top_chain
+
+
+def measure_trapezoidation_memory(n_vertices: int, compact: bool, seed: int = 0) -> dict:
+    """
+    Measures the time and memory spent by the trapezoidation of a random star polygon.
+
+    The peak covers the whole decomposition while the storage only counts the memory still held by the search
+    structure and the trapezoids once the decomposition is built: the Node and Trapezoid objects, or the columns
+    of the compact structure. The time is measured in a separate run, without tracing the allocations.
+    """
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in polygon.tolist()] for polygon in star_polygon(n_vertices, seed)])
+
+    random.seed(seed)
+    start = time.perf_counter()
+    trapezoidation(polygonal_area, compact)
+    elapsed = time.perf_counter() - start
+
+    random.seed(seed)
+    tracemalloc.start()
+    trapezoids = trapezoidation(polygonal_area, compact)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    storage_files = ["*trapezoid_store.py"] if compact else ["*trapezoid.py", "*node.py"]
+    storage_filters = [tracemalloc.Filter(True, storage_file) for storage_file in storage_files]
+    storage = sum(stat.size for stat in snapshot.filter_traces(storage_filters).statistics("filename"))
+
+    return {
+        "vertices": n_vertices,
+        "backend": "compact" if compact else "objects",
+        "trapezoids": len(trapezoids),
+        "seconds": elapsed,
+        "peak_bytes": peak,
+        "storage_bytes": storage,
+        "storage_bytes_per_trapezoid": storage / len(trapezoids),
+    }
+
+
+class EagerVertex:
+    """
+    Reproduction of the former Vertex, which drew its random color at construction, used as a reference.
+    """
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.color = [random.randint(100, 255) for _ in range(3)]
+
+
+def measure_allocations(make_vertex, make_point, coordinates: list[tuple[float, float]]) -> tuple[float, int]:
+    """
+    Builds the vertices of a polygon and the mid points of its edges, returns the time spent and the memory held.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    vertices = [make_vertex(x, y) for x, y in coordinates]
+    mid_points = [make_point((vertex.x + next_vertex.x) / 2, (vertex.y + next_vertex.y) / 2)
+                  for vertex, next_vertex in zip(vertices, vertices[1:] + vertices[:1])]
+
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del vertices, mid_points
+    return elapsed, held
+
+
+def bench_vertices(args: argparse.Namespace) -> None:
+    """
+    Compares the allocations of eagerly colored vertices with lazily colored vertices and bare points.
+    """
+    coordinates = [(x, y) for x, y in star_polygon(args.vertices, args.seed)[0].tolist()]
+
+    print(f"{'implementation':>26} {'seconds':>9} {'MB':>8} {'B/vertex':>9}")
+
+    for name, make_vertex, make_point in [("eager color vertices", EagerVertex, EagerVertex), ("lazy vertices + points", Vertex, Point)]:
+        elapsed, held = measure_allocations(make_vertex, make_point, coordinates)
+        print(f"{name:>26} {elapsed:>9.3f} {held / 2 ** 20:>8.2f} {held / args.vertices:>9.0f}")
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    """
+    Reports the time and memory used by both trapezoidation backends.
+    """
+    print(f"{'vertices':>10} {'backend':>8} {'trapezoids':>11} {'seconds':>8} {'peak MB':>9} {'storage MB':>11} {'B/trap':>8}")
+
+    for n_vertices in args.sizes:
+        for compact in [False, True]:
+            result = measure_trapezoidation_memory(n_vertices, compact, args.seed)
+            print(f"{result['vertices']:>10} {result['backend']:>8} {result['trapezoids']:>11} "
+                  f"{result['seconds']:>8.2f} {result['peak_bytes'] / 2 ** 20:>9.2f} {result['storage_bytes'] / 2 ** 20:>11.2f} "
+                  f"{result['storage_bytes_per_trapezoid']:>8.0f}")
+
+
+def bench_predicates(args: argparse.Namespace) -> None:
+    """
+    Reports the number of predicate evaluations per inserted edge, how often the orientation test falls back
+    to exact arithmetic, and the cost of a single evaluation.
+    """
+    print(f"{'shape':>10} {'vertices':>10} {'is_above/edge':>14} {'right_of/edge':>14} {'orient/edge':>12} {'exact %':>8}")
+
+    for shape, make_polygon in [("star", lambda n: [Vertex(x, y) for x, y in star_polygon(n, args.seed)[0].tolist()]), ("collinear", near_collinear_polygon)]:
+        for n_vertices in args.sizes:
+            polygon = make_polygon(n_vertices)
+            random.seed(args.seed)
+
+            with counting_predicates() as counters:
+                triangulate_polygonal_area(PolygonalArea([polygon]))
+
+            print(f"{shape:>10} {len(polygon):>10} {counters.is_above / len(polygon):>14.2f} "
+                  f"{counters.is_right_of_edge / len(polygon):>14.2f} {counters.orientation / len(polygon):>12.2f} "
+                  f"{100 * counters.get_exact_ratio():>8.3f}")
+
+    edge = Edge(Vertex(0.0, 0.0), Vertex(3.0, 7.0))
+    trapezoid = Trapezoid(Vertex(1.0, 5.0), Vertex(2.0, 1.0), None, None, Edge(Vertex(-4.0, 0.0), Vertex(-1.0, 6.0)), edge)
+    number = 200000
+
+    print()
+    print(f"{'predicate':>24} {'ns/call':>8}")
+    for name, statement in [("is_above", lambda: is_above(1.0, 2.0, 3.0, 4.0)),
+                            ("is_right_of_edge", lambda: is_right_of_edge(edge, 1.0, 2.0)),
+                            ("orientation (float)", lambda: orientation(0.0, 0.0, 3.0, 7.0, 1.0, 2.0)),
+                            ("orientation (exact)", lambda: orientation(0.1, 0.13, 0.2, 0.16, 0.3, 0.19)),
+                            ("is_corner_right_of_edge", lambda: trapezoid.is_corner_right_of_edge(edge, False, False))]:
+        seconds = min(timeit.repeat(statement, number=number, repeat=3))
+        print(f"{name:>24} {seconds / number * 1e9:>8.0f}")
+
+
+def bench_locate(args: argparse.Namespace) -> None:
+    """
+    Reports the throughput of the point location in a trapezoidal map, vectorized and point by point.
+    """
+    polygons = polygon_with_holes(args.vertices, args.seed)
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in polygon.tolist()] for polygon in polygons])
+    random.seed(args.seed)
+
+    start = time.perf_counter()
+    trapezoidal_map = TrapezoidalMap(polygonal_area)
+    build_time = time.perf_counter() - start
+
+    rng = np.random.default_rng(args.seed)
+    points = rng.uniform(-1000.0, 1000.0, size=(args.points, 2))
+
+    start = time.perf_counter()
+    inside, _ = trapezoidal_map.locate(points)
+    vectorized_time = time.perf_counter() - start
+
+    sample = points[:min(args.points, 10000)]
+    start = time.perf_counter()
+    for x, y in sample.tolist():
+        trapezoidal_map.locate_point(x, y)
+    single_time = time.perf_counter() - start
+
+    print(f"map of {args.vertices} vertices and {len(polygons) - 1} holes built in {build_time:.2f} s "
+          f"({len(trapezoidal_map.node_types)} nodes, {len(trapezoidal_map.trapezoid_faces)} trapezoids)")
+    print(f"{args.points} points located in {vectorized_time:.3f} s: {args.points / vectorized_time:,.0f} points/s vectorized, "
+          f"{inside.mean():.1%} inside")
+    print(f"{len(sample)} points located one by one in {single_time:.3f} s: {len(sample) / single_time:,.0f} points/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "map.bin")
+
+        start = time.perf_counter()
+        trapezoidal_map.save(path)
+        save_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded_map = TrapezoidalMap.load(path)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loaded_map.locate(points)
+        loaded_time = time.perf_counter() - start
+
+        print(f"saved to {os.path.getsize(path) / 2**20:.1f} MiB in {save_time:.3f} s, memory-mapped back in {load_time * 1000:.2f} ms, "
+              f"{args.points / loaded_time:,.0f} points/s located in the loaded map")
+        del loaded_map
+
+
+def scan_click_checks(polygons: list[list[Vertex]], polygon: list[Vertex], new_point: Vertex) -> bool:
+    """
+    Checks a click by scanning every point and every edge, as the drawer did before indexing them.
+    """
+    for other_polygon in polygons:
+        for point in other_polygon:
+            if math.isclose(new_point.x, point.x) and math.isclose(new_point.y, point.y):
+                return True
+
+    beg_new_line = polygon[-1]
+    for polygon_idx, other_polygon in enumerate(polygons):
+        end_offset = 2 if polygon_idx == len(polygons) - 1 else 0
+
+        for pt_index in range(len(other_polygon) - end_offset):
+            pt_a = other_polygon[pt_index]
+            pt_b = other_polygon[(pt_index + 1) % len(other_polygon)]
+
+            if beg_new_line in (pt_a, pt_b) or new_point in (pt_a, pt_b):
+                continue
+
+            if segment_intersect(pt_a, pt_b, beg_new_line, new_point):
+                return True
+
+    return False
+
+
+def bench_click(args: argparse.Namespace) -> None:
+    """
+    Reports the latency of the checks run by the interactive drawer on each click, against the number of vertices
+    already drawn, with the segment index and with a scan of every point and edge. Each click draws a line from
+    the center of a star-shaped outline, as when drawing a hole inside a loaded file.
+    """
+    from polygonal_area_drawer import PolygonalAreaDrawer
+
+    for n_vertices in args.sizes:
+        outline = [Vertex(x, y) for x, y in star_polygon(n_vertices, args.seed)[0].tolist()]
+        drawer = PolygonalAreaDrawer()
+        drawer.polygons = [outline]
+        drawer._build_segment_index()
+
+        start_point = Vertex(0.0, 0.0)
+        drawer.polygons.append([start_point])
+        drawer.segment_index.insert_point(start_point)
+
+        rng = random.Random(args.seed)
+        clicks = [Vertex(rng.uniform(-400.0, 400.0), rng.uniform(-400.0, 400.0)) for _ in range(args.clicks)]
+
+        def check_with_index():
+            for click in clicks:
+                drawer._is_same_as_another_point(click) or drawer._draws_intersecting_lines(drawer.polygons[-1], click)
+
+        def check_with_scan():
+            for click in clicks:
+                scan_click_checks(drawer.polygons, drawer.polygons[-1], click)
+
+        index_time = min(timeit.repeat(check_with_index, number=1, repeat=3)) / len(clicks)
+        scan_time = min(timeit.repeat(check_with_scan, number=1, repeat=3)) / len(clicks)
+        print(f"{n_vertices:>8} vertices: {index_time * 1e6:8.1f} us per click with the segment index, "
+              f"{scan_time * 1e6:10.1f} us with a full scan")
+
+
+def write_text_polygons(path: str, n_polygons: int, n_vertices: int, seed: int = 0) -> None:
+    """
+    Writes random coordinates as a text polygon file of `n_polygons` polygons of `n_vertices` vertices each.
+    """
+    rng = np.random.default_rng(seed)
+
+    with open(path, "w") as file:
+        for _ in range(n_polygons):
+            np.savetxt(file, rng.uniform(-1000.0, 1000.0, size=(n_vertices, 2)), fmt="%.6f")
+            file.write("\n")
+
+
+def read_polygons_line_by_line(path: str) -> list[list[Vertex]]:
+    """
+    Reads a text polygon file one line at a time into Vertex lists, as the drawer did before streaming it.
+    """
+    polygons = []
+    current_polygon = []
+
+    with open(path, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                if len(current_polygon) >= 3: polygons.append(current_polygon)
+                current_polygon = []
+                continue
+            x, y = map(float, line.split())
+            current_polygon.append(Vertex(x, y))
+
+    if len(current_polygon) >= 3: polygons.append(current_polygon)
+    return polygons
+
+
+def bench_read(args: argparse.Namespace) -> None:
+    """
+    Reports the parse throughput of the streaming polygon reader and its peak memory, compared with a line by line
+    reader, and the time to load the same polygons from a memory-mapped binary polygon file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "polygons.txt")
+        write_text_polygons(path, args.polygons, args.vertices, args.seed)
+        size = os.path.getsize(path) / 2**20
+
+        start = time.perf_counter()
+        vertex_count = sum(len(polygon) for polygon in read_polygons(path))
+        stream_time = time.perf_counter() - start
+
+        tracemalloc.start()
+        for _ in read_polygons(path): pass
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        read_polygons_line_by_line(path)
+        line_time = time.perf_counter() - start
+
+        binary_path = os.path.join(directory, "polygons.bin")
+        write_binary_polygons(binary_path, read_polygons(path))
+
+        start = time.perf_counter()
+        binary_polygons = BinaryPolygons.open(binary_path)
+        checksum = sum(float(polygon[:, 0].sum()) for polygon in binary_polygons)
+        binary_time = time.perf_counter() - start
+        del binary_polygons
+
+    print(f"{size:.1f} MiB, {args.polygons} polygons, {vertex_count} vertices")
+    print(f"streaming reader:   {size / stream_time:8.1f} MiB/s, peak memory {stream_peak / 2**20:.1f} MiB")
+    print(f"line by line:       {size / line_time:8.1f} MiB/s")
+    print(f"binary file:        {binary_time * 1000:8.1f} ms to map it and sum the coordinates of every polygon (checksum {checksum:.3e})")
+
+
+# Spawns a command from a small, fresh interpreter and reports its wall time and peak resident memory on the
+# standard error. The peak resident set size of a child includes the memory of the process that forked it, so
+# measuring it from a launcher keeps the memory of the benchmark itself out of the results.
+MEASURING_LAUNCHER = """
+import os, sys, time
+start = time.perf_counter()
+pid = os.posix_spawnp(sys.argv[1], sys.argv[1:], os.environ)
+_, status, usage = os.wait4(pid, 0)
+os.write(2, b"%d %r %d" % (os.waitstatus_to_exitcode(status), time.perf_counter() - start, usage.ru_maxrss))
+"""
+
+
+def run_measured(command: list[str], cwd: str | None = None, timeout: float | None = None) -> tuple[int, bytes, float, int]:
+    """
+    Runs a command and measures its wall time and the peak resident memory of its process.
+
+    The peak memory includes a baseline of a few MiB inherited from the launcher interpreter.
+
+    Returns:
+        tuple[int, bytes, float, int]: The exit code, the standard output, the wall time in seconds and the peak
+        resident set size in bytes.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than `timeout` seconds. The launcher and the command
+        are both killed.
+    """
+    launcher = [sys.executable, "-I", "-S", "-c", MEASURING_LAUNCHER, *command]
+
+    # The launcher leads its own process group, so that the command it spawned is killed along with it
+    with subprocess.Popen(launcher, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            raise
+
+    # The command writes to the same standard error, the measures are the last thing written to it
+    exit_code, elapsed, max_rss = stderr.split()[-3:]
+    return int(exit_code), stdout, float(elapsed), int(max_rss) * 1024
+
+
+def get_commit() -> str | None:
+    """
+    Returns the hash of the checked out commit, or None outside a git repository.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_suite_case(args: argparse.Namespace) -> None:
+    """
+    Triangulates one generated polygonal area with this triangulator and prints the result as JSON. This is the
+    child process run by the suite for each case, so that its peak memory is measured on its own.
+    """
+    polygons = GENERATORS[args.shape](args.size, args.seed)
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in polygon.tolist()] for polygon in polygons])
+    random.seed(args.seed)
+
+    start = time.perf_counter()
+    triangles = triangulate_polygonal_area(polygonal_area, as_indices=True)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({"vertices": sum(len(polygon) for polygon in polygons), "polygons": len(polygons), "triangles": len(triangles), "seconds": elapsed}))
+
+
+# Header of the binary result of the (A) executable run with --no-plot --binary: magic bytes, version, reserved, and
+# the counts of vertices, monotone edges, triangulated edges and triangles
+A_RESULT_HEADER = struct.Struct("<8sIIQQQQ")
+
+
+def read_a_triangle_count(path: str) -> int:
+    """
+    Reads the number of triangles written by the (A) executable to a binary result file.
+    """
+    with open(path, "rb") as file:
+        magic, version, _, _, _, _, n_triangles = A_RESULT_HEADER.unpack(file.read(A_RESULT_HEADER.size))
+
+    if magic != b"TRIANGLE" or version != 2:
+        raise ValueError(f"{path} is not a version 2 binary result of the (A) triangulator")
+
+    return n_triangles
+
+
+def run_suite_case(engine: str, shape: str, size: int, args: argparse.Namespace, directory: str) -> dict:
+    """
+    Runs one case of the suite in a child process and returns its measures.
+
+    The time of this triangulator covers the triangulation only, the time of the (A) binary covers its whole run
+    (reading the binary polygon file and writing its --no-plot result included). The peak memory is the peak
+    resident set size of the process.
+    """
+    record = {"engine": engine, "shape": shape, "size": size, "seed": args.seed}
+
+    if engine == "b":
+        command = [sys.executable, os.path.abspath(__file__), "--seed", str(args.seed), "suite-case", shape, str(size)]
+        try:
+            exit_code, output, _, peak = run_measured(command, timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            return {**record, "status": "timed out"}
+        if exit_code != 0: return {**record, "status": f"failed ({exit_code})"}
+
+        record.update(json.loads(output))
+    else:
+        polygons = GENERATORS[shape](size, args.seed)
+        if len(polygons) > 1: return {**record, "status": "unsupported"}
+
+        input_path = os.path.join(directory, f"{shape}_{size}.bin")
+        write_binary_polygons(input_path, polygons)
+
+        result_path = os.path.join(directory, "result.bin")
+        command = [os.path.abspath(args.a_binary), "--no-plot", "--binary", input_path, result_path]
+        try:
+            exit_code, _, elapsed, peak = run_measured(command, cwd=directory, timeout=args.timeout)
+        except subprocess.TimeoutExpired:
+            return {**record, "status": "timed out"}
+        if exit_code != 0: return {**record, "status": f"failed ({exit_code})"}
+
+        record.update(vertices=len(polygons[0]), polygons=1, triangles=read_a_triangle_count(result_path), seconds=elapsed)
+
+    record.update(peak_rss_bytes=peak, triangles_per_second=record["triangles"] / record["seconds"] if record["seconds"] else None, status="ok")
+    return record
+
+
+def bench_suite(args: argparse.Namespace) -> None:
+    """
+    Runs every engine on every generated shape at every size and appends the results to a JSON lines file.
+
+    Once a case of an engine and shape takes longer than the time budget, the larger sizes of that engine and
+    shape are skipped. A case still running after the timeout is killed and recorded as timed out, which also
+    skips the larger sizes.
+    """
+    engines = ["b"] + (["a"] if args.a_binary else [])
+    commit = get_commit()
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+    with tempfile.TemporaryDirectory() as directory, open(args.output, "a") as results:
+        for engine in engines:
+            for shape in args.shapes:
+                over_budget = False
+
+                for size in sorted(args.sizes):
+                    if over_budget:
+                        record = {"engine": engine, "shape": shape, "size": size, "seed": args.seed, "status": "skipped"}
+                    else:
+                        record = run_suite_case(engine, shape, size, args, directory)
+                        over_budget = record["status"] == "timed out" or record.get("seconds", 0.0) > args.time_budget
+
+                    record = {"commit": commit, "timestamp": timestamp, **record}
+                    results.write(json.dumps(record) + "\n")
+                    results.flush()
+
+                    if record["status"] == "ok":
+                        print(f"{engine} {shape:>6} {size:>8}: {record['seconds']:9.3f} s, {record['peak_rss_bytes'] / 2**20:8.1f} MiB, "
+                              f"{record['triangles_per_second']:12,.0f} triangles/s")
+                    else:
+                        print(f"{engine} {shape:>6} {size:>8}: {record['status']}")
+
+
+def load_a_bindings(directory: str):
+    """
+    Imports the Python bindings of the (A) triangulator from its directory.
+    """
+    spec = importlib.util.spec_from_file_location("triangulation", os.path.join(directory, "triangulation.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.load_library()
+
+    return module
+
+
+def bench_bindings(args: argparse.Namespace) -> None:
+    """
+    Compares the time to triangulate a simple polygon in process with the bindings of the (A) monotone partition
+    triangulator and with this triangulator, per generated shape and size.
+
+    Both take the vertices as an (n, 2) array and return the triangles as vertex indices. The time of this
+    triangulator includes building its vertices from the array.
+    """
+    bindings = load_a_bindings(args.a_dir)
+
+    print(f"{'shape':>6} {'vertices':>9} {'(A) ms':>10} {'(B) ms':>10} {'speedup':>8}")
+
+    for shape in args.shapes:
+        for size in sorted(args.sizes):
+            polygon = GENERATORS[shape](size, args.seed)[0]
+
+            start = time.perf_counter()
+            try:
+                a_triangles = bindings.triangulate(polygon)
+            except ValueError:
+                a_triangles = None
+            a_time = time.perf_counter() - start
+
+            random.seed(args.seed)
+            start = time.perf_counter()
+            b_triangles = triangulate_polygonal_area(PolygonalArea([[Vertex(x, y) for x, y in polygon.tolist()]]), as_indices=True)
+            b_time = time.perf_counter() - start
+
+            if a_triangles is None:
+                print(f"{shape:>6} {len(polygon):>9} {'failed':>10} {b_time * 1000:>10.1f} {'':>8}")
+                continue
+
+            assert len(a_triangles) == len(b_triangles)
+            print(f"{shape:>6} {len(polygon):>9} {a_time * 1000:>10.1f} {b_time * 1000:>10.1f} {b_time / a_time:>8.1f}")
+
+
+def render_per_call_pil(size: tuple[int, int], coordinates: np.ndarray, edges: np.ndarray, triangles: np.ndarray, colors: np.ndarray) -> Image.Image:
+    """
+    Renders vertices, edges and triangles with one PIL call per vertex, edge and triangle, as the drawer used to.
+    """
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+
+    for x, y in coordinates.tolist():
+        draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill="brown")
+    for (xa, ya), (xb, yb) in coordinates[edges].tolist():
+        draw.line((xa, ya, xb, yb), fill="grey")
+    for corners, (r, g, b) in zip(coordinates[triangles].tolist(), colors.tolist()):
+        color = f"#{r:02x}{g:02x}{b:02x}"
+        draw.polygon([tuple(corner) for corner in corners], fill=color, outline=color)
+
+    return image
+
+
+def bench_render(args: argparse.Namespace) -> None:
+    """
+    Compares the rendering of a triangulated polygon with one PIL call per vertex, edge and triangle and with the
+    vectorized rasterizer, whole and in tiles, for an increasing number of vertices.
+    """
+    print(f"{'vertices':>9} {'triangles':>10} {'per call s':>11} {'vectorized s':>13} {'tiled s':>8} {'speedup':>8}")
+
+    for n_vertices in sorted(args.sizes):
+        polygon = GENERATORS["star"](n_vertices, args.seed)[0]
+        random.seed(args.seed)
+        triangles = triangulate_polygonal_area(PolygonalArea([[Vertex(x, y) for x, y in polygon.tolist()]]), as_indices=True)
+
+        # Pixel coordinates filling the image
+        coordinates = (polygon - polygon.min(axis=0)) * ((args.image_size - 1) / np.ptp(polygon, axis=0).max())
+        edges = np.column_stack((np.arange(n_vertices), (np.arange(n_vertices) + 1) % n_vertices))
+        colors = np.random.default_rng(args.seed).integers(100, 256, size=(len(triangles), 3)).astype(np.uint8)
+        size = (args.image_size, args.image_size)
+
+        if n_vertices <= args.per_call_limit:
+            start = time.perf_counter()
+            render_per_call_pil(size, coordinates, edges, triangles, colors)
+            per_call_time = time.perf_counter() - start
+        else:
+            per_call_time = None
+
+        def render_vectorized(tile_size: int | None) -> None:
+            for x0, y0, width, height in iter_tiles(*size, tile_size):
+                tile = np.full((height, width, 3), 255, dtype=np.uint8)
+                rasterize_points(tile, coordinates, 2, (165, 42, 42), (x0, y0))
+                rasterize_segments(tile, coordinates, edges, (128, 128, 128), (x0, y0))
+                rasterize_triangles(tile, coordinates, triangles, colors, (x0, y0))
+                Image.fromarray(tile)
+
+        start = time.perf_counter()
+        render_vectorized(None)
+        vectorized_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        render_vectorized(args.tile_size)
+        tiled_time = time.perf_counter() - start
+
+        per_call = f"{per_call_time:>11.2f}" if per_call_time is not None else f"{'skipped':>11}"
+        speedup = f"{per_call_time / vectorized_time:>8.1f}" if per_call_time is not None else ""
+        print(f"{n_vertices:>9} {len(triangles):>10} {per_call} {vectorized_time:>13.2f} {tiled_time:>8.2f} {speedup}")
+
+
+def bench_batch(args: argparse.Namespace) -> None:
+    """
+    Reports the throughput of the batch triangulation for an increasing number of worker processes.
+    """
+    polygon_sets = [star_polygon(args.vertices, args.seed + index) for index in range(args.polygons)]
+
+    worker_counts = args.workers or sorted({1, 2, 4, 8, 16, os.cpu_count() or 1} & set(range(1, (os.cpu_count() or 1) + 1)))
+    reference_rate = None
+
+    print(f"{'workers':>8} {'seconds':>9} {'polygons/s':>11} {'speedup':>8}")
+
+    for worker_count in worker_counts:
+        start = time.perf_counter()
+        for _ in triangulate_batch(polygon_sets, max_workers=worker_count, chunk_vertices=args.chunk_vertices):
+            pass
+        elapsed = time.perf_counter() - start
+
+        rate = len(polygon_sets) / elapsed
+        reference_rate = reference_rate or rate
+        print(f"{worker_count:>8} {elapsed:>9.2f} {rate:>11.1f} {rate / reference_rate:>8.2f}")
+
+
+def main():
+    """
+    Runs the benchmark selected on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks of the polygon triangulation.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random polygons and edge insertion order")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    memory_parser = subparsers.add_parser("memory", help="Time and memory of the object and compact trapezoidation backends")
+    memory_parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    memory_parser.set_defaults(run=bench_memory)
+
+    vertices_parser = subparsers.add_parser("vertices", help="Allocations of the polygon vertices and temporary points")
+    vertices_parser.add_argument("--vertices", type=int, default=100000, help="Number of vertices of the polygon")
+    vertices_parser.set_defaults(run=bench_vertices)
+
+    predicates_parser = subparsers.add_parser("predicates", help="Predicate evaluations per inserted edge and cost per evaluation")
+    predicates_parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    predicates_parser.set_defaults(run=bench_predicates)
+
+    click_parser = subparsers.add_parser("click", help="Latency of the interactive drawer checks on each click")
+    click_parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    click_parser.add_argument("--clicks", type=int, default=200, help="Number of clicks to simulate")
+    click_parser.set_defaults(run=bench_click)
+
+    read_parser = subparsers.add_parser("read", help="Parse throughput of the streaming polygon file reader")
+    read_parser.add_argument("--polygons", type=int, default=100, help="Number of polygons in the file")
+    read_parser.add_argument("--vertices", type=int, default=20000, help="Number of vertices per polygon")
+    read_parser.set_defaults(run=bench_read)
+
+    locate_parser = subparsers.add_parser("locate", help="Point location throughput of a trapezoidal map")
+    locate_parser.add_argument("--vertices", type=int, default=100000, help="Number of vertices of the polygonal area")
+    locate_parser.add_argument("--points", type=int, default=1000000, help="Number of points to locate")
+    locate_parser.set_defaults(run=bench_locate)
+
+    suite_parser = subparsers.add_parser("suite", help="Time, memory and triangles per second on generated shapes and sizes, saved to a results file")
+    suite_parser.add_argument("sizes", type=int, nargs="*", default=[100, 1000, 10000, 100000, 1000000])
+    suite_parser.add_argument("--shapes", nargs="+", choices=list(GENERATORS), default=list(GENERATORS), help="Generated shapes to triangulate")
+    suite_parser.add_argument("--a-binary", help="Path to the (A) triangulate executable, to benchmark it as well")
+    suite_parser.add_argument("--output", default="benchmark_results.jsonl", help="JSON lines file the results are appended to")
+    suite_parser.add_argument("--time-budget", type=float, default=60.0, help="Skip the larger sizes of a shape once a case takes longer (seconds)")
+    suite_parser.add_argument("--timeout", type=float, default=600.0, help="Kill a case still running after this time and record it as timed out (seconds)")
+    suite_parser.set_defaults(run=bench_suite)
+
+    suite_case_parser = subparsers.add_parser("suite-case", help=argparse.SUPPRESS)
+    suite_case_parser.add_argument("shape", choices=list(GENERATORS))
+    suite_case_parser.add_argument("size", type=int)
+    suite_case_parser.set_defaults(run=bench_suite_case)
+
+    bindings_parser = subparsers.add_parser("bindings", help="In-process (A) bindings compared with this triangulator, per shape and size")
+    bindings_parser.add_argument("sizes", type=int, nargs="*", default=[100, 1000, 10000, 100000])
+    bindings_parser.add_argument("--shapes", nargs="+", choices=["star", "spiral", "comb"], default=["star", "spiral", "comb"], help="Generated shapes to triangulate")
+    bindings_parser.add_argument("--a-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "(A)"), help="Directory of the (A) bindings (triangulation.py)")
+    bindings_parser.set_defaults(run=bench_bindings)
+
+    render_parser = subparsers.add_parser("render", help="Rendering with one PIL call per shape compared with the vectorized rasterizer")
+    render_parser.add_argument("sizes", type=int, nargs="*", default=[1000, 10000, 100000])
+    render_parser.add_argument("--image-size", type=int, default=4000, help="Width and height of the image, in pixels")
+    render_parser.add_argument("--tile-size", type=int, default=1024, help="Side of the tiles of the tiled rendering, in pixels")
+    render_parser.add_argument("--per-call-limit", type=int, default=1000000, help="Skip the per-call rendering above this number of vertices")
+    render_parser.set_defaults(run=bench_render)
+
+    batch_parser = subparsers.add_parser("batch", help="Throughput of the batch triangulation per number of workers")
+    batch_parser.add_argument("--polygons", type=int, default=2000, help="Number of independent polygons")
+    batch_parser.add_argument("--vertices", type=int, default=50, help="Number of vertices per polygon")
+    batch_parser.add_argument("--chunk-vertices", type=int, default=20000, help="Minimum number of vertices per task, lowered to give each worker several tasks")
+    batch_parser.add_argument("--workers", type=int, nargs="*", help="Worker counts to measure (default: powers of two up to the CPU count)")
+    batch_parser.set_defaults(run=bench_batch)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
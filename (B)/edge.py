@@ -1,4 +1,5 @@
-from vertex import Vertex
+from predicates import is_right_of_edge, x_on_edge
+from vertex import Point
 
 class Edge:
     """
@@ -15,7 +16,7 @@ class Edge:
             self.bottom_vertex = start
             self.top_vertex = end
 
-        self.mid_point = Vertex((self.bottom_vertex.x + self.top_vertex.x) / 2, (self.bottom_vertex.y + self.top_vertex.y) / 2)
+        self.mid_point = Point((self.bottom_vertex.x + self.top_vertex.x) / 2, (self.bottom_vertex.y + self.top_vertex.y) / 2)
 
 
     def get_vertex(self, top):
@@ -28,7 +29,7 @@ class Edge:
         """
         Determines if a given vertex is to the right of the edge at the vertex's y-coordinate.
         """
-        return vertex.x > self.get_x_by_y(vertex.y)
+        return is_right_of_edge(self, vertex.x, vertex.y)
 
     def get_x_by_y(self, y):
         """
@@ -37,11 +38,7 @@ class Edge:
         If the edge is horizontal (both vertices have the same y-coordinate), the
         average of the x-coordinates of the two vertices is returned.
         """
-        if self.bottom_vertex.y == self.top_vertex.y:
-            return (self.bottom_vertex.x + self.top_vertex.x) / 2
-
-        t = (y - self.bottom_vertex.y) / (self.top_vertex.y - self.bottom_vertex.y)
-        return self.bottom_vertex.x + t * (self.top_vertex.x - self.bottom_vertex.x)
+        return x_on_edge(self, y)
 
 def get_edge_vertex(edge, top):
     """
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from array import array
+from random import shuffle
+
+from algorithms import *
+from polygonal_area import PolygonalArea
+
+
+class IncrementalTriangulation:
+    """
+    Triangulation of a polygonal area that grows one polygon at a time.
+
+    The search structure of the trapezoidal decomposition is kept between updates, so adding a polygon only
+    inserts the edges of that polygon instead of rebuilding the decomposition of the whole area. The triangles
+    are kept per monotone mountain, together with the links of each mountain chain, from the bottom vertex to the
+    top vertex of each inside trapezoid along its base edge.
+
+    An update only revisits the trapezoids whose inside status or chain links may have changed: those created,
+    split or merged away by the inserted edges, and those bounded on the left by a polygon that a new polygon
+    encloses, whose parity flips. Only the mountains whose chain changed are triangulated again, and the other
+    triangles are kept as they are.
+
+    The edges of each added polygon are inserted in random order, but the polygons themselves are inserted in
+    the order they are added, so the search structure can be deeper than one built from all the edges at once.
+    """
+
+    def __init__(self, compact: bool = False) -> None:
+        """
+        Initializes an empty triangulation.
+
+        Args:
+            compact (bool): Whether to build a CompactSearchStructure, stored in integer columns.
+        """
+        self.polygons: list[Polygon] = []
+        self.polygon_edges: list[list[Edge]] = []
+        self.search_structure = build_search_structure([], compact)
+        self.inserted_vertices: set[Vertex] = set()
+
+        self.left_edges: dict[Trapezoid, Edge] = {}
+        self.trapezoids_by_left_edge: dict[Edge, dict[Trapezoid, None]] = {}
+        self.links_by_trapezoid: dict[Trapezoid, tuple[Vertex, list[Edge]]] = {}
+        self.links_by_base: dict[Edge, dict[Vertex, Vertex]] = {}
+        self.mountains: dict[Edge, tuple[tuple[Vertex, ...], list[Triangle]]] = {}
+
+    def add_polygons(self, polygons: list[Polygon]) -> tuple[list[Triangle], list[Triangle]]:
+        """
+        Adds polygons to the polygonal area and updates its triangulation.
+
+        The polygons must not intersect each other nor the polygons already added.
+
+        Args:
+            polygons (list[Polygon]): The polygons to add.
+
+        Returns:
+            tuple[list[Triangle], list[Triangle]]: The triangles added to the triangulation and the triangles
+            removed from it.
+        """
+        polygon_edges = [PolygonalArea([polygon]).get_edges() for polygon in polygons]
+        edges = [edge for edges_of_polygon in polygon_edges for edge in edges_of_polygon]
+        shuffle(edges)
+
+        enclosed_polygons = self.__find_enclosed_polygons(polygons)
+
+        touched_trapezoids: list[Trapezoid] = []
+        insert_edges(self.search_structure, edges, self.inserted_vertices, touched_trapezoids)
+        self.polygons.extend(polygons)
+        self.polygon_edges.extend(polygon_edges)
+
+        trapezoids = dict.fromkeys(touched_trapezoids)
+        for trapezoid in trapezoids: self.__index_left_edge(trapezoid)
+
+        for polygon_index in enclosed_polygons:
+            for edge in self.polygon_edges[polygon_index]: trapezoids.update(self.trapezoids_by_left_edge.get(edge, {}))
+
+        changed_bases: dict[Edge, None] = {}
+
+        for trapezoid in trapezoids:
+            trapezoid.reset_inside()
+            self.__unlink_trapezoid(trapezoid, changed_bases)
+
+        for trapezoid in trapezoids:
+            if trapezoid.associated_node is not None and trapezoid.is_inside(): self.__link_trapezoid(trapezoid, changed_bases)
+
+        return self.__update_mountains(changed_bases)
+
+    def get_triangles(self) -> list[Triangle]:
+        """
+        Retrieves all the triangles of the current triangulation.
+        """
+        return [triangle for _, triangles in self.mountains.values() for triangle in triangles]
+
+    def __find_enclosed_polygons(self, polygons: list[Polygon]) -> list[int]:
+        """
+        Finds the polygons already added that lie inside an odd number of the given polygons.
+
+        The polygons do not intersect, so each one lies either fully inside or fully outside another, and testing
+        its first vertex is enough.
+        """
+        if not self.polygons: return []
+
+        first_vertices = np.array([(polygon[0].x, polygon[0].y) for polygon in self.polygons])
+        enclosed = np.zeros(len(first_vertices), dtype=bool)
+
+        for polygon in polygons: enclosed ^= are_points_in_polygon(first_vertices, polygon)
+
+        return np.flatnonzero(enclosed).tolist()
+
+    def __index_left_edge(self, trapezoid: Trapezoid) -> None:
+        """
+        Moves a touched trapezoid to the index entry of its current left edge, or out of the index if it was merged away.
+        """
+        previous_left_edge = self.left_edges.pop(trapezoid, None)
+        if previous_left_edge is not None: del self.trapezoids_by_left_edge[previous_left_edge][trapezoid]
+
+        left_edge = trapezoid.left_edge if trapezoid.associated_node is not None else None
+        if left_edge is not None:
+            self.left_edges[trapezoid] = left_edge
+            self.trapezoids_by_left_edge.setdefault(left_edge, {})[trapezoid] = None
+
+    def __unlink_trapezoid(self, trapezoid: Trapezoid, changed_bases: dict[Edge, None]) -> None:
+        """
+        Removes the links that a trapezoid added to the mountain chains at the previous update.
+        """
+        bottom_vertex, bases = self.links_by_trapezoid.pop(trapezoid, (None, []))
+
+        for base in bases:
+            del self.links_by_base[base][bottom_vertex]
+            changed_bases[base] = None
+
+    def __link_trapezoid(self, trapezoid: Trapezoid, changed_bases: dict[Edge, None]) -> None:
+        """
+        Links the bottom vertex of an inside trapezoid to its top vertex in the chain of each mountain it belongs to,
+        as group_vertices_by_mountain does.
+        """
+        bottom_vertex, top_vertex = trapezoid.bottom_vertex, trapezoid.top_vertex
+        bases = [edge for edge in [trapezoid.left_edge, trapezoid.get_right_edge()] if bottom_vertex != edge.bottom_vertex or top_vertex != edge.top_vertex]
+
+        for base in bases:
+            self.links_by_base.setdefault(base, {})[bottom_vertex] = top_vertex
+            changed_bases[base] = None
+
+        self.links_by_trapezoid[trapezoid] = (bottom_vertex, bases)
+
+    def __update_mountains(self, changed_bases: dict[Edge, None]) -> tuple[list[Triangle], list[Triangle]]:
+        """
+        Walks again the chains of the mountains whose links changed, and triangulates those whose chain is not the same.
+        """
+        added_triangles: list[Triangle] = []
+        removed_triangles: list[Triangle] = []
+
+        bases: list[Edge] = []
+        chains: list[tuple[Vertex, ...]] = []
+        vertex_indices: dict[Vertex, int] = {}
+        chain_vertices = array("i")
+        offsets = [0]
+
+        for base in changed_bases:
+            links = self.links_by_base.get(base)
+            previous_chain, previous_triangles = self.mountains.pop(base, ((), []))
+
+            if not links:
+                self.links_by_base.pop(base, None)
+                removed_triangles.extend(previous_triangles)
+                continue
+
+            chain = [base.bottom_vertex]
+            while chain[-1] in links: chain.append(links[chain[-1]])
+
+            if tuple(chain) == previous_chain:
+                self.mountains[base] = (previous_chain, previous_triangles)
+                continue
+
+            removed_triangles.extend(previous_triangles)
+            bases.append(base)
+            chains.append(tuple(chain))
+            chain_vertices.extend(vertex_indices.setdefault(vertex, len(vertex_indices)) for vertex in chain)
+            offsets.append(len(chain_vertices))
+
+        monotone_mountains = MonotoneMountains(list(vertex_indices), bases, chain_vertices, np.array(offsets, dtype=np.int64))
+        vertices = monotone_mountains.vertices
+
+        for index, base in enumerate(bases):
+            triangle_indices = array("i")
+            triangulate_monotone_mountain(monotone_mountains, index, triangle_indices)
+            triangles = [Triangle((vertices[triangle_indices[i]], vertices[triangle_indices[i + 1]], vertices[triangle_indices[i + 2]])) for i in range(0, len(triangle_indices), 3)]
+
+            self.mountains[base] = (chains[index], triangles)
+            added_triangles.extend(triangles)
+
+        return added_triangles, removed_triangles
+
+
+def are_points_in_polygon(points: np.ndarray, polygon: Polygon) -> np.ndarray:
+    """
+    Tests which of the given (n, 2) points lie inside a polygon, by counting the edges crossed by a horizontal ray
+    going right from each point. The points must not lie on the polygon.
+    """
+    coordinates = np.array([(vertex.x, vertex.y) for vertex in polygon])
+    x0, y0 = coordinates[:, 0], coordinates[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+
+    inside = np.zeros(len(points), dtype=bool)
+    chunk_size = max(1, (1 << 20) // len(polygon))
+
+    for start in range(0, len(points), chunk_size):
+        x, y = points[start:start + chunk_size, 0:1], points[start:start + chunk_size, 1:2]
+        straddling = (y0 > y) != (y1 > y)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossed = straddling & (x < x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+
+        inside[start:start + chunk_size] = np.count_nonzero(crossed, axis=1) % 2 == 1
+
+    return inside
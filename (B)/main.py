@@ -1,5 +1,4 @@
 import argparse
-from polygonal_area_drawer import PolygonalAreaDrawer
 
 def main():
     """
@@ -17,6 +16,9 @@ def main():
     use_tkinter = args.use_tkinter.lower() == "yes"
     if not use_tkinter and not args.file:
         parser.error("The --file argument is required when use_tkinter is 'no'")
+
+    # The drawer pulls in PIL (and Tkinter when used), so it is only imported once the arguments are valid
+    from polygonal_area_drawer import PolygonalAreaDrawer
     drawer = PolygonalAreaDrawer(use_tkinter=use_tkinter, output_path="output.png")
     drawer.run(input_file=args.file)
 
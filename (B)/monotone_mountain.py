@@ -1,18 +1,45 @@
-class MonotoneMountain:
+from array import array
+
+import numpy as np
+
+
+class MonotoneMountains:
     """
-    Represents a monotone mountain polygon.
+    Represents the monotone mountains partition of a polygonal area with flat arrays.
+
+    The chains of all the mountains are stored one after the other in `chain_vertices`, each from the bottom of its
+    base edge upwards, as indices into `vertices`. The chain of mountain i spans the positions offsets[i] to
+    offsets[i + 1] - 1. The `above` and `below` arrays link each position to the next and previous positions still
+    in its chain: they start as the whole chains and are updated as the mountains are triangulated.
     """
-    def __init__(self, bottom_vertex, base):
+    def __init__(self, vertices, bases, chain_vertices, offsets):
+        """
+        Initializes the monotone mountains from their base edges and their flat chains of vertex indices, given as
+        an array("i").
+        """
+        self.vertices = vertices
+        self.bases = bases
+        self.offsets = offsets
+        self.chain_vertices = chain_vertices
+
+        positions = np.arange(len(chain_vertices), dtype=np.intc)
+        self.above = array("i", (positions + 1).tobytes())
+        self.below = array("i", (positions - 1).tobytes())
+
+    def __len__(self):
+        """
+        Retrieves the number of monotone mountains.
+        """
+        return len(self.bases)
+
+    def get_chain(self, index):
         """
-        Initializes a monotone mountain with its bottom vertex and base edge.
+        Retrieves the vertex indices of the chain of a monotone mountain, from the bottom of its base edge upwards.
         """
-        self.base = base
-        self.bottom_vertex = bottom_vertex
+        return np.frombuffer(self.chain_vertices, dtype=np.intc)[self.offsets[index]:self.offsets[index + 1]]
 
-    def is_degenerated(self):
+    def is_degenerated(self, index):
         """
-        Checks if the monotone mountain is degenerated.
+        Checks if a monotone mountain is degenerated, i.e. if its chain is only its base edge.
         """
-        if (above := self.bottom_vertex.above) is None: return True
-        if above.above is None: return True
-        return False
+        return self.offsets[index + 1] - self.offsets[index] < 3
@@ -1,22 +1,58 @@
+from predicates import is_above, is_right_of_edge
 from trapezoid import *
-from vertex import Vertex
+
+TRAPEZOID_NODE = 0
+VERTEX_NODE = 1
+EDGE_NODE = 2
+
+class SearchStats:
+    """
+    Counters describing the point location queries run against a search structure.
+    """
+    def __init__(self):
+        """
+        Initializes all counters to zero.
+        """
+        self.queries = 0
+        self.visited_nodes = 0
+        self.max_depth = 0
+
+    def record_query(self, depth):
+        """
+        Records a query that reached a trapezoid after descending through `depth` inner nodes.
+        """
+        self.queries += 1
+        self.visited_nodes += depth + 1
+        if depth > self.max_depth: self.max_depth = depth
+
+    def get_average_depth(self):
+        """
+        Returns the mean number of inner nodes traversed per query.
+        """
+        return (self.visited_nodes - self.queries) / self.queries if self.queries else 0.0
 
 class Node:
     """
     Represents a node in the trapezoidal decomposition search structure.
     """
+    __slots__ = ("node_type", "associated_obj", "left_child", "right_child", "parents", "search_stats")
+
     def __init__(self, trapezoid, parent = None):
         """
         Initializes a new Node. A newly created node is always added at the bottom of the structure, and at the time of its creation, it is always a leaf node representing a trapezoid.
+        The root of the structure (created without a parent) also owns the query counters of the whole structure.
         """
+        self.node_type = TRAPEZOID_NODE
         self.associated_obj = trapezoid
         self.left_child = None
         self.right_child = None
         self.parents = []
-        
+        self.search_stats = None
+
         trapezoid.associated_node = self
 
         if parent: self.parents.append(parent)
+        else: self.search_stats = SearchStats()
 
     def replace_by_another_node_in_tree(self, new_node):
         """
@@ -32,13 +68,14 @@ class Node:
 
     def insert_vertex(self, vertex):
         """
-        Inserts a vertex into the trapezoidal decomposition structure.
+        Inserts a vertex into the trapezoidal decomposition structure and returns the two trapezoids it split.
         """
-        self.__search_area_containing_vertex(vertex).__split_by_vertex(vertex)
+        return self.__search_area_containing_vertex(vertex).__split_by_vertex(vertex)
 
     def insert_edge(self, edge, top_just_inserted, bottom_just_inserted):
         """
-        Inserts an edge into the trapezoidal decomposition structure.
+        Inserts an edge into the trapezoidal decomposition structure and returns the couples of trapezoids it split,
+        some of which may have been merged away afterwards.
         """
         start_node = self.__search_area_containing_vertex(edge.mid_point)
 
@@ -54,33 +91,85 @@ class Node:
         manage_adjacent_trapezoids_after_edge_split(edge, created_trap_couples, top_just_inserted, bottom_just_inserted)
         merge_redundant_trapezoids(created_trap_couples)
 
+        return created_trap_couples
+
+    def find_trapezoid(self, point):
+        """
+        Finds the trapezoid of the decomposition containing the given point.
+        """
+        return self.__search_area_containing_vertex(point).associated_obj
+
     def get_all_traps(self, trapezoids_acc = None):
         """
         Collects all trapezoids from the subtree rooted at this node.
+
+        The structure is a DAG whose nodes can be shared by several parents, so every node is visited only once.
         """
         if trapezoids_acc is None: trapezoids_acc = []
 
-        if type(self.associated_obj) is Trapezoid: trapezoids_acc.append(self.associated_obj)
+        visited = {id(self)}
+        nodes_to_visit = [self]
+
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
 
-        else:
-            self.left_child.get_all_traps(trapezoids_acc)
-            self.right_child.get_all_traps(trapezoids_acc)
+            if node.node_type == TRAPEZOID_NODE:
+                trapezoids_acc.append(node.associated_obj)
+                continue
+
+            for child in (node.right_child, node.left_child):
+                if id(child) not in visited:
+                    visited.add(id(child))
+                    nodes_to_visit.append(child)
 
         return trapezoids_acc
 
+    def get_node_count_and_depth(self):
+        """
+        Counts the distinct nodes of the subtree rooted at this node and measures its depth, the largest number of
+        inner nodes on a path from this node down to a trapezoid.
+        """
+        depths = {}
+        nodes_to_visit = [self]
+
+        while nodes_to_visit:
+            node = nodes_to_visit[-1]
+
+            if node.node_type == TRAPEZOID_NODE:
+                depths[id(node)] = 0
+                nodes_to_visit.pop()
+                continue
+
+            pending_children = [child for child in (node.left_child, node.right_child) if id(child) not in depths]
+            if pending_children:
+                nodes_to_visit.extend(pending_children)
+                continue
+
+            depths[id(node)] = 1 + max(depths[id(node.left_child)], depths[id(node.right_child)])
+            nodes_to_visit.pop()
+
+        return len(depths), depths[id(self)]
+
     def __search_area_containing_vertex(self, vertex):
         """
         Finds the trapezoid node in the search structure that contains the given vertex.
         """
-        obj_type = type(self.associated_obj)
+        node = self
+        depth = 0
+        x, y = vertex.x, vertex.y
+
+        while node.node_type != TRAPEZOID_NODE:
+            obj = node.associated_obj
 
-        if obj_type is Trapezoid: return self
+            if node.node_type == VERTEX_NODE: go_right = is_above(x, y, obj.x, obj.y)
+            else: go_right = is_right_of_edge(obj, x, y)
 
-        relevant_child = self.left_child
+            node = node.right_child if go_right else node.left_child
+            depth += 1
 
-        if (obj_type is Vertex and vertex > self.associated_obj) or (obj_type is Edge and self.associated_obj.is_vertex_at_the_right(vertex)): relevant_child = self.right_child
+        if self.search_stats is not None: self.search_stats.record_query(depth)
 
-        return relevant_child.__search_area_containing_vertex(vertex)
+        return node
 
     def __split_by_vertex(self, vertex):
         """
@@ -88,11 +177,14 @@ class Node:
         """
         bottom_trapezoid, top_trapezoid = self.associated_obj.split_by_vertex(vertex)
 
+        self.node_type = VERTEX_NODE
         self.associated_obj = vertex
 
         self.left_child = Node(bottom_trapezoid, self)
         self.right_child = Node(top_trapezoid, self)
 
+        return bottom_trapezoid, top_trapezoid
+
     def __split_by_edge(self, edge, created_trap_couples):
         """
         Splits the trapezoid represented by this node into two trapezoids using an edge.
@@ -101,6 +193,7 @@ class Node:
 
         created_trap_couples.append((left_trapezoid, right_trapezoid))
 
+        self.node_type = EDGE_NODE
         self.associated_obj = edge
 
         self.left_child = Node(left_trapezoid, self)
@@ -126,8 +219,7 @@ class Node:
                 current_trap = next_traps_in_direction[0]
             elif sz == 2:
                 left_trap_in_direction = next_traps_in_direction[0]
-                left_trap_relevant_rightmost_pt = left_trap_in_direction.get_extreme_point(not up_direction, True)
-                trap_index = 0 if edge.is_vertex_at_the_right(left_trap_relevant_rightmost_pt) else 1
+                trap_index = 0 if left_trap_in_direction.is_corner_right_of_edge(edge, not up_direction, True) else 1
                 current_trap = next_traps_in_direction[trap_index]
 
             nodes_to_split.append(current_trap.associated_node)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+
+def star_polygon(n_vertices: int, seed: int = 0, radius: float = 1000.0) -> list[np.ndarray]:
+    """
+    Generates a random star-shaped polygon: one vertex per angular sector, at a random distance from the center.
+    """
+    rng = np.random.default_rng(seed)
+    angles = (np.arange(n_vertices) + rng.uniform(0.1, 0.9, n_vertices)) * (2 * math.pi / n_vertices)
+    distances = rng.uniform(0.5, 1.0, n_vertices) * radius
+
+    return [np.column_stack((distances * np.cos(angles), distances * np.sin(angles)))]
+
+
+def spiral_polygon(n_vertices: int, seed: int = 0, radius: float = 1000.0, turns: int = 4) -> list[np.ndarray]:
+    """
+    Generates a thick spiral: an outer arm winding outwards and an inner arm coming back half a turn pitch inside it,
+    with the vertices slightly jittered along the arms.
+
+    The arms are polylines, whose edges cut inside the arcs they span. The spiral winds at most `turns` times, fewer
+    when there are too few vertices per turn for the edges to stay within a quarter pitch of their arc, so that the
+    arms never cross.
+
+    Raises:
+        ValueError: If there are too few vertices for a single turn.
+    """
+    rng = np.random.default_rng(seed)
+    n_arm = max(n_vertices // 2, 3)
+    turns = max_spiral_turns(n_arm, turns)
+    if turns == 0:
+        raise ValueError(f"A spiral needs more than {n_vertices} vertices")
+    pitch = radius / (turns + 1)
+
+    step = 2 * math.pi * turns / (n_arm - 1)
+    angles = np.arange(n_arm) * step + rng.uniform(-0.25, 0.25, n_arm) * step
+    angles[0], angles[-1] = 0.0, 2 * math.pi * turns
+    outer_radii = pitch + pitch * angles / (2 * math.pi)
+    inner_radii = outer_radii - pitch / 2
+
+    outer = np.column_stack((outer_radii * np.cos(angles), outer_radii * np.sin(angles)))
+    inner = np.column_stack((inner_radii * np.cos(angles), inner_radii * np.sin(angles)))[::-1]
+
+    return [np.concatenate((outer, inner))]
+
+
+def max_spiral_turns(n_arm: int, turns: int) -> int:
+    """
+    Finds the largest number of turns, up to `turns`, for which the edges of an arm of `n_arm` vertices stay within a
+    quarter pitch of their arc. An edge spans at most 1.5 angular steps with the jitter, and its sagitta grows with
+    the radius, which reaches (turns + 1) pitches. Returns 0 when even a single turn does not fit.
+    """
+    while turns > 0:
+        widest_angle = 1.5 * 2 * math.pi * turns / (n_arm - 1)
+        if widest_angle < math.pi and (turns + 1) * (1 - math.cos(widest_angle / 2)) <= 0.25:
+            return turns
+        turns -= 1
+
+    return 0
+
+
+def comb_polygon(n_vertices: int, seed: int = 0, radius: float = 1000.0) -> list[np.ndarray]:
+    """
+    Generates a comb: a horizontal bar with teeth of random heights on top, which yields many horizontal edges and
+    vertices sharing the same y-coordinate.
+    """
+    rng = np.random.default_rng(seed)
+    n_teeth = max((n_vertices - 2) // 4, 1)
+    width = 2 * radius / n_teeth
+    heights = rng.uniform(0.2, 1.0, n_teeth) * radius
+
+    # From the right end of the bar, each tooth i contributes its four corners, right to left
+    lefts = np.arange(n_teeth - 1, -1, -1) * width - radius
+    heights = heights[::-1]
+    teeth = np.empty((n_teeth, 4, 2))
+    teeth[:, 0] = np.column_stack((lefts + width, np.zeros(n_teeth)))
+    teeth[:, 1] = np.column_stack((lefts + width / 2, np.zeros(n_teeth)))
+    teeth[:, 2] = np.column_stack((lefts + width / 2, heights))
+    teeth[:, 3] = np.column_stack((lefts, heights))
+
+    bar = np.array([(-radius, -0.1 * radius), (radius, -0.1 * radius)])
+    return [np.concatenate((bar, teeth.reshape(-1, 2)))]
+
+
+def polygon_with_holes(n_vertices: int, seed: int = 0, radius: float = 1000.0) -> list[np.ndarray]:
+    """
+    Generates a random star-shaped outline with small star-shaped holes on a grid inside it. Half of the vertices
+    belong to the outline, the other half to the holes, which have 8 vertices each.
+    """
+    n_holes = max(n_vertices // 16, 1)
+    n_outline = max(n_vertices - 8 * n_holes, 3)
+    grid_size = math.ceil(math.sqrt(n_holes))
+    cell_size = 0.7 * radius / grid_size
+
+    polygons = star_polygon(n_outline, seed, radius)
+
+    rng = np.random.default_rng(seed + 1)
+    angles = (np.arange(8) + rng.uniform(0.1, 0.9, (n_holes, 8))) * (2 * math.pi / 8)
+    distances = rng.uniform(0.5, 1.0, (n_holes, 8)) * 0.45 * cell_size
+    rows, columns = np.divmod(np.arange(n_holes), grid_size)
+    centers_x = -0.35 * radius + (columns + 0.5) * cell_size
+    centers_y = -0.35 * radius + (rows + 0.5) * cell_size
+
+    holes = np.stack((centers_x[:, None] + distances * np.cos(angles), centers_y[:, None] + distances * np.sin(angles)), axis=-1)
+    return polygons + list(holes)
+
+
+GENERATORS = {
+    "star": star_polygon,
+    "spiral": spiral_polygon,
+    "comb": comb_polygon,
+    "holes": polygon_with_holes,
+}
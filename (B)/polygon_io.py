@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import mmap
+import re
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+
+BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+
+BINARY_MAGIC = b"POLYGONS"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<8sIIQQ")
+
+
+def read_polygons(path: str, chunk_size: int = 1 << 22) -> Iterator[np.ndarray]:
+    """
+    Streams the polygons of a text file, one at a time.
+
+    The file lists the vertices of each polygon on contiguous lines, one "x y" pair per line, and separates the
+    polygons by empty lines. It is read in chunks of `chunk_size` bytes, split into polygons at the empty lines,
+    and each polygon is parsed in bulk. Only the text of the polygon being read is kept across chunks, so the
+    memory used is bounded by the chunk size and the largest polygon rather than by the size of the file.
+    Polygons with fewer than 3 vertices are skipped.
+
+    Args:
+        path (str): The file to read.
+        chunk_size (int): The number of bytes read at once.
+
+    Yields:
+        np.ndarray: The vertices of each polygon, as an (n, 2) float64 array.
+
+    Raises:
+        ValueError: If a line does not hold exactly two numbers.
+    """
+    with open(path, "rb") as file:
+        buffer = bytearray()
+        line_number = 1
+
+        while chunk := file.read(chunk_size):
+            # An empty line cut by the previous chunk starts at the last line break read so far
+            search_start = max(buffer.rfind(b"\n"), 0)
+            buffer += chunk
+            block_start = 0
+
+            for separator in BLANK_LINE.finditer(buffer, search_start):
+                block = bytes(buffer[block_start:separator.start()])
+                polygon = parse_polygon(block, path, line_number)
+                line_number += block.count(b"\n") + 2
+                block_start = separator.end()
+                if polygon is not None: yield polygon
+
+            del buffer[:block_start]
+
+        polygon = parse_polygon(bytes(buffer), path, line_number)
+        if polygon is not None: yield polygon
+
+def parse_polygon(block: bytes, path: str, first_line_number: int) -> np.ndarray | None:
+    """
+    Parses the lines of one polygon in bulk, or returns None if it has fewer than 3 vertices.
+
+    Raises:
+        ValueError: If a line does not hold exactly two numbers, naming the first such line.
+    """
+    stripped = block.lstrip()
+    first_line_number += block[:len(block) - len(stripped)].count(b"\n")
+    block = stripped.rstrip()
+    if not block: return None
+
+    characters = np.frombuffer(block, dtype=np.uint8)
+    is_space = (characters == ord(" ")) | ((characters >= ord("\t")) & (characters <= ord("\r")))
+    token_starts = np.flatnonzero(~is_space[1:] & is_space[:-1]) + 1
+    if not is_space[0]: token_starts = np.concatenate(([0], token_starts))
+    line_ends = np.flatnonzero(characters == ord("\n"))
+
+    # Each line holds two tokens exactly when the k-th line break falls between the tokens 2k + 1 and 2k + 2
+    if token_starts.size == 2 * (line_ends.size + 1) and np.all(token_starts[1:-1:2] < line_ends) and np.all(line_ends < token_starts[2::2]):
+        try:
+            coordinates = np.fromstring(block.decode("latin-1"), dtype=np.float64, sep=" ")
+        except ValueError:
+            coordinates = None
+
+        if coordinates is not None and coordinates.size == token_starts.size:
+            polygon = coordinates.reshape(-1, 2)
+            return polygon if len(polygon) >= 3 else None
+
+    raise ValueError(f"{path}: line {first_line_number + find_first_bad_line(block, token_starts, line_ends)} does not hold exactly two numbers")
+
+def find_first_bad_line(block: bytes, token_starts: np.ndarray, line_ends: np.ndarray) -> int:
+    """
+    Finds the first line of a malformed polygon, counted from 0, which does not hold exactly two numbers.
+    Only malformed polygons are parsed token by token.
+    """
+    token_lines = np.searchsorted(line_ends, token_starts)
+    bad_lines = np.flatnonzero(np.bincount(token_lines, minlength=line_ends.size + 1) != 2).tolist()
+
+    for token_line, token in zip(token_lines.tolist(), block.split()):
+        if bad_lines and token_line >= bad_lines[0]: break
+
+        try:
+            float(token)
+        except ValueError:
+            return token_line
+
+    return bad_lines[0] if bad_lines else 0
+
+
+class BinaryPolygons(Sequence):
+    """
+    Polygons of a binary polygon file, memory-mapped read-only.
+
+    A binary polygon file holds a header (magic bytes, format version, number of polygons and of vertices), an
+    offset table of n_polygons + 1 uint64 giving the index of the first vertex of each polygon (the last entry
+    being the number of vertices), then the coordinates of all the vertices as a contiguous (n_vertices, 2)
+    float64 block, all little-endian. Each polygon is a view on the mapping, so nothing is parsed nor copied.
+    """
+
+    def __init__(self, offsets: np.ndarray, coordinates: np.ndarray) -> None:
+        """
+        Initializes the polygons from an offset table and a coordinate block.
+        """
+        self.offsets = offsets
+        self.coordinates = coordinates
+
+    @classmethod
+    def open(cls, path: str) -> BinaryPolygons:
+        """
+        Memory-maps a binary polygon file.
+
+        Raises:
+            ValueError: If the file is not a binary polygon file of a supported version.
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(buffer) < BINARY_HEADER.size: raise ValueError(f"{path} is not a binary polygon file")
+
+        magic, version, _, n_polygons, n_vertices = BINARY_HEADER.unpack_from(buffer)
+        if magic != BINARY_MAGIC: raise ValueError(f"{path} is not a binary polygon file")
+        if version != BINARY_VERSION: raise ValueError(f"Unsupported binary polygon file version {version} in {path}")
+
+        offsets = np.frombuffer(buffer, dtype="<u8", count=n_polygons + 1, offset=BINARY_HEADER.size)
+        coordinates = np.frombuffer(buffer, dtype="<f8", count=2 * n_vertices, offset=BINARY_HEADER.size + offsets.nbytes).reshape(-1, 2)
+
+        return cls(offsets, coordinates)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """
+        Retrieves the vertices of a polygon as an (n, 2) float64 view on the file.
+        """
+        if not -len(self) <= index < len(self): raise IndexError("polygon index out of range")
+        index %= len(self)
+
+        return self.coordinates[self.offsets[index]:self.offsets[index + 1]]
+
+
+def write_binary_polygons(path: str, polygons: Iterable[np.ndarray]) -> None:
+    """
+    Writes polygons, given as (n, 2) coordinate arrays, to a binary polygon file (see BinaryPolygons).
+    """
+    polygons = [np.asarray(polygon, dtype="<f8").reshape(-1, 2) for polygon in polygons]
+    offsets = np.zeros(len(polygons) + 1, dtype="<u8")
+    np.cumsum([len(polygon) for polygon in polygons], out=offsets[1:])
+
+    with open(path, "wb") as file:
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(polygons), int(offsets[-1])))
+        file.write(offsets.tobytes())
+        for polygon in polygons:
+            file.write(polygon.tobytes())
+
+
+def is_binary_polygon_file(path: str) -> bool:
+    """
+    Determines whether a file starts with the magic bytes of a binary polygon file.
+    """
+    with open(path, "rb") as file:
+        return file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def read_polygon_file(path: str) -> Iterator[np.ndarray]:
+    """
+    Iterates over the polygons of a binary or a text polygon file, as (n, 2) float64 arrays.
+
+    Polygons with fewer than 3 vertices are skipped in both formats.
+    """
+    if not is_binary_polygon_file(path):
+        yield from read_polygons(path)
+        return
+
+    for polygon in BinaryPolygons.open(path):
+        if len(polygon) >= 3: yield polygon
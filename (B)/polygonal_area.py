@@ -13,8 +13,20 @@ class PolygonalArea:
         """
         self.__polygons = polygons
 
+    def get_polygons(self):
+        """
+        Retrieves the polygons of the polygonal area.
+        """
+        return self.__polygons
+
     def get_edges(self):
         """
         Extracts all edges from the polygons in the polygonal area.
         """
-        return [Edge(poly[ind], poly[(ind + 1) % len(poly)]) for poly in self.__polygons for ind in range(len(poly))]
\ No newline at end of file
+        return [Edge(poly[ind], poly[(ind + 1) % len(poly)]) for poly in self.__polygons for ind in range(len(poly))]
+
+    def get_vertex_indices(self):
+        """
+        Maps each vertex to its index in the vertices of the polygonal area, numbered polygon after polygon.
+        """
+        return {vertex: index for index, vertex in enumerate(vertex for poly in self.__polygons for vertex in poly)}
\ No newline at end of file
@@ -1,18 +1,40 @@
 from __future__ import annotations
 import os
-from typing import List
-from PIL import Image, ImageDraw
-from tkinter import BOTH, LEFT, Button, Canvas, Event, Tk
-from tkinter.filedialog import askopenfilename
+import random
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List
+import numpy as np
+from PIL import Image, ImageColor
 from algorithms import *
+from incremental_triangulation import IncrementalTriangulation
+from polygon_io import read_polygon_file
 from polygonal_area import *
+from rasterizer import iter_tiles, rasterize_points, rasterize_segments, rasterize_triangles
+from segment_index import SegmentIndex
+from triangles_layer import TrianglesLayer
+
+if TYPE_CHECKING:
+    from tkinter import Event
 
 
 
 class PolygonalAreaDrawer:
-    def __init__(self, use_tkinter: bool = False, output_path: str = "output.png", canvas_size: tuple[int, int] = (800, 600)) -> None:
+    def __init__(self, use_tkinter: bool = False, output_path: str = "output.png", canvas_size: tuple[int, int] = (800, 600), incremental: bool = True, tile_size: int | None = None) -> None:
         """
         Initializes the PolygonalAreaDrawer.
+
+        In incremental mode (Tkinter only), closing a polygon inserts only its edges into the existing
+        decomposition and only the triangles that changed are added to or removed from the canvas.
+
+        In Tkinter mode, the triangulation runs on a worker thread so that the event loop never blocks. The main
+        thread polls the pending jobs with `root.after` and draws the resulting triangles progressively, a batch
+        of `triangles_per_batch` triangles at a time. The triangles are rasterized into a single image below the
+        polygons rather than drawn as one canvas item each (see TrianglesLayer), and removed triangles are erased by
+        filling again only the area they covered.
+
+        In PIL mode, the image is rasterized in tiles of `tile_size` pixels, each saved to its own file, so that
+        images larger than the memory can be rendered. The whole image is rendered at once when it is None.
         """
         self.use_tkinter = use_tkinter
         self.output_path = output_path
@@ -22,17 +44,36 @@ class PolygonalAreaDrawer:
         self.point_radius = 2
         self.polygons: List[Polygon] = []
         self.objects_ids_by_polygon: List[List[int]] = []  # For Tkinter
-        self.triangles_ids: List[int] = []  # For Tkinter
+        self.triangles_layer = TrianglesLayer()  # For Tkinter
+        self.triangles_photo = None  # For Tkinter
+        self.triangles_image_id: int | None = None  # For Tkinter
+        self.incremental = incremental  # For Tkinter
+        self.triangulation = IncrementalTriangulation()  # For Tkinter
+        self.triangulation_executor: ThreadPoolExecutor | None = None  # For Tkinter
+        self.triangulation_jobs: deque[Future] = deque()  # For Tkinter
+        self.triangles_to_draw: deque[Triangle] = deque()  # For Tkinter
+        self.triangles_removed_before_drawing: set[Triangle] = set()  # For Tkinter
+        self.triangles_per_batch = 1000  # For Tkinter
+        self.polling_interval_ms = 20  # For Tkinter
+        self.polling_id: str | None = None  # For Tkinter
         self.in_progress: bool = False  # For Tkinter
+        self.segment_index = SegmentIndex()  # For Tkinter
+        self.tile_size = tile_size  # For PIL
+        self.vertex_buffer: np.ndarray = np.empty((0, 2), dtype=np.float32)  # For PIL
+        self.polygon_sizes: np.ndarray = np.empty(0, dtype=np.int64)  # For PIL
+        self.margin = 20  # For PIL
         self.image = None  # For PIL
-        self.draw = None  # For PIL
 
         if self.use_tkinter:
+            # Tkinter is only imported in interactive mode, so that headless runs do not need it
+            from tkinter import BOTH, LEFT, Button, Canvas, Tk
+
             self.root = Tk()
             self.canvas = Canvas(self.root, bg="white")
             self.canvas.pack(fill=BOTH, expand=True)
             self.canvas.bind("<Button-1>", self._add_point_tkinter)
             self.canvas.bind("<Button-3>", self._close_polygon_tkinter)
+            self.canvas.bind("<Configure>", lambda _: self._redraw_triangles_tkinter())
             self.clear_button = Button(self.root, text="Clear", command=self._clear_tkinter, state="disabled")
             self.clear_button.pack(side=LEFT, padx=(20, 5), pady=10)
             self.load_button = Button(self.root, text="Load from File", command=self._load_from_file_tkinter)
@@ -54,70 +95,104 @@ class PolygonalAreaDrawer:
         Draws polygons and their triangulation to a PNG file using PIL.
         """
         if input_file:
-            try:
-                self.polygons = self._load_from_file(input_file)
-            except Exception as e:
-                raise
+            coordinate_arrays = list(read_polygon_file(input_file))
+            if not coordinate_arrays:
+                raise ValueError("No valid polygons found in file")
+            self.polygons = [[Vertex(x, y) for x, y in polygon.tolist()] for polygon in coordinate_arrays]
         elif polygons:
             self.polygons = [poly for poly in polygons if len(poly) >= 3]
             if not self.polygons:
                 raise ValueError("No valid polygons provided")
 
-        self._normalize_coordinates_pil()
+        if not input_file:
+            coordinate_arrays = [np.array([(vertex.x, vertex.y) for vertex in polygon]) for polygon in self.polygons]
 
-        try:
-            self.image = Image.new("RGB", self.canvas_size, "white")
-            self.draw = ImageDraw.Draw(self.image)
-        except Exception as e:
-            raise
+        triangles = triangulate_polygonal_area(PolygonalArea(self.polygons), as_indices=True)
+        self.draw_triangulation_pil(np.concatenate(coordinate_arrays), np.array([len(coordinates) for coordinates in coordinate_arrays]), triangles)
 
-        for i, polygon in enumerate(self.polygons):
-            if len(polygon) < 3:
-                continue
-            self._draw_polygon_pil(polygon)
+    def draw_triangulation_pil(self, coordinates: np.ndarray, polygon_sizes: np.ndarray, triangles: np.ndarray) -> None:
+        """
+        Draws polygons and a triangulation of them already computed to a PNG file using PIL, without triangulating.
+
+        Args:
+            coordinates (np.ndarray): The (n, 2) coordinates of the vertices, polygon after polygon.
+            polygon_sizes (np.ndarray): The number of vertices of each polygon.
+            triangles (np.ndarray): The (n_triangles, 3) indices of the vertices of the triangles into `coordinates`.
+        """
+        self._set_vertex_buffer_pil(coordinates, polygon_sizes)
+        offset = self._normalize_coordinates_pil()
+
+        sizes = self.polygon_sizes
+        starts = np.repeat(np.cumsum(sizes) - sizes, sizes)
+        indices = np.arange(len(self.vertex_buffer))
+        edges = np.column_stack((indices, starts + (indices - starts + 1) % np.repeat(sizes, sizes)))
+
+        # A triangle is filled with the average of the random colors of its vertices, drawn from the random module
+        # so that seeding it reproduces the image
+        vertex_colors = np.random.default_rng(random.getrandbits(64)).integers(100, 256, size=(len(self.vertex_buffer), 3))
+        triangle_colors = (vertex_colors[triangles].sum(axis=1) // 3).astype(np.uint8)
 
-        self._triangulate()
+        output_dir = os.path.dirname(self.output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
 
-        try:
-            output_dir = os.path.dirname(self.output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            self.image.save(self.output_path, "PNG")
-        except Exception as e:
-            raise
+        for x0, y0, width, height in iter_tiles(*self.canvas_size, self.tile_size):
+            tile = np.full((height, width, 3), 255, dtype=np.uint8)
+            self._render_tile_pil(tile, (x0 - offset[0], y0 - offset[1]), self.vertex_buffer, edges, triangles, triangle_colors)
+            self.image = Image.fromarray(tile)
+            self.image.save(self._get_tile_path_pil(x0, y0), "PNG")
 
-    def _normalize_coordinates_pil(self) -> None:
+    def _render_tile_pil(self, tile: np.ndarray, origin: tuple[float, float], coordinates: np.ndarray, edges: np.ndarray, triangles: np.ndarray, triangle_colors: np.ndarray) -> None:
         """
-        Normalizes polygon coordinates to fit within the canvas with a margin (PIL mode).
+        Rasterizes the vertices and edges of the polygons, then their triangles, into a tile of the image (PIL mode).
+        Each layer is drawn in a single vectorized pass. The origin is the top left corner of the tile in the
+        coordinates of the polygons, so the normalization is applied on the fly by the rasterizer.
         """
-        if not self.polygons:
-            return
+        rasterize_points(tile, coordinates, self.point_radius, ImageColor.getrgb(self.point_color), origin)
+        rasterize_segments(tile, coordinates, edges, ImageColor.getrgb(self.line_color), origin)
+        rasterize_triangles(tile, coordinates, triangles, triangle_colors, origin)
 
-        margin = 20
-        all_vertices = [v for polygon in self.polygons for v in polygon]
-        if not all_vertices:
-            raise ValueError("No vertices to normalize")
+    def _get_tile_path_pil(self, x0: int, y0: int) -> str:
+        """
+        Retrieves the file of the tile whose top left corner is (x0, y0): the output path for a single tile,
+        otherwise the output path suffixed with the row and the column of the tile.
+        """
+        if self.tile_size is None:
+            return self.output_path
 
-        try:
-            min_x = min(v.x for v in all_vertices)
-            min_y = min(v.y for v in all_vertices)
-            max_x = max(v.x for v in all_vertices)
-            max_y = max(v.y for v in all_vertices)
-        except Exception as e:
-            raise
+        root, extension = os.path.splitext(self.output_path)
+        return f"{root}_{y0 // self.tile_size}_{x0 // self.tile_size}{extension}"
 
-        for polygon in self.polygons:
-            for vertex in polygon:
-                vertex.x = vertex.x - min_x + margin
-                vertex.y = vertex.y - min_y + margin
+    def _set_vertex_buffer_pil(self, coordinates: np.ndarray, polygon_sizes: np.ndarray) -> None:
+        """
+        Stores the vertices of the polygons, polygon after polygon, in a contiguous float32 array, along with the
+        number of vertices of each polygon (PIL mode). The Vertex objects of the polygons are left untouched.
+        """
+        self.vertex_buffer = np.ascontiguousarray(coordinates, dtype=np.float32)
+        self.polygon_sizes = np.asarray(polygon_sizes, dtype=np.int64)
+
+    def _normalize_coordinates_pil(self) -> np.ndarray:
+        """
+        Computes the translation that fits the polygons within the canvas with a margin, and grows the canvas to
+        their bounding box if needed (PIL mode). The vertices themselves are not modified.
+
+        Returns:
+            np.ndarray: The offset to add to the coordinates of the vertices to get their pixel coordinates.
+        """
+        if not len(self.vertex_buffer):
+            raise ValueError("No vertices to normalize")
+
+        min_corner = self.vertex_buffer.min(axis=0).astype(np.float64)
+        max_corner = self.vertex_buffer.max(axis=0).astype(np.float64)
 
-        content_width = max_x - min_x + 2 * margin
-        content_height = max_y - min_y + 2 * margin
+        content_width, content_height = max_corner - min_corner + 2 * self.margin
         self.canvas_size = (
             max(self.canvas_size[0], int(content_width)),
             max(self.canvas_size[1], int(content_height))
         )
 
+        return self.margin - min_corner
+
     def _add_point_tkinter(self, event: Event) -> None:
         """
         Adds a vertex to the current polygon in Tkinter mode.
@@ -134,9 +209,11 @@ class PolygonalAreaDrawer:
             self._update_buttons_tkinter()
 
         self.polygons[-1].append(new_point)
+        self.segment_index.insert_point(new_point)
         self._draw_point_tkinter(new_point)
 
         if len(self.polygons[-1]) > 1:
+            self.segment_index.insert_segment(self.polygons[-1][-2], self.polygons[-1][-1])
             self._draw_line_tkinter(self.polygons[-1][-2], self.polygons[-1][-1])
 
     def _close_polygon_tkinter(self, _: Event) -> None:
@@ -146,18 +223,23 @@ class PolygonalAreaDrawer:
         if not self.in_progress or len(self.polygons[-1]) < 3 or self._draws_intersecting_lines(self.polygons[-1]):
             return
 
+        self.segment_index.insert_segment(self.polygons[-1][-1], self.polygons[-1][0])
         self._draw_line_tkinter(self.polygons[-1][-1], self.polygons[-1][0])
         self.in_progress = False
-        self._triangulate()
+        self._triangulate_in_background([self.polygons[-1]])
 
     def _clear_tkinter(self) -> None:
         """
         Clears all polygons and drawings in Tkinter mode.
         """
+        self._cancel_triangulation_jobs_tkinter()
         self.canvas.delete("all")
         self.polygons = []
         self.objects_ids_by_polygon = []
-        self.triangles_ids = []
+        self.triangles_image_id = None
+        self.triangles_layer = TrianglesLayer()
+        self.triangulation = IncrementalTriangulation()
+        self.segment_index = SegmentIndex()
         self.in_progress = False
         self._update_buttons_tkinter()
 
@@ -172,7 +254,9 @@ class PolygonalAreaDrawer:
         """
         Loads polygons from a file in Tkinter mode.
         """
-        filepath = askopenfilename(filetypes=[("Text Files", "*.txt")])
+        from tkinter.filedialog import askopenfilename
+
+        filepath = askopenfilename(filetypes=[("Text Files", "*.txt"), ("Binary Polygon Files", "*.bin")])
         if not filepath:
             return
 
@@ -193,38 +277,20 @@ class PolygonalAreaDrawer:
             for i in range(len(normalized)):
                 self._draw_line_tkinter(normalized[i], normalized[(i + 1) % len(normalized)])
 
-        self._triangulate()
+        self._build_segment_index()
+        self._triangulate_in_background(self.polygons)
         self._update_buttons_tkinter()
 
     def _load_from_file(self, filepath: str) -> List[Polygon]:
         """
         Loads polygons from a file (shared by both modes).
 
+        Text files are streamed and parsed in bulk, binary polygon files are memory-mapped (see `polygon_io.read_polygon_file`).
+
         Returns:
             List[Polygon]: List of loaded polygons.
         """
-        polygons = []
-        current_polygon: List[Vertex] = []
-
-        try:
-            with open(filepath, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        if current_polygon and len(current_polygon) >= 3:
-                            polygons.append(current_polygon)
-                        current_polygon = []
-                        continue
-                    try:
-                        x, y = map(float, line.split())
-                        current_polygon.append(Vertex(x, y))
-                    except ValueError as e:
-                        continue
-        except Exception as e:
-            raise
-
-        if current_polygon and len(current_polygon) >= 3:
-            polygons.append(current_polygon)
+        polygons = [[Vertex(x, y) for x, y in polygon.tolist()] for polygon in read_polygon_file(filepath)]
 
         if not polygons:
             raise ValueError("No valid polygons found in file")
@@ -254,144 +320,199 @@ class PolygonalAreaDrawer:
         )
         self.objects_ids_by_polygon[-1].append(line_id)
 
-    def _draw_point_pil(self, point: Vertex) -> None:
+    def _draw_triangles_tkinter(self, triangles: List[Triangle]) -> None:
         """
-        Draws a vertex in PIL mode.
+        Draws triangles in Tkinter mode, all at once into the image of the triangles.
         """
-        try:
-            self.draw.ellipse(
-                (
-                    point.x - self.point_radius,
-                    point.y - self.point_radius,
-                    point.x + self.point_radius,
-                    point.y + self.point_radius
-                ),
-                fill=self.point_color
-            )
-        except Exception as e:
-            raise
+        if self.triangles_layer.image.shape[:2] != (self.canvas.winfo_height(), self.canvas.winfo_width()):
+            self.triangles_layer.resize(self.canvas.winfo_width(), self.canvas.winfo_height())
 
-    def _draw_line_pil(self, pt_a: Vertex, pt_b: Vertex) -> None:
+        self.triangles_layer.add(triangles)
+        self._show_triangles_tkinter()
+
+    def _redraw_triangles_tkinter(self) -> None:
         """
-        Draws a line in PIL mode.
+        Draws all the drawn triangles again into a blank image as large as the canvas (Tkinter mode).
         """
-        try:
-            self.draw.line(
-                (pt_a.x, pt_a.y, pt_b.x, pt_b.y),
-                fill=self.line_color
-            )
-        except Exception as e:
-            raise
+        self.triangles_layer.resize(self.canvas.winfo_width(), self.canvas.winfo_height())
+        self._show_triangles_tkinter()
 
-    def _draw_polygon_pil(self, polygon: Polygon) -> None:
+    def _show_triangles_tkinter(self) -> None:
         """
-        Draws a polygon in PIL mode.
+        Displays the image of the triangles below the polygons, as a single canvas item (Tkinter mode).
         """
-        for vertex in polygon:
-            self._draw_point_pil(vertex)
-        for i in range(len(polygon)):
-            self._draw_line_pil(polygon[i], polygon[(i + 1) % len(polygon)])
+        from tkinter import PhotoImage
+
+        height, width = self.triangles_layer.image.shape[:2]
+        if not height or not width:
+            return
+
+        # PPM is the raw RGB format Tk reads natively, so the image needs no conversion
+        self.triangles_photo = PhotoImage(data=b"P6 %d %d 255\n" % (width, height) + self.triangles_layer.image.tobytes(), format="PPM")
+
+        if self.triangles_image_id is None:
+            self.triangles_image_id = self.canvas.create_image(0, 0, anchor="nw", image=self.triangles_photo)
+            self.canvas.tag_lower(self.triangles_image_id)
+        else:
+            self.canvas.itemconfigure(self.triangles_image_id, image=self.triangles_photo)
 
-    def _draw_triangle_tkinter(self, triangle: Triangle) -> None:
+    def _triangulate_in_background(self, new_polygons: List[Polygon]) -> None:
         """
-        Draws a triangle in Tkinter mode.
+        Submits the triangulation of the polygons to the worker thread (Tkinter mode).
+
+        In incremental mode, the job adds the new polygons to the kept triangulation and all jobs are applied in
+        order. Otherwise, the job triangulates all the polygons again and supersedes the jobs still pending.
         """
-        pt1, pt2, pt3 = triangle.vertices
-        color = triangle.color_str
-        triangle_id = self.canvas.create_polygon(
-            pt1.x, pt1.y, pt2.x, pt2.y, pt3.x, pt3.y,
-            fill=color, outline=color, width=1
-        )
-        self.canvas.tag_lower(triangle_id)
-        self.triangles_ids.append(triangle_id)
+        if self.triangulation_executor is None:
+            self.triangulation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="triangulation")
+
+        if self.incremental:
+            job = self.triangulation_executor.submit(self.triangulation.add_polygons, [list(polygon) for polygon in new_polygons])
+        else:
+            for stale_job in self.triangulation_jobs: stale_job.cancel()
+            self.triangulation_jobs.clear()
+            job = self.triangulation_executor.submit(triangulate_all_polygons, [list(polygon) for polygon in self.polygons])
+
+        self.triangulation_jobs.append(job)
+        self._schedule_polling_tkinter()
 
-    def _draw_triangle_pil(self, triangle: Triangle) -> None:
+    def _schedule_polling_tkinter(self) -> None:
         """
-        Draws a triangle in PIL mode.
+        Schedules the next poll of the triangulation jobs, unless one is already scheduled (Tkinter mode).
         """
-        pt1, pt2, pt3 = triangle.vertices
-        color = triangle.color_str
-        # Validate color
-        if not isinstance(color, str) or not (color.startswith("#") or color in ImageDraw.ImageDraw.fill.__dict__):
-            color = "lightblue"
-        try:
-            self.draw.polygon(
-                [(pt1.x, pt1.y), (pt2.x, pt2.y), (pt3.x, pt3.y)],
-                fill=color, outline=color
-            )
-        except Exception as e:
-            raise
+        if self.polling_id is None:
+            self.polling_id = self.root.after(self.polling_interval_ms, self._poll_triangulation_jobs_tkinter)
 
-    def _clear_triangulation_tkinter(self) -> None:
+    def _poll_triangulation_jobs_tkinter(self) -> None:
         """
-        Clears triangulation in Tkinter mode.
+        Applies the results of the finished triangulation jobs, in submission order, and draws the next batch of
+        triangles (Tkinter mode).
+
+        A job that failed is dropped and its error is shown to the user, and the polling goes on with the next jobs.
         """
-        for triangle_id in self.triangles_ids:
-            self.canvas.delete(triangle_id)
-        self.triangles_ids = []
+        self.polling_id = None
+        erased_triangles = []
+        applied = False
+
+        while self.triangulation_jobs and self.triangulation_jobs[0].done():
+            job = self.triangulation_jobs.popleft()
+            if job.cancelled(): continue
+
+            try:
+                added_triangles, removed_triangles = job.result()
+            except Exception as error:
+                self._report_triangulation_error_tkinter(error)
+                continue
+
+            applied = True
+
+            # A full result supersedes the previous one, including its triangles not drawn yet
+            if removed_triangles is None:
+                self.triangles_layer.clear()
+                self.triangles_to_draw.clear()
+                self.triangles_removed_before_drawing.clear()
+                erased_triangles = []
+                removed_triangles = []
+
+            for triangle in removed_triangles:
+                if triangle in self.triangles_layer.slots: erased_triangles.append(triangle)
+                else: self.triangles_removed_before_drawing.add(triangle)
+
+            self.triangles_to_draw.extend(added_triangles)
 
-    def _triangulate(self) -> None:
+        batch = []
+        for _ in range(min(self.triangles_per_batch, len(self.triangles_to_draw))):
+            triangle = self.triangles_to_draw.popleft()
+            if triangle in self.triangles_removed_before_drawing: self.triangles_removed_before_drawing.discard(triangle)
+            else: batch.append(triangle)
+
+        # Only the area covered by the erased triangles is filled again
+        self.triangles_layer.remove(erased_triangles)
+        if batch or applied: self._draw_triangles_tkinter(batch)
+
+        if self.triangulation_jobs or self.triangles_to_draw:
+            self._schedule_polling_tkinter()
+
+    def _report_triangulation_error_tkinter(self, error: Exception) -> None:
         """
-        Performs triangulation and draws the resulting triangles.
+        Shows the error raised by a triangulation job in a dialog (Tkinter mode).
         """
-        try:
-            polygonal_area = PolygonalArea(self.polygons)
-            triangles = triangulate_polygonal_area(polygonal_area)
-        except Exception as e:
-            raise
+        from tkinter.messagebox import showerror
 
-        if self.use_tkinter:
-            self._clear_triangulation_tkinter()
+        showerror("Triangulation failed", f"The polygons could not be triangulated: {error}", parent=self.root)
 
-        for i, triangle in enumerate(triangles):
-            if self.use_tkinter:
-                self._draw_triangle_tkinter(triangle)
-            else:
-                self._draw_triangle_pil(triangle)
+    def _cancel_triangulation_jobs_tkinter(self) -> None:
+        """
+        Drops every pending triangulation job and the triangles not drawn yet (Tkinter mode).
 
-    def _is_same_as_another_point(self, new_point: Vertex) -> bool:
+        A job already running cannot be interrupted, but it runs on the previous executor and against the previous
+        triangulation, and its result is never applied.
         """
-        Checks if a point is the same as any existing point.
+        if self.triangulation_executor is not None:
+            self.triangulation_executor.shutdown(wait=False, cancel_futures=True)
+            self.triangulation_executor = None
+
+        if self.polling_id is not None:
+            self.root.after_cancel(self.polling_id)
+            self.polling_id = None
+
+        self.triangulation_jobs.clear()
+        self.triangles_to_draw.clear()
+        self.triangles_removed_before_drawing.clear()
+
+    def _build_segment_index(self) -> None:
         """
+        Indexes the vertices and edges of all the (closed) polygons, with grid cells about as large as the average edge.
+        """
+        edges = [(polygon[i], polygon[(i + 1) % len(polygon)]) for polygon in self.polygons for i in range(len(polygon))]
+        average_length = sum(math.dist((pt_a.x, pt_a.y), (pt_b.x, pt_b.y)) for pt_a, pt_b in edges) / len(edges) if edges else 0.0
+        self.segment_index = SegmentIndex(cell_size=max(average_length, 1.0))
+
         for polygon in self.polygons:
             for point in polygon:
-                if math.isclose(new_point.x, point.x) and math.isclose(new_point.y, point.y):
-                    return True
+                self.segment_index.insert_point(point)
+        for pt_a, pt_b in edges:
+            self.segment_index.insert_segment(pt_a, pt_b)
+
+    def _is_same_as_another_point(self, new_point: Vertex) -> bool:
+        """
+        Checks if a point is the same as any existing point, looking only at the points indexed around it.
+        """
+        for point in self.segment_index.get_points_near(new_point.x, new_point.y):
+            if math.isclose(new_point.x, point.x) and math.isclose(new_point.y, point.y):
+                return True
         return False
 
     def _draws_intersecting_lines(self, polygon: Polygon | None, new_pt: Vertex | None = None) -> bool:
         """
         Checks if adding a new point or closing a polygon results in intersecting lines.
+
+        Only the edges indexed in the cells crossed by the new line are tested. The edges of the polygon being
+        drawn are indexed as they are drawn, and the line to the first vertex only when the polygon is closed.
         """
-        if polygon is None:
-            beg_new_line = None
-        elif len(polygon) < 1:
+        # If starting a new polygon (no previous points yet), there is nothing to check
+        if polygon is None or len(polygon) < 1:
             return False
-        else:
-            beg_new_line = polygon[-1]
 
-        # If starting a new polygon (no previous points yet)
-        if beg_new_line is None:
-            return False  # Nothing to check
+        beg_new_line = polygon[-1]
+        new_pt = polygon[0] if new_pt is None else new_pt
 
-        closing = new_pt is None
-        new_pt = polygon[0] if closing else new_pt
-
-        for polygon_idx, other_polygon in enumerate(self.polygons):
-            # Don't check against last polygon while it's still being drawn
-            is_current_polygon = polygon in self.polygons and polygon_idx == len(self.polygons) - 1
-            beg = 1 if is_current_polygon and closing else 0
-            end_offset = 2 if is_current_polygon else 0
+        for pt_a, pt_b in self.segment_index.get_segments_near(beg_new_line, new_pt):
+            # Prevent checking adjacency (edge sharing point)
+            if beg_new_line in (pt_a, pt_b) or new_pt in (pt_a, pt_b):
+                continue
 
-            for pt_index in range(beg, len(other_polygon) - end_offset):
-                pt_a = other_polygon[pt_index]
-                pt_b = other_polygon[(pt_index + 1) % len(other_polygon)]
+            if segment_intersect(pt_a, pt_b, beg_new_line, new_pt):
+                return True
 
-                # Prevent checking adjacency (edge sharing point)
-                if beg_new_line in (pt_a, pt_b) or new_pt in (pt_a, pt_b):
-                    continue
+        return False
 
-                if segment_intersect(pt_a, pt_b, beg_new_line, new_pt):
-                    return True
+def triangulate_all_polygons(polygons: List[Polygon]) -> tuple[list[Triangle], None]:
+    """
+    Triangulates all the polygons from scratch. This is the job run on the worker thread outside incremental mode.
 
-        return False
+    Returns:
+        tuple[list[Triangle], None]: The triangles, and None as removed triangles since they replace the whole
+        previous triangulation.
+    """
+    return triangulate_polygonal_area(PolygonalArea(polygons)), None
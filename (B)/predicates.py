@@ -0,0 +1,181 @@
+from contextlib import contextmanager
+from fractions import Fraction
+
+ORIENTATION_ERROR_BOUND = (3 + 16 * 2.0 ** -53) * 2.0 ** -53
+
+class PredicateCounters:
+    """
+    Counts the evaluations of the geometric predicates, to measure the work done per inserted edge. The predicates
+    only count their evaluations within a `counting_predicates` block.
+    """
+    def __init__(self):
+        """
+        Initializes all counters to zero.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Resets all counters to zero.
+        """
+        self.is_above = 0
+        self.is_right_of_edge = 0
+        self.orientation = 0
+        self.orientation_exact = 0
+
+    def get_total(self):
+        """
+        Returns the total number of predicate evaluations.
+        """
+        return self.is_above + self.is_right_of_edge + self.orientation
+
+    def get_exact_ratio(self):
+        """
+        Returns the fraction of orientation tests that needed the exact arithmetic fallback.
+        """
+        return self.orientation_exact / self.orientation if self.orientation else 0.0
+
+# The counters incremented by the predicates while counting is set
+predicate_counters = PredicateCounters()
+counting = False
+
+@contextmanager
+def counting_predicates():
+    """
+    Counts the evaluations of the geometric predicates within the block.
+
+    The predicates increment the module counters only while the module flag `counting` is set, so outside the block
+    they pay a single global lookup. The counters are shared by the whole process, so this is meant for benchmarks,
+    not for code running alongside other threads.
+
+    Yields:
+        PredicateCounters: The module counters, reset on entry.
+    """
+    global counting
+
+    was_counting = counting
+    predicate_counters.reset()
+    counting = True
+
+    try:
+        yield predicate_counters
+    finally:
+        counting = was_counting
+
+def x_on_edge(edge, y):
+    """
+    Calculates the x-coordinate on the supporting line of an edge corresponding to a given y-coordinate.
+
+    If the edge is horizontal (both vertices have the same y-coordinate), the
+    average of the x-coordinates of the two vertices is returned.
+    """
+    bottom_vertex = edge.bottom_vertex
+    top_vertex = edge.top_vertex
+
+    if bottom_vertex.y == top_vertex.y:
+        return (bottom_vertex.x + top_vertex.x) / 2
+
+    t = (y - bottom_vertex.y) / (top_vertex.y - bottom_vertex.y)
+    return bottom_vertex.x + t * (top_vertex.x - bottom_vertex.x)
+
+def orientation(ax, ay, bx, by, cx, cy):
+    """
+    Returns the orientation of the triangle (a, b, c): 1 if counter-clockwise, -1 if clockwise and 0 if the
+    three points are collinear.
+
+    The determinant is first evaluated in floating point and its sign is trusted when it exceeds the forward
+    error bound of that evaluation. Otherwise the sign is recomputed exactly with rational arithmetic.
+    """
+    if counting: predicate_counters.orientation += 1
+
+    det_left = (bx - ax) * (cy - ay)
+    det_right = (by - ay) * (cx - ax)
+    det = det_left - det_right
+    error_bound = ORIENTATION_ERROR_BOUND * (abs(det_left) + abs(det_right))
+
+    if det > error_bound: return 1
+    if -det > error_bound: return -1
+
+    return exact_orientation(ax, ay, bx, by, cx, cy)
+
+def exact_orientation(ax, ay, bx, by, cx, cy):
+    """
+    Returns the orientation of the triangle (a, b, c) computed without any rounding error.
+    """
+    if counting: predicate_counters.orientation_exact += 1
+
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    det = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    return (det > 0) - (det < 0)
+
+def is_right_of_edge(edge, x, y):
+    """
+    Determines if the point (x, y) is to the right of the edge at the point's y-coordinate.
+
+    For a horizontal edge, the point is compared with the middle of the edge.
+    """
+    if counting: predicate_counters.is_right_of_edge += 1
+
+    bottom_vertex = edge.bottom_vertex
+    top_vertex = edge.top_vertex
+
+    if bottom_vertex.y == top_vertex.y:
+        return x > (bottom_vertex.x + top_vertex.x) / 2
+
+    return orientation(bottom_vertex.x, bottom_vertex.y, top_vertex.x, top_vertex.y, x, y) < 0
+
+def is_right_of_edge_at_side(edge, side_edge, y):
+    """
+    Determines if the point of the supporting line of `side_edge` at the y-coordinate y is to the right of the edge,
+    as is_right_of_edge(edge, x_on_edge(side_edge, y), y) would if x_on_edge were computed without rounding.
+
+    The test is first evaluated in floating point, with an error bound that also covers the rounding of the
+    interpolated x-coordinate. Otherwise the sign is recomputed exactly with the x-coordinate kept rational.
+    """
+    if counting: predicate_counters.is_right_of_edge += 1
+
+    x = x_on_edge(side_edge, y)
+    x_error = 8 * 2.0 ** -53 * (abs(x) + abs(x - side_edge.bottom_vertex.x))
+
+    bottom_vertex = edge.bottom_vertex
+    top_vertex = edge.top_vertex
+
+    if bottom_vertex.y == top_vertex.y:
+        middle_x = (bottom_vertex.x + top_vertex.x) / 2
+        if abs(x - middle_x) > x_error + 2.0 ** -52 * abs(middle_x): return x > middle_x
+
+        return exact_x_on_edge(side_edge, y) > (Fraction(bottom_vertex.x) + Fraction(top_vertex.x)) / 2
+
+    if counting: predicate_counters.orientation += 1
+
+    det_left = (top_vertex.x - bottom_vertex.x) * (y - bottom_vertex.y)
+    det_right = (top_vertex.y - bottom_vertex.y) * (x - bottom_vertex.x)
+    det = det_left - det_right
+    error_bound = ORIENTATION_ERROR_BOUND * (abs(det_left) + abs(det_right)) + 2 * abs(top_vertex.y - bottom_vertex.y) * x_error
+
+    if det > error_bound: return False
+    if -det > error_bound: return True
+
+    return exact_orientation(bottom_vertex.x, bottom_vertex.y, top_vertex.x, top_vertex.y, exact_x_on_edge(side_edge, y), y) < 0
+
+def exact_x_on_edge(edge, y):
+    """
+    Calculates without any rounding error the x-coordinate that x_on_edge approximates, as a Fraction.
+    """
+    bottom_x, bottom_y = Fraction(edge.bottom_vertex.x), Fraction(edge.bottom_vertex.y)
+    top_x, top_y = Fraction(edge.top_vertex.x), Fraction(edge.top_vertex.y)
+
+    if bottom_y == top_y:
+        return (bottom_x + top_x) / 2
+
+    return bottom_x + (Fraction(y) - bottom_y) / (top_y - bottom_y) * (top_x - bottom_x)
+
+def is_above(x, y, other_x, other_y):
+    """
+    Determines if the point (x, y) is above the point (other_x, other_y), ties on the y-coordinate
+    being broken by the x-coordinate.
+    """
+    if counting: predicate_counters.is_above += 1
+
+    return y > other_y or (y == other_y and x > other_x)
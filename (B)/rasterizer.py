@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+# Upper bound on the number of rows or pixels expanded at once, which bounds the memory of the temporary arrays
+CHUNK_SIZE = 1 << 20
+
+
+def iter_tiles(width: int, height: int, tile_size: int | None = None) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Splits an image into tiles, row after row.
+
+    Yields:
+        tuple[int, int, int, int]: The x and y pixel coordinates of the top left corner of each tile, its width and
+        its height. A single tile covers the whole image when `tile_size` is None.
+    """
+    tile_width, tile_height = (width, height) if tile_size is None else (tile_size, tile_size)
+
+    for y0 in range(0, height, tile_height):
+        for x0 in range(0, width, tile_width):
+            yield x0, y0, min(tile_width, width - x0), min(tile_height, height - y0)
+
+
+def iter_chunks(counts: np.ndarray, chunk_size: int = CHUNK_SIZE) -> Iterator[slice]:
+    """
+    Splits a sequence of items into consecutive slices whose counts sum to at most `chunk_size`, or to the count
+    of a single item when it exceeds it.
+    """
+    ends = np.cumsum(counts)
+    start = 0
+
+    while start < len(counts):
+        offset = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, offset + chunk_size, side="right")), start + 1)
+        yield slice(start, stop)
+        start = stop
+
+
+def expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Expands ranges of integers in a single pass: starts[i], starts[i] + 1, ..., starts[i] + counts[i] - 1 for each
+    range i in turn. The values attached to each range are expanded alongside with np.repeat(values, counts).
+    """
+    range_offsets = np.cumsum(counts) - counts
+    return np.arange(range_offsets[-1] + counts[-1] if len(counts) else 0) + np.repeat(starts - range_offsets, counts)
+
+
+def rasterize_triangles(tile: np.ndarray, coordinates: np.ndarray, triangles: np.ndarray, colors: np.ndarray, origin: tuple[int, int] = (0, 0)) -> None:
+    """
+    Fills triangles into an RGB tile by scanlines, all the triangles at once.
+
+    A pixel is filled when its center lies in a triangle, with the usual top-left rule on the edges, so that the
+    triangles of a triangulation cover each pixel of the area exactly once. Each triangle is split at its middle
+    vertex into two halves bounded by two straight edges, so each row of a half spans between two lines.
+
+    Args:
+        tile (np.ndarray): The (height, width, 3) uint8 tile, modified in place.
+        coordinates (np.ndarray): The (n, 2) pixel coordinates of the vertices in the whole image.
+        triangles (np.ndarray): The (n_triangles, 3) vertex indices of the triangles.
+        colors (np.ndarray): The (n_triangles, 3) uint8 colors of the triangles.
+        origin (tuple[int, int]): The pixel coordinates of the top left corner of the tile in the whole image.
+    """
+    height, width = tile.shape[:2]
+    corners = coordinates[triangles] - origin
+
+    visible = ((corners[..., 0].max(axis=1) > 0) & (corners[..., 0].min(axis=1) < width)
+               & (corners[..., 1].max(axis=1) > 0) & (corners[..., 1].min(axis=1) < height))
+    corners, colors = corners[visible], colors[visible]
+
+    # Corners sorted by y-coordinate, and the lines x = a + b * y along the edges
+    corners = np.take_along_axis(corners, np.argsort(corners[..., 1], axis=1)[..., None], axis=1)
+    (x0, x1, x2), (y0, y1, y2) = corners[..., 0].T, corners[..., 1].T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = np.stack(((x2 - x0) / (y2 - y0), (x1 - x0) / (y1 - y0), (x2 - x1) / (y2 - y1)))
+    intercepts = np.stack((x0, x0, x1)) - slopes * np.stack((y0, y0, y1))
+
+    # The halves above and below the middle vertex, the long edge being on the right when the middle vertex is left of it
+    long_on_right = x1 < intercepts[0] + slopes[0] * y1
+    half_y = (np.concatenate((y0, y1)), np.concatenate((y1, y2)))
+    half_long_on_right = np.tile(long_on_right, 2)
+    half_colors = np.tile(colors, (2, 1))
+
+    short_intercepts, short_slopes = np.concatenate((intercepts[1], intercepts[2])), np.concatenate((slopes[1], slopes[2]))
+    long_intercepts, long_slopes = np.tile(intercepts[0], 2), np.tile(slopes[0], 2)
+
+    left_intercepts = np.where(half_long_on_right, short_intercepts, long_intercepts)
+    left_slopes = np.where(half_long_on_right, short_slopes, long_slopes)
+    right_intercepts = np.where(half_long_on_right, long_intercepts, short_intercepts)
+    right_slopes = np.where(half_long_on_right, long_slopes, short_slopes)
+
+    # Rows whose centers lie in each half, clipped to the tile
+    first_rows = np.clip(np.ceil(half_y[0] - 0.5), 0, height).astype(np.int64)
+    last_rows = np.clip(np.ceil(half_y[1] - 0.5), 0, height).astype(np.int64)
+    row_counts = np.maximum(last_rows - first_rows, 0)
+    pixels = tile.reshape(-1, 3)
+
+    for chunk in iter_chunks(row_counts):
+        counts = row_counts[chunk]
+        rows = expand_ranges(first_rows[chunk], counts)
+        centers_y = rows + 0.5
+
+        lefts = np.repeat(left_intercepts[chunk], counts) + np.repeat(left_slopes[chunk], counts) * centers_y
+        rights = np.repeat(right_intercepts[chunk], counts) + np.repeat(right_slopes[chunk], counts) * centers_y
+
+        first_columns = np.clip(np.ceil(lefts - 0.5), 0, width).astype(np.int64)
+        last_columns = np.clip(np.ceil(rights - 0.5), 0, width).astype(np.int64)
+        lengths = np.maximum(last_columns - first_columns, 0)
+        span_colors = np.repeat(half_colors[chunk], counts, axis=0)
+
+        for span_chunk in iter_chunks(lengths):
+            span_lengths = lengths[span_chunk]
+            columns = expand_ranges(first_columns[span_chunk], span_lengths)
+            pixels[np.repeat(rows[span_chunk] * width, span_lengths) + columns] = np.repeat(span_colors[span_chunk], span_lengths, axis=0)
+
+
+def rasterize_segments(tile: np.ndarray, coordinates: np.ndarray, segments: np.ndarray, color: tuple[int, int, int], origin: tuple[int, int] = (0, 0)) -> None:
+    """
+    Draws one-pixel wide segments into an RGB tile, all the segments at once, by sampling each segment once per
+    pixel along its major axis.
+
+    Args:
+        tile (np.ndarray): The (height, width, 3) uint8 tile, modified in place.
+        coordinates (np.ndarray): The (n, 2) pixel coordinates of the vertices in the whole image.
+        segments (np.ndarray): The (n_segments, 2) vertex indices of the ends of the segments.
+        color (tuple[int, int, int]): The RGB color of the segments.
+        origin (tuple[int, int]): The pixel coordinates of the top left corner of the tile in the whole image.
+    """
+    height, width = tile.shape[:2]
+    ends = coordinates[segments] - origin
+
+    visible = ((ends[..., 0].max(axis=1) >= 0) & (ends[..., 0].min(axis=1) < width + 1)
+               & (ends[..., 1].max(axis=1) >= 0) & (ends[..., 1].min(axis=1) < height + 1))
+    ends = ends[visible]
+
+    steps = np.ceil(np.abs(ends[:, 1] - ends[:, 0]).max(axis=1)).astype(np.int64) + 1
+    increments = (ends[:, 1] - ends[:, 0]) / np.maximum(steps - 1, 1)[:, None]
+    pixels = tile.reshape(-1, 3)
+
+    for chunk in iter_chunks(steps):
+        counts = steps[chunk]
+        samples = expand_ranges(np.zeros(len(counts), dtype=np.int64), counts)
+
+        points = np.floor(np.repeat(ends[chunk, 0], counts, axis=0) + np.repeat(increments[chunk], counts, axis=0) * samples[:, None]).astype(np.int64)
+        inside = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+        pixels[points[inside, 1] * width + points[inside, 0]] = color
+
+
+def rasterize_points(tile: np.ndarray, coordinates: np.ndarray, radius: int, color: tuple[int, int, int], origin: tuple[int, int] = (0, 0)) -> None:
+    """
+    Draws filled discs of `radius` pixels around points into an RGB tile, all the points at once.
+
+    Args:
+        tile (np.ndarray): The (height, width, 3) uint8 tile, modified in place.
+        coordinates (np.ndarray): The (n, 2) pixel coordinates of the points in the whole image.
+        radius (int): The radius of the discs, in pixels.
+        color (tuple[int, int, int]): The RGB color of the discs.
+        origin (tuple[int, int]): The pixel coordinates of the top left corner of the tile in the whole image.
+    """
+    height, width = tile.shape[:2]
+    centers = np.floor(coordinates - origin).astype(np.int64)
+    centers = centers[(centers[:, 0] >= -radius) & (centers[:, 0] < width + radius) & (centers[:, 1] >= -radius) & (centers[:, 1] < height + radius)]
+
+    offsets_y, offsets_x = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+    in_disc = offsets_x ** 2 + offsets_y ** 2 <= radius * radius + radius
+    offsets = np.column_stack((offsets_x[in_disc], offsets_y[in_disc]))
+
+    pixels = tile.reshape(-1, 3)
+    chunk_points = max(CHUNK_SIZE // len(offsets), 1)
+
+    for start in range(0, len(centers), chunk_points):
+        points = (centers[start:start + chunk_points, None] + offsets).reshape(-1, 2)
+        inside = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+        pixels[points[inside, 1] * width + points[inside, 0]] = color
+
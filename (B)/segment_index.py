@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterator
+
+from vertex import Vertex
+
+Segment = tuple[Vertex, Vertex]
+Cell = tuple[int, int]
+
+ROW_TOLERANCE = 1e-9
+
+
+class SegmentIndex:
+    """
+    Uniform grid over the plane indexing points and segments by the cells they cover.
+
+    Each point is stored in the cell containing it and each segment in every cell its line crosses, so the
+    neighborhood of a point or the candidate intersections of a segment are found by looking at a few cells
+    instead of scanning all the points and segments.
+    """
+
+    def __init__(self, cell_size: float = 32.0) -> None:
+        """
+        Initializes an empty index.
+
+        Args:
+            cell_size (float): The side length of a grid cell, best chosen around the typical segment length.
+        """
+        self.cell_size = cell_size
+        self.points_by_cell: defaultdict[Cell, list[Vertex]] = defaultdict(list)
+        self.segments_by_cell: defaultdict[Cell, list[Segment]] = defaultdict(list)
+
+    def insert_point(self, point: Vertex) -> None:
+        """
+        Adds a point to the index.
+        """
+        self.points_by_cell[self.__get_cell(point.x, point.y)].append(point)
+
+    def remove_point(self, point: Vertex) -> None:
+        """
+        Removes a point previously added to the index.
+        """
+        cell = self.__get_cell(point.x, point.y)
+        self.points_by_cell[cell].remove(point)
+        if not self.points_by_cell[cell]: del self.points_by_cell[cell]
+
+    def insert_segment(self, pt_a: Vertex, pt_b: Vertex) -> None:
+        """
+        Adds the segment [pt_a, pt_b] to the index.
+        """
+        for cell in self.__get_cells_on_segment(pt_a, pt_b):
+            self.segments_by_cell[cell].append((pt_a, pt_b))
+
+    def remove_segment(self, pt_a: Vertex, pt_b: Vertex) -> None:
+        """
+        Removes the segment [pt_a, pt_b] previously added to the index with its ends in the same order.
+        """
+        for cell in self.__get_cells_on_segment(pt_a, pt_b):
+            segments = self.segments_by_cell[cell]
+            segments.remove((pt_a, pt_b))
+            if not segments: del self.segments_by_cell[cell]
+
+    def get_points_near(self, x: float, y: float) -> Iterator[Vertex]:
+        """
+        Yields the points lying in the cell of (x, y) or in one of the eight cells around it.
+        """
+        column, row = self.__get_cell(x, y)
+
+        for neighbor_column in range(column - 1, column + 2):
+            for neighbor_row in range(row - 1, row + 2):
+                yield from self.points_by_cell.get((neighbor_column, neighbor_row), ())
+
+    def get_segments_near(self, pt_a: Vertex, pt_b: Vertex) -> set[Segment]:
+        """
+        Retrieves the segments sharing at least one cell with the segment [pt_a, pt_b], the only ones it can intersect.
+        """
+        segments: set[Segment] = set()
+
+        for cell in self.__get_cells_on_segment(pt_a, pt_b):
+            segments.update(self.segments_by_cell.get(cell, ()))
+
+        return segments
+
+    def __get_cell(self, x: float, y: float) -> Cell:
+        """
+        Retrieves the cell containing the point (x, y).
+        """
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def __get_cells_on_segment(self, pt_a: Vertex, pt_b: Vertex) -> Iterator[Cell]:
+        """
+        Yields the cells crossed by the segment [pt_a, pt_b], column by column.
+
+        In each column, the cells between the lowest and highest y-coordinates of the segment over the column
+        are yielded. These y-coordinates are rounded, so the range is widened by a tiny tolerance to keep a
+        segment running along a cell border in the cells on both sides.
+        """
+        if pt_a.x > pt_b.x: pt_a, pt_b = pt_b, pt_a
+
+        first_column, _ = self.__get_cell(pt_a.x, pt_a.y)
+        last_column, _ = self.__get_cell(pt_b.x, pt_b.y)
+        slope = (pt_b.y - pt_a.y) / (pt_b.x - pt_a.x) if pt_b.x != pt_a.x else 0.0
+
+        for column in range(first_column, last_column + 1):
+            x_start = max(pt_a.x, column * self.cell_size)
+            x_end = min(pt_b.x, (column + 1) * self.cell_size)
+            y_start = pt_a.y + (x_start - pt_a.x) * slope
+            y_end = pt_b.y if x_end == pt_b.x else pt_a.y + (x_end - pt_a.x) * slope
+
+            first_row = math.floor(min(y_start, y_end) / self.cell_size - ROW_TOLERANCE)
+            last_row = math.floor(max(y_start, y_end) / self.cell_size + ROW_TOLERANCE)
+
+            for row in range(first_row, last_row + 1):
+                yield column, row
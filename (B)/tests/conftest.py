@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules of the triangulator are imported as top-level modules, as the scripts of this folder do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from batch import CHUNKS_PER_WORKER, triangulate_batch
+from polygon_generators import GENERATORS
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """
+    Thread pool counting the tasks submitted to it.
+    """
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def signed_areas(coordinates: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    a, b, c = coordinates[triangles[:, 0]], coordinates[triangles[:, 1]], coordinates[triangles[:, 2]]
+    return ((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0]) * (b[:, 1] - a[:, 1])) / 2
+
+
+def polygon_area(polygon: np.ndarray) -> float:
+    x, y = polygon[:, 0], polygon[:, 1]
+    return abs(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2
+
+
+def make_polygon_sets() -> list[list[np.ndarray]]:
+    generators = sorted(GENERATORS)
+    return [GENERATORS[generators[index % len(generators)]](40 + 10 * index, index) for index in range(24)]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_results_follow_the_input_order(lazy: bool) -> None:
+    polygon_sets = make_polygon_sets()
+
+    with CountingExecutor(max_workers=2) as executor:
+        results = list(triangulate_batch(iter(polygon_sets) if lazy else polygon_sets, chunk_vertices=500, executor=executor))
+
+    assert len(results) == len(polygon_sets)
+
+    for polygons, triangles in zip(polygon_sets, results):
+        coordinates = np.concatenate(polygons)
+        assert triangles.dtype == np.int32 and triangles.ndim == 2 and triangles.shape[1] == 3
+
+        # Counter-clockwise triangles covering the outlines minus the holes
+        areas = signed_areas(coordinates, triangles)
+        assert np.all(areas > 0)
+        assert areas.sum() == pytest.approx(polygon_area(polygons[0]) - sum(polygon_area(hole) for hole in polygons[1:]))
+
+
+def test_chunks_are_sized_from_the_given_executor(monkeypatch) -> None:
+    monkeypatch.setattr("batch.os.cpu_count", lambda: 64)
+    polygon_sets = make_polygon_sets()
+
+    with CountingExecutor(max_workers=2) as executor:
+        list(triangulate_batch(polygon_sets, executor=executor))
+
+    # About CHUNKS_PER_WORKER chunks per worker of the executor, not per CPU of the machine
+    assert CHUNKS_PER_WORKER <= executor.submitted <= 2 * CHUNKS_PER_WORKER
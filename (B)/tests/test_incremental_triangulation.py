@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from algorithms import triangulate_polygonal_area
+from incremental_triangulation import IncrementalTriangulation
+from polygon_generators import polygon_with_holes
+from polygonal_area import PolygonalArea
+from vertex import Vertex
+
+
+def quadrilateral(x: float, y: float, radius: float) -> list[Vertex]:
+    """
+    Returns a slightly irregular quadrilateral around (x, y), without horizontal edges.
+    """
+    return [Vertex(x - radius, y - radius), Vertex(x + radius, y - 0.9 * radius), Vertex(x + radius, y + radius), Vertex(x - 0.95 * radius, y + radius)]
+
+
+def total_area(triangles) -> float:
+    area = 0.0
+    for triangle in triangles:
+        a, b, c = triangle.vertices
+        area += abs((b.x - a.x) * (c.y - a.y) - (c.x - a.x) * (b.y - a.y)) / 2
+    return area
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_updates_match_full_triangulation(compact: bool, seed: int) -> None:
+    # Nested quadrilaterals added in random order, so that new polygons enclose polygons already added
+    polygons = [quadrilateral(0, 0, radius) for radius in range(1, 10)] + [quadrilateral(30 + 3 * i, 40, 1) for i in range(4)]
+    polygons += [[Vertex(x + 3000, y) for x, y in outline.tolist()] for outline in polygon_with_holes(300, seed=seed)]
+
+    rng = random.Random(seed)
+    rng.shuffle(polygons)
+    triangulation = IncrementalTriangulation(compact)
+    current = set()
+    added_count = 0
+
+    while added_count < len(polygons):
+        batch = polygons[added_count:added_count + rng.randint(1, 3)]
+        added_count += len(batch)
+
+        added, removed = triangulation.add_polygons(batch)
+        assert set(removed) <= current
+        current = (current - set(removed)) | set(added)
+        assert set(triangulation.get_triangles()) == current
+
+        expected = triangulate_polygonal_area(PolygonalArea(polygons[:added_count]))
+        assert len(current) == len(expected)
+        assert total_area(current) == pytest.approx(total_area(expected))
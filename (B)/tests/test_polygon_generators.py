@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from polygon_generators import GENERATORS, spiral_polygon
+
+
+def orientations(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Returns the sign of the orientation of each triangle (a, b, c), row by row.
+    """
+    return np.sign((b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0]))
+
+
+def count_edge_intersections(polygons: list[np.ndarray]) -> int:
+    """
+    Counts the pairs of edges of the polygons that intersect or touch, apart from consecutive edges of a polygon
+    sharing their common vertex.
+    """
+    starts = np.concatenate(polygons)
+    ends = np.concatenate([np.roll(polygon, -1, axis=0) for polygon in polygons])
+    polygon_ids = np.concatenate([np.full(len(polygon), index) for index, polygon in enumerate(polygons)])
+    positions = np.concatenate([np.arange(len(polygon)) for polygon in polygons])
+    sizes = np.array([len(polygon) for polygon in polygons])[polygon_ids]
+
+    i, j = np.triu_indices(len(starts), 1)
+    consecutive = (polygon_ids[i] == polygon_ids[j]) & (((positions[j] - positions[i]) % sizes[i] == 1) | ((positions[i] - positions[j]) % sizes[i] == 1))
+    i, j = i[~consecutive], j[~consecutive]
+
+    p1, p2, q1, q2 = starts[i], ends[i], starts[j], ends[j]
+    o1, o2, o3, o4 = orientations(p1, p2, q1), orientations(p1, p2, q2), orientations(q1, q2, p1), orientations(q1, q2, p2)
+
+    # Collinear edges intersect when their bounding boxes overlap
+    overlap = np.all(np.maximum(np.minimum(p1, p2), np.minimum(q1, q2)) <= np.minimum(np.maximum(p1, p2), np.maximum(q1, q2)), axis=1)
+    intersect = np.where((o1 == 0) & (o2 == 0), overlap, (o1 * o2 <= 0) & (o3 * o4 <= 0))
+
+    return int(intersect.sum())
+
+
+@pytest.mark.parametrize("name", sorted(GENERATORS))
+@pytest.mark.parametrize("n_vertices", [30, 50, 100, 1000])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_generated_polygons_are_simple(name: str, n_vertices: int, seed: int) -> None:
+    polygons = GENERATORS[name](n_vertices, seed)
+
+    assert all(len(polygon) >= 3 for polygon in polygons)
+    assert count_edge_intersections(polygons) == 0
+
+
+def test_spiral_with_too_few_vertices_raises() -> None:
+    with pytest.raises(ValueError):
+        spiral_polygon(10)
@@ -0,0 +1,74 @@
+import mmap
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from polygon_io import BinaryPolygons, read_polygon_file, read_polygons, write_binary_polygons
+
+
+def test_reads_polygons_separated_by_blank_lines(tmp_path) -> None:
+    path = tmp_path / "polygons.txt"
+    path.write_bytes(b"0 0\n1 0\n1 1\n\n\n2 2\r\n3 2.5\r\n3 3\r\n\n4 4\n5 5\n")
+
+    assert [polygon.tolist() for polygon in read_polygons(str(path))] == [[[0, 0], [1, 0], [1, 1]], [[2, 2], [3, 2.5], [3, 3]]]
+
+
+@pytest.mark.parametrize("text, bad_line", [
+    (b"0 0\n1 0\n1 1\n\n2 2\n3 2 5\n3\n", 6),
+    (b"0 0\n1 0\n1 1\n\n2 2\n3 x\n3 3 3\n", 6),
+    (b"0 0\n1 0\n1 1\n\n\n\n2 2\n3 2\n3\n", 9),
+    (b"0 0\n1 0 1\n1 x\n", 2),
+    (b"0 0\n1 \xc3\xa9\n1 1\n", 2),
+])
+def test_reports_the_first_malformed_line(tmp_path, text: bytes, bad_line: int) -> None:
+    path = tmp_path / "polygons.txt"
+    path.write_bytes(text)
+
+    with pytest.raises(ValueError, match=f"line {bad_line} "):
+        list(read_polygons(str(path)))
+
+
+def test_binary_polygons_round_trip_as_views_on_the_mapping(tmp_path) -> None:
+    polygons = [np.random.default_rng(size).uniform(-10, 10, size=(size, 2)) for size in [3, 7, 1, 12]]
+    path = tmp_path / "polygons.bin"
+    write_binary_polygons(str(path), polygons)
+
+    binary_polygons = BinaryPolygons.open(str(path))
+    assert len(binary_polygons) == len(polygons)
+    for read, written in zip(binary_polygons, polygons):
+        np.testing.assert_array_equal(read, written)
+    np.testing.assert_array_equal(binary_polygons[-1], polygons[-1])
+
+    # Each polygon is a read-only view on the memory map of the file, not a copy
+    base = binary_polygons[1]
+    assert np.shares_memory(base, binary_polygons.coordinates) and not base.flags.writeable
+    while isinstance(base, np.ndarray): base = base.base
+    assert isinstance(base.obj if isinstance(base, memoryview) else base, mmap.mmap)
+
+    # read_polygon_file skips the polygon with a single vertex
+    assert [polygon.tolist() for polygon in read_polygon_file(str(path))] == [polygon.tolist() for polygon in polygons if len(polygon) >= 3]
+
+
+@pytest.mark.parametrize("header, message", [
+    (b"POLYGONZ", "not a binary polygon file"),
+    (b"POLYGONS" + (2).to_bytes(4, "little"), "Unsupported binary polygon file version 2"),
+])
+def test_binary_polygons_reject_bad_headers(tmp_path, header: bytes, message: str) -> None:
+    path = tmp_path / "polygons.bin"
+    write_binary_polygons(str(path), [np.zeros((3, 2))])
+    path.write_bytes(header + path.read_bytes()[len(header):])
+
+    with pytest.raises(ValueError, match=message):
+        BinaryPolygons.open(str(path))
+
+
+def test_reads_binary_files_written_by_gen(tmp_path) -> None:
+    gen_script = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "(A)", "gen.py")
+    subprocess.run([sys.executable, gen_script, "12", "polygons.bin", "-n", "3", "--seed", "1"], cwd=tmp_path, check=True, capture_output=True)
+
+    polygons = list(read_polygon_file(str(tmp_path / "tests" / "polygons.bin")))
+    assert [polygon.shape for polygon in polygons] == [(12, 2)] * 3
+    assert all(polygon.dtype == np.float64 for polygon in polygons)
@@ -0,0 +1,99 @@
+from concurrent.futures import Future
+
+import numpy as np
+import pytest
+
+from incremental_triangulation import IncrementalTriangulation
+from polygon_generators import polygon_with_holes, star_polygon
+from polygonal_area_drawer import PolygonalAreaDrawer, triangulate_all_polygons
+from vertex import Vertex
+
+tkinter = pytest.importorskip("tkinter")
+
+
+class FakePhotoImage:
+    def __init__(self, data: bytes, format: str) -> None:
+        self.data = data
+
+
+class FakeCanvas:
+    """
+    Stands for the canvas of the drawer, so that the polling runs without a display.
+    """
+    def __init__(self) -> None:
+        self.images = {}
+
+    def winfo_width(self) -> int:
+        return 400
+
+    def winfo_height(self) -> int:
+        return 300
+
+    def create_image(self, x: int, y: int, anchor: str, image: FakePhotoImage) -> int:
+        self.images[len(self.images) + 1] = image
+        return len(self.images)
+
+    def itemconfigure(self, item_id: int, image: FakePhotoImage) -> None:
+        self.images[item_id] = image
+
+    def tag_lower(self, item_id: int) -> None:
+        pass
+
+
+class FakeRoot:
+    def after(self, interval_ms: int, callback) -> str:
+        return "after"
+
+
+@pytest.fixture
+def drawer(monkeypatch) -> PolygonalAreaDrawer:
+    monkeypatch.setattr(tkinter, "PhotoImage", FakePhotoImage)
+    drawer = PolygonalAreaDrawer(incremental=False)
+    drawer.root = FakeRoot()
+    drawer.canvas = FakeCanvas()
+    drawer.triangles_per_batch = 50
+    return drawer
+
+
+def finished_job(polygons: list[list[Vertex]]) -> Future:
+    job = Future()
+    job.set_result(triangulate_all_polygons(polygons))
+    return job
+
+
+def to_vertices(outlines, scale: float = 0.1, offset: float = 150.0) -> list[list[Vertex]]:
+    return [[Vertex(x * scale + offset, y * scale + offset) for x, y in outline.tolist()] for outline in outlines]
+
+
+def test_full_result_drops_the_undrawn_triangles_of_the_previous_one(drawer: PolygonalAreaDrawer) -> None:
+    outline = to_vertices(star_polygon(400))
+    outline_with_holes = to_vertices(polygon_with_holes(400))
+
+    drawer.triangulation_jobs.append(finished_job(outline))
+    drawer._poll_triangulation_jobs_tkinter()
+    assert drawer.triangles_to_draw
+
+    second_job = finished_job(outline_with_holes)
+    drawer.triangulation_jobs.append(second_job)
+    while drawer.triangulation_jobs or drawer.triangles_to_draw: drawer._poll_triangulation_jobs_tkinter()
+
+    assert set(drawer.triangles_layer.slots) == set(second_job.result()[0])
+
+
+def test_removed_triangles_leave_the_same_image_as_a_full_redraw(drawer: PolygonalAreaDrawer) -> None:
+    polygons = to_vertices(polygon_with_holes(600))
+    triangulation = IncrementalTriangulation()
+
+    # The outline first, then the holes, whose triangles replace some of the outline's
+    for start in range(0, len(polygons), 5):
+        job = Future()
+        job.set_result(triangulation.add_polygons(polygons[start:start + 5]))
+        drawer.triangulation_jobs.append(job)
+        while drawer.triangulation_jobs or drawer.triangles_to_draw: drawer._poll_triangulation_jobs_tkinter()
+
+    assert set(drawer.triangles_layer.slots) == set(triangulation.get_triangles())
+
+    image = drawer.triangles_layer.image.copy()
+    drawer._redraw_triangles_tkinter()
+    assert np.array_equal(image, drawer.triangles_layer.image)
+    assert (image != 255).any()
@@ -0,0 +1,45 @@
+import math
+import random
+from fractions import Fraction
+
+from edge import Edge
+from predicates import counting_predicates, exact_x_on_edge, is_right_of_edge, is_right_of_edge_at_side, orientation, predicate_counters, x_on_edge
+from vertex import Vertex
+
+
+def exactly_right_of_edge(edge: Edge, side_edge: Edge, y: float) -> bool:
+    x = exact_x_on_edge(side_edge, y)
+    bottom, top = edge.bottom_vertex, edge.top_vertex
+    if bottom.y == top.y: return x > (Fraction(bottom.x) + Fraction(top.x)) / 2
+
+    bx, by, tx, ty = map(Fraction, (bottom.x, bottom.y, top.x, top.y))
+    return (tx - bx) * (Fraction(y) - by) < (ty - by) * (x - bx)
+
+
+def test_corner_on_a_side_edge_is_tested_exactly() -> None:
+    rng = random.Random(0)
+
+    for _ in range(20000):
+        scale = 10 ** rng.uniform(-3, 6)
+        side_edge = Edge(Vertex(rng.uniform(-scale, scale), -scale), Vertex(rng.uniform(-scale, scale), scale))
+        y = rng.uniform(-scale, scale)
+
+        # An edge through a point within a few ulps of the rounded corner, where rounding decides the result
+        x = x_on_edge(side_edge, y) + rng.randint(-3, 3) * math.ulp(x_on_edge(side_edge, y))
+        dx, dy = rng.uniform(-scale, scale), rng.choice([0.0, rng.uniform(0.01, 1) * scale])
+        edge = Edge(Vertex(x - dx, y - dy), Vertex(x + dx, y + dy))
+
+        assert is_right_of_edge_at_side(edge, side_edge, y) == exactly_right_of_edge(edge, side_edge, y)
+
+
+def test_predicates_count_only_within_the_block() -> None:
+    edge = Edge(Vertex(0.0, 0.0), Vertex(3.0, 7.0))
+
+    with counting_predicates() as counters:
+        is_right_of_edge(edge, 1.0, 2.0)
+        orientation(0.1, 0.13, 0.2, 0.16, 0.3, 0.19)
+
+    is_right_of_edge(edge, 1.0, 2.0)
+
+    assert counters is predicate_counters
+    assert (counters.is_right_of_edge, counters.orientation, counters.orientation_exact) == (1, 2, 1)
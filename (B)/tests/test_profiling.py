@@ -0,0 +1,39 @@
+import json
+import random
+
+import pytest
+
+from algorithms import triangulate_polygonal_area
+from polygon_generators import polygon_with_holes
+from polygonal_area import PolygonalArea
+from profiling import TriangulationProfile
+from vertex import Vertex
+
+STAGES = ["trapezoidation", "select_inside_trapezoids", "make_monotone_mountains", "make_triangles"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("track_memory", [False, True])
+def test_profile_records_the_stages_and_consistent_counters(compact: bool, track_memory: bool) -> None:
+    outlines = polygon_with_holes(1000, 2)
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in outline.tolist()] for outline in outlines])
+    profile = TriangulationProfile(track_memory=track_memory)
+
+    random.seed(2)
+    triangles = triangulate_polygonal_area(polygonal_area, compact=compact, as_indices=True, profile=profile)
+
+    assert list(profile.stages) == STAGES
+    assert all(measures["seconds"] >= 0 for measures in profile.stages.values())
+    assert all(("peak_bytes" in measures) == track_memory for measures in profile.stages.values())
+    assert profile.get_total_seconds() == pytest.approx(sum(measures["seconds"] for measures in profile.stages.values()))
+
+    counters = profile.counters
+    edges = sum(len(outline) for outline in outlines)
+    assert counters["edges"] == edges
+    # Every trapezoid created is either merged away or left in the decomposition, which has 2 per edge plus one
+    assert counters["trapezoids_created"] - counters["trapezoids_merged"] == counters["trapezoids"] == 2 * edges + 1
+    assert counters["triangles"] == len(triangles) == edges + 2 * (len(outlines) - 1) - 2
+    assert 0 < counters["max_query_depth"] <= counters["dag_depth"] < counters["dag_nodes"]
+    assert 0 < counters["monotone_mountains"] <= counters["inside_trapezoids"] < counters["trapezoids"]
+
+    assert json.loads(profile.to_json()) == profile.to_dict()
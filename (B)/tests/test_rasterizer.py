@@ -0,0 +1,83 @@
+import random
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from algorithms import triangulate_polygonal_area
+from polygon_generators import polygon_with_holes, spiral_polygon, star_polygon
+from polygonal_area import PolygonalArea
+from rasterizer import iter_tiles, rasterize_triangles
+from vertex import Vertex
+
+SIZE = 240
+
+
+def triangulate_in_pixels(generator, seed: int) -> tuple[list[np.ndarray], np.ndarray, np.ndarray]:
+    """
+    Triangulates a generated polygonal area scaled to the image, returning its polygons and vertices in pixel
+    coordinates and its triangles.
+    """
+    outlines = generator(300, seed)
+    random.seed(seed)
+    triangles = triangulate_polygonal_area(PolygonalArea([[Vertex(x, y) for x, y in outline.tolist()] for outline in outlines]), as_indices=True)
+    polygons = [(outline + 1000) * (SIZE - 20) / 2000 + 10 for outline in outlines]
+    return polygons, np.concatenate(polygons), triangles
+
+
+def near_edges(polygons: list[np.ndarray], distance: float) -> np.ndarray:
+    """
+    Marks the pixels whose center lies within the given distance of a polygon edge.
+    """
+    ys, xs = np.mgrid[0:SIZE, 0:SIZE] + 0.5
+    centers = np.stack([xs.ravel(), ys.ravel()], axis=1)
+    near = np.zeros(len(centers), dtype=bool)
+
+    for polygon in polygons:
+        for start, end in zip(polygon, np.roll(polygon, -1, axis=0)):
+            direction = end - start
+            t = np.clip((centers - start) @ direction / (direction @ direction), 0, 1)
+            near |= np.hypot(*(start + t[:, None] * direction - centers).T) <= distance
+
+    return near.reshape(SIZE, SIZE)
+
+
+@pytest.mark.parametrize("generator", [star_polygon, spiral_polygon, polygon_with_holes])
+def test_triangulation_covers_each_pixel_once(generator) -> None:
+    polygons, coordinates, triangles = triangulate_in_pixels(generator, 0)
+    hits = np.zeros((SIZE, SIZE), dtype=np.int64)
+    white = np.full((1, 3), 255, dtype=np.uint8)
+
+    for triangle in triangles:
+        tile = np.zeros((SIZE, SIZE, 3), dtype=np.uint8)
+        rasterize_triangles(tile, coordinates, triangle[None], white)
+        hits += tile[..., 0] != 0
+
+    assert hits.max() == 1
+
+    # The covered pixels are those PIL fills for the outline minus the holes, except near the boundary where the two
+    # fill rules differ.
+    expected = Image.new("L", (SIZE, SIZE), 0)
+    for index, polygon in enumerate(polygons):
+        ImageDraw.Draw(expected).polygon([tuple(point) for point in polygon.tolist()], fill=0 if index else 1)
+
+    differing = (hits == 1) != (np.asarray(expected) == 1)
+    assert not np.any(differing & ~near_edges(polygons, 1.0))
+    assert np.count_nonzero(hits) > SIZE * SIZE // 10
+
+
+@pytest.mark.parametrize("tile_size", [37, 64, 500])
+def test_tiles_match_the_whole_image(tile_size: int) -> None:
+    _, coordinates, triangles = triangulate_in_pixels(polygon_with_holes, 1)
+    colors = np.random.default_rng(1).integers(1, 256, size=(len(triangles), 3), dtype=np.uint8)
+
+    image = np.zeros((SIZE, SIZE + 13, 3), dtype=np.uint8)
+    rasterize_triangles(image, coordinates, triangles, colors)
+
+    stitched = np.zeros_like(image)
+    for x0, y0, tile_width, tile_height in iter_tiles(SIZE + 13, SIZE, tile_size):
+        tile = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
+        rasterize_triangles(tile, coordinates, triangles, colors, (x0, y0))
+        stitched[y0:y0 + tile_height, x0:x0 + tile_width] = tile
+
+    np.testing.assert_array_equal(stitched, image)
@@ -0,0 +1,70 @@
+import sys
+
+import numpy as np
+import pytest
+
+from algorithms import build_search_structure
+from node import TRAPEZOID_NODE
+from polygon_generators import spiral_polygon
+from polygonal_area import PolygonalArea
+from predicates import is_above, is_right_of_edge
+from trapezoidal_map import flatten_search_structure
+from vertex import Vertex
+
+
+def contains(trapezoid, x: float, y: float) -> bool:
+    """
+    Tests whether a point lies in a trapezoid with the predicates the search structure descends with.
+    """
+    bottom, top = trapezoid.bottom_vertex, trapezoid.top_vertex
+    left, right = trapezoid.left_edge, trapezoid.get_right_edge()
+
+    return ((bottom is None or is_above(x, y, bottom.x, bottom.y)) and (top is None or not is_above(x, y, top.x, top.y))
+            and (left is None or is_right_of_edge(left, x, y)) and (right is None or not is_right_of_edge(right, x, y)))
+
+
+def flattened_depth(node_types: np.ndarray, left_children: np.ndarray, right_children: np.ndarray) -> int:
+    """
+    Measures the depth of a flattened search structure by relaxing the depths of all nodes together.
+    """
+    inner = node_types != TRAPEZOID_NODE
+    depths = np.zeros(len(node_types), dtype=np.int64)
+
+    while True:
+        new_depths = np.where(inner, 1 + np.maximum(depths[left_children], depths[right_children]), 0)
+        if np.array_equal(new_depths, depths): return int(depths[0])
+        depths = new_depths
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_deep_search_structure_is_measured_and_searched_without_recursion(compact: bool) -> None:
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in outline.tolist()] for outline in spiral_polygon(3000, 0)])
+
+    # Inserting the edges of the spiral from bottom to top stacks the splits into a DAG deeper than the recursion limit
+    edges = sorted(polygonal_area.get_edges(), key=lambda edge: edge.top_vertex.y)
+    structure = build_search_structure(edges, compact)
+    stats = structure.search_stats
+
+    node_count, depth = structure.get_node_count_and_depth()
+    assert depth > sys.getrecursionlimit()
+
+    node_types, left_children, right_children, _, leaf_trapezoids, trapezoids = flatten_search_structure(structure)
+    assert len(node_types) == node_count
+    assert flattened_depth(node_types, left_children, right_children) == depth
+    assert len(trapezoids) == np.count_nonzero(leaf_trapezoids >= 0) == len(structure.get_all_traps())
+
+    # Every vertex and the middle of every edge were located when inserted
+    assert stats.queries == 2 * len(edges)
+    assert stats.queries < stats.visited_nodes <= stats.queries * (depth + 1)
+    assert 0 < stats.max_depth <= depth
+
+    points = np.random.default_rng(0).uniform(-1100, 1100, size=(2000, 2))
+    queries, visited_nodes = stats.queries, stats.visited_nodes
+
+    for x, y in points.tolist():
+        assert contains(structure.find_trapezoid(Vertex(x, y)), x, y)
+
+    assert stats.queries == queries + len(points)
+    assert stats.visited_nodes - visited_nodes >= len(points)
+    assert stats.max_depth <= depth
+    assert stats.get_average_depth() == (stats.visited_nodes - stats.queries) / stats.queries
@@ -0,0 +1,120 @@
+import random
+
+from predicates import orientation
+from segment_index import SegmentIndex
+from vertex import Vertex
+
+CELL_SIZE = 10.0
+
+
+def segments_intersect(segment_a, segment_b) -> bool:
+    """
+    Exactly tests whether two closed segments share at least one point.
+    """
+    (a, b), (c, d) = segment_a, segment_b
+    if max(a.x, b.x) < min(c.x, d.x) or max(c.x, d.x) < min(a.x, b.x) or max(a.y, b.y) < min(c.y, d.y) or max(c.y, d.y) < min(a.y, b.y): return False
+
+    def orient(p, q, r) -> int:
+        return orientation(p.x, p.y, q.x, q.y, r.x, r.y)
+
+    def on_segment(p, q, r) -> bool:
+        return min(p.x, q.x) <= r.x <= max(p.x, q.x) and min(p.y, q.y) <= r.y <= max(p.y, q.y)
+
+    o1, o2, o3, o4 = orient(a, b, c), orient(a, b, d), orient(c, d, a), orient(c, d, b)
+    if o1 * o2 < 0 and o3 * o4 < 0: return True
+
+    return ((o1 == 0 and on_segment(a, b, c)) or (o2 == 0 and on_segment(a, b, d))
+            or (o3 == 0 and on_segment(c, d, a)) or (o4 == 0 and on_segment(c, d, b)))
+
+
+def make_segments(rng: random.Random) -> list[tuple[Vertex, Vertex]]:
+    """
+    Random segments, and segments with their ends on the grid lines: vertical, horizontal, diagonal through cell
+    corners and running along cell borders.
+    """
+    segments = []
+
+    for _ in range(150):
+        x, y = rng.uniform(-50, 50), rng.uniform(-50, 50)
+        length = rng.choice([1, 10, 40])
+        segments.append((Vertex(x, y), Vertex(x + rng.uniform(-length, length), y + rng.uniform(-length, length))))
+
+    for _ in range(150):
+        x, y = rng.randint(-5, 5) * CELL_SIZE, rng.randint(-5, 5) * CELL_SIZE
+        dx, dy = rng.choice([(0, 1), (1, 0), (1, 1), (1, -1), (2, 1), (0, 0.5), (0.5, 0)])
+        length = rng.randint(1, 4) * CELL_SIZE
+        end = Vertex(x + dx * length, y + dy * length)
+
+        # Some segments only start or end on a grid line
+        start = Vertex(x + rng.choice([0, 0.25]) * CELL_SIZE * dy, y + rng.choice([0, 0.25]) * CELL_SIZE * dx)
+        segments.append((start, end) if rng.random() < 0.5 else (end, start))
+
+    # Segments through a cell corner with a slope that is not exact in floating point, where rounding the interpolated
+    # y-coordinate could leave out a cell touched at the corner, and short segments leaving that corner
+    for _ in range(150):
+        corner_x, corner_y = rng.randint(-5, 5) * CELL_SIZE, rng.randint(-5, 5) * CELL_SIZE
+        dx, dy = rng.choice([1, 3, 7, 9, 11]), rng.choice([-13, -7, -3, 3, 7, 13])
+        before, after = rng.randint(1, 40), rng.randint(1, 40)
+        segments.append((Vertex(corner_x - before * dx, corner_y - before * dy), Vertex(corner_x + after * dx, corner_y + after * dy)))
+
+        for side_x, side_y in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+            segments.append((Vertex(corner_x, corner_y), Vertex(corner_x + side_x * CELL_SIZE / 2, corner_y + side_y * CELL_SIZE / 2)))
+
+    return segments
+
+
+def test_segments_near_contain_every_intersecting_segment() -> None:
+    segments = make_segments(random.Random(0))
+    index = SegmentIndex(CELL_SIZE)
+    for segment in segments: index.insert_segment(*segment)
+
+    intersections = 0
+
+    for segment in segments:
+        near = index.get_segments_near(*segment)
+
+        for other in segments:
+            if segments_intersect(segment, other):
+                intersections += 1
+                assert other in near
+
+    assert intersections > 2 * len(segments)
+
+
+def test_points_near_contain_the_neighboring_points() -> None:
+    rng = random.Random(1)
+    points = [Vertex(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(500)]
+    points += [Vertex(rng.randint(-5, 5) * CELL_SIZE, rng.randint(-5, 5) * CELL_SIZE) for _ in range(100)]
+    index = SegmentIndex(CELL_SIZE)
+    for point in points: index.insert_point(point)
+
+    for x, y in [(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(200)] + [(0.0, 0.0), (CELL_SIZE, -CELL_SIZE)]:
+        near = set(index.get_points_near(x, y))
+        assert {point for point in points if max(abs(point.x - x), abs(point.y - y)) <= CELL_SIZE} <= near
+
+
+def test_removed_points_and_segments_are_no_longer_found() -> None:
+    segments = make_segments(random.Random(2))
+    index = SegmentIndex(CELL_SIZE)
+
+    for pt_a, pt_b in segments:
+        index.insert_point(pt_a)
+        index.insert_segment(pt_a, pt_b)
+
+    removed, kept = segments[::2], segments[1::2]
+    for pt_a, pt_b in removed:
+        index.remove_point(pt_a)
+        index.remove_segment(pt_a, pt_b)
+
+    for pt_a, pt_b in segments:
+        near = index.get_segments_near(pt_a, pt_b)
+        assert not near & set(removed)
+        assert all(other in near for other in kept if segments_intersect((pt_a, pt_b), other))
+        assert not set(index.get_points_near(pt_a.x, pt_a.y)) & {point for point, _ in removed}
+
+    for pt_a, pt_b in kept:
+        index.remove_point(pt_a)
+        index.remove_segment(pt_a, pt_b)
+
+    # Emptied cells are dropped from the grid
+    assert not index.points_by_cell and not index.segments_by_cell
@@ -0,0 +1,60 @@
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import build_search_structure, triangulate_polygonal_area
+from polygon_generators import polygon_with_holes, spiral_polygon
+from polygonal_area import PolygonalArea
+from trapezoidal_map import TrapezoidalMap
+from vertex import Vertex
+
+
+def make_area(outlines: list[np.ndarray]) -> PolygonalArea:
+    return PolygonalArea([[Vertex(x, y) for x, y in outline.tolist()] for outline in outlines])
+
+
+@pytest.mark.parametrize("generator", [polygon_with_holes, spiral_polygon])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_compact_decomposition_matches_objects(generator, seed: int) -> None:
+    polygonal_area = make_area(generator(2000, seed))
+    results = []
+
+    for compact in [False, True]:
+        random.seed(seed)
+        triangles = triangulate_polygonal_area(polygonal_area, compact=compact, as_indices=True)
+        results.append(sorted(map(tuple, np.sort(triangles, axis=1).tolist())))
+
+    assert results[0] == results[1]
+
+
+def test_compact_structure_frees_merged_leaves() -> None:
+    polygonal_area = make_area(polygon_with_holes(2000, 0))
+    edges = polygonal_area.get_edges()
+    random.seed(0)
+    random.shuffle(edges)
+
+    structure = build_search_structure(edges, compact=True)
+    node_count, _ = structure.get_node_count_and_depth()
+    trapezoids = structure.get_all_traps()
+
+    assert len(trapezoids) == structure.store.get_live_count() == 2 * len(edges) + 1
+    # Every node that was not freed is still reachable from the root
+    assert node_count == len(structure.node_type) - len(structure.free_nodes)
+    assert all(structure.node_obj[trapezoid.associated_node] == trapezoid.id for trapezoid in trapezoids)
+
+
+def test_compact_map_locates_like_objects() -> None:
+    polygonal_area = make_area(polygon_with_holes(1000, 3))
+    points = np.random.default_rng(3).uniform(-1100, 1100, size=(5000, 2))
+    results = []
+
+    for compact in [False, True]:
+        random.seed(3)
+        trapezoidal_map = TrapezoidalMap(polygonal_area, compact)
+        inside, faces = trapezoidal_map.locate(points)
+        assert [trapezoidal_map.locate_point(x, y) for x, y in points[:200].tolist()] == list(zip(inside[:200].tolist(), faces[:200].tolist()))
+        results.append((inside, faces))
+
+    np.testing.assert_array_equal(results[0][0], results[1][0])
+    np.testing.assert_array_equal(results[0][1], results[1][1])
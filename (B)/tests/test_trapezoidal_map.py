@@ -0,0 +1,85 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from incremental_triangulation import are_points_in_polygon
+from polygon_generators import GENERATORS
+from polygonal_area import PolygonalArea
+from trapezoidal_map import FILE_HEADER, TrapezoidalMap, signed_area
+from vertex import Vertex
+
+
+def ray_cast_faces(polygonal_area: PolygonalArea, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Locates points by ray casting: a point is inside when an odd number of polygons contain it, and its face is the
+    smallest polygon containing it, which is the innermost one since the polygons do not intersect.
+    """
+    polygons = polygonal_area.get_polygons()
+    inside = np.zeros(len(points), dtype=bool)
+    faces = np.full(len(points), -1, dtype=np.int32)
+    face_areas = np.full(len(points), np.inf)
+
+    for polygon_index, polygon in enumerate(polygons):
+        contained = are_points_in_polygon(points, polygon)
+        area = abs(signed_area(polygon))
+        inside ^= contained
+
+        innermost = contained & (area < face_areas)
+        faces[innermost] = polygon_index
+        face_areas[innermost] = area
+
+    return inside, faces
+
+
+@pytest.fixture(scope="module", params=sorted(GENERATORS))
+def located_area(request) -> tuple[PolygonalArea, np.ndarray, tuple[np.ndarray, np.ndarray]]:
+    outlines = GENERATORS[request.param](1000, 5)
+    polygonal_area = PolygonalArea([[Vertex(x, y) for x, y in outline.tolist()] for outline in outlines])
+    points = np.random.default_rng(5).uniform(-1100, 1100, size=(20000, 2))
+    return polygonal_area, points, ray_cast_faces(polygonal_area, points)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_saved_and_pickled_maps_locate_like_a_ray_cast(located_area, compact: bool, tmp_path) -> None:
+    polygonal_area, points, (expected_inside, expected_faces) = located_area
+    random.seed(5)
+    trapezoidal_map = TrapezoidalMap(polygonal_area, compact)
+
+    path = tmp_path / "map.trapmap"
+    trapezoidal_map.save(str(path))
+    loaded_map = TrapezoidalMap.load(str(path))
+    unpickled_map = pickle.loads(pickle.dumps(trapezoidal_map))
+
+    for located_map in [trapezoidal_map, loaded_map, unpickled_map]:
+        inside, faces = located_map.locate(points)
+        np.testing.assert_array_equal(inside, expected_inside)
+        np.testing.assert_array_equal(faces, expected_faces)
+
+    # The loaded map has no search structure and answers single points with the flat arrays
+    assert loaded_map.search_structure is None
+    assert [loaded_map.locate_point(x, y) for x, y in points[:100].tolist()] == list(zip(expected_inside[:100].tolist(), expected_faces[:100].tolist()))
+
+
+def test_load_rejects_bad_files(tmp_path) -> None:
+    square = PolygonalArea([[Vertex(0.0, 0.0), Vertex(1.0, 0.1), Vertex(1.1, 1.0), Vertex(0.1, 0.9)]])
+    path = tmp_path / "map.trapmap"
+    TrapezoidalMap(square).save(str(path))
+    data = path.read_bytes()
+
+    bad_magic = tmp_path / "bad_magic.trapmap"
+    bad_magic.write_bytes(b"NOTAMAP\0" + data[8:])
+    with pytest.raises(ValueError, match="not a trapezoidal map"):
+        TrapezoidalMap.load(str(bad_magic))
+
+    bad_version = tmp_path / "bad_version.trapmap"
+    bad_version.write_bytes(data[:8] + (99).to_bytes(4, "little") + data[12:])
+    with pytest.raises(ValueError, match="Unsupported trapezoidal map file version 99"):
+        TrapezoidalMap.load(str(bad_version))
+
+    for size, message in [(FILE_HEADER.size // 2, "not a trapezoidal map"), (len(data) - 8, "truncated")]:
+        truncated = tmp_path / f"truncated_{size}.trapmap"
+        truncated.write_bytes(data[:size])
+        with pytest.raises(ValueError, match=message):
+            TrapezoidalMap.load(str(truncated))
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from polygon_generators import polygon_with_holes
+from polygon_io import write_binary_polygons
+
+DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=DIRECTORY, capture_output=True, text=True, check=True)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_main_writes_json_to_stdout_and_timings_to_stderr(binary: bool, tmp_path) -> None:
+    outlines = polygon_with_holes(200, 4)
+    path = tmp_path / ("area.bin" if binary else "area.txt")
+    if binary: write_binary_polygons(str(path), outlines)
+    else: path.write_text("\n\n".join("\n".join(f"{x!r} {y!r}" for x, y in outline.tolist()) for outline in outlines) + "\n")
+
+    result = run_python("triangulate.py", str(path), "-o", "-", "--seed", "4")
+    document = json.loads(result.stdout)
+
+    vertices, triangles = np.array(document["vertices"]), np.array(document["triangles"])
+    np.testing.assert_array_equal(vertices, np.concatenate(outlines))
+    assert triangles.shape == (len(vertices) + 2 * (len(outlines) - 1) - 2, 3)
+    assert list(document["timings"]) == ["read", "triangulate"]
+
+    for name in ["read", "triangulate", "write", "trapezoidation", "make_triangles", "trapezoids_created"]:
+        assert name in result.stderr
+    assert "{" not in result.stderr
+
+
+def test_importing_the_cli_does_not_import_drawing_libraries() -> None:
+    result = run_python("-c", "import sys, triangulate; print(sorted({'tkinter', 'PIL'} & set(sys.modules)))")
+    assert result.stdout.strip() == "[]"
@@ -1,19 +1,53 @@
-from collections import defaultdict
-
 from edge import *
-from vertex import Vertex
+from predicates import is_right_of_edge, is_right_of_edge_at_side
 
 def replace(list_to_modify, to_replace, replace_by):
     for index in range(len(list_to_modify)):
         if list_to_modify[index] == to_replace: list_to_modify[index] = replace_by
 
-class Trapezoid:
-    traps_by_right_edge = defaultdict(set)
+class DecompositionContext:
+    """
+    Holds the state shared by all the trapezoids of a single decomposition.
+
+    Each call to `trapezoidation` owns its own context, referenced by the trapezoids it creates, so the
+    index is released together with the decomposition and independent decompositions never share state.
+    """
+    def __init__(self):
+        """
+        Initializes an empty context.
+        """
+        self.trap_by_right_edge = {}
+        self.trapezoids_created = 0
+        self.trapezoids_merged = 0
+
+    def register_right_edge(self, trapezoid, edge):
+        """
+        Records a trapezoid as the representative of the trapezoids bounded on the right by an edge.
+        """
+        if edge is not None: self.trap_by_right_edge[edge] = trapezoid
+
+    def unregister_right_edge(self, trapezoid, edge, replacement = None):
+        """
+        Hands the representative of an edge over to a replacement if the given trapezoid currently holds that role.
+        """
+        if edge is None or self.trap_by_right_edge.get(edge) is not trapezoid: return
+
+        if replacement is None: del self.trap_by_right_edge[edge]
+        else: self.trap_by_right_edge[edge] = replacement
 
-    def __init__(self, top_vertex = None, bottom_vertex = None, trapezoids_above = None, trapezoids_below = None, left_edge = None, right_edge = None):
+    def get_trap_by_right_edge(self, edge):
+        """
+        Retrieves a trapezoid whose right edge is the given edge.
+        """
+        return self.trap_by_right_edge[edge]
+
+class Trapezoid:
+    def __init__(self, top_vertex = None, bottom_vertex = None, trapezoids_above = None, trapezoids_below = None, left_edge = None, right_edge = None, context = None):
         """
-        Initializes a new Trapezoid object.
+        Initializes a new Trapezoid object. A trapezoid created without a context starts a new decomposition.
         """
+        self.context = DecompositionContext() if context is None else context
+        self.context.trapezoids_created += 1
         self.top_vertex = top_vertex
         self.bottom_vertex = bottom_vertex
         self.trapezoids_above = [] if trapezoids_above is None else trapezoids_above
@@ -30,25 +64,44 @@ class Trapezoid:
         return self.__right_edge
 
     def set_right_edge(self, new_right_edge):
-        self.remove_from_edge_registry()
+        self.context.unregister_right_edge(self, self.__right_edge)
         self.__right_edge = new_right_edge
-        self.__register_in_edge_registry()
+        self.context.register_right_edge(self, new_right_edge)
 
     def is_inside(self) -> bool:
         """
         Determines whether the trapezoid lies inside the polygonal area.
+
+        Walks leftwards through the trapezoids bounded by each left edge until one with a known status is found,
+        then alternates the status back along the walked chain.
         """
-        if self.is_cached: return self.cache_result
-        self.is_cached = True
+        chain = []
+        trap = self
 
-        if self.get_right_edge() is None or self.left_edge is None:
-            self.cache_result = False
-        else:
-            left_traps = Trapezoid.traps_by_right_edge[self.left_edge]
-            left_trap = next(iter(left_traps))
-            self.cache_result = not left_trap.is_inside()
+        while not trap.is_cached:
+            if trap.get_right_edge() is None or trap.left_edge is None:
+                trap.is_cached = True
+                trap.cache_result = False
+                break
+
+            chain.append(trap)
+            trap = self.context.get_trap_by_right_edge(trap.left_edge)
+
+        result = trap.cache_result
+
+        for trap in reversed(chain):
+            result = not result
+            trap.is_cached = True
+            trap.cache_result = result
 
-        return self.cache_result
+        return result
+
+    def reset_inside(self):
+        """
+        Forgets the cached inside status, which changes when polygons are added around the trapezoid.
+        """
+        self.is_cached = False
+        self.cache_result = None
 
     def get_adjacent_traps(self, top):
         """
@@ -63,11 +116,19 @@ class Trapezoid:
         if top: self.trapezoids_above = new_traps
         else: self.trapezoids_below = new_traps
 
-    def remove_from_edge_registry(self):
+    def replace_adjacent_trap(self, to_replace, replace_by, top):
+        """
+        Replaces one of the trapezoids adjacent to this one in the specified direction.
+        """
+        replace(self.get_adjacent_traps(top), to_replace, replace_by)
+
+    def discard(self, replacement):
         """
-        Removes this trapezoid from the global registry of trapezoids mapped by their right edge.
+        Removes this trapezoid from the decomposition after it has been merged into another one.
         """
-        if self.__right_edge is not None: Trapezoid.traps_by_right_edge[self.__right_edge].remove(self)
+        self.context.unregister_right_edge(self, self.__right_edge, replacement)
+        self.context.trapezoids_merged += 1
+        self.associated_node = None
 
     def split_by_vertex(self, vertex):
         """
@@ -91,36 +152,31 @@ class Trapezoid:
         Splits the trapezoid obliquely into two trapezoids using a given edge as the dividing boundary.
         """
         right_trapezoid = self
-        left_trapezoid = self.__duplicate()
+        left_trapezoid = Trapezoid(self.top_vertex, self.bottom_vertex, None, None, self.left_edge, edge, self.context)
 
-        left_trapezoid.set_right_edge(edge)
         right_trapezoid.left_edge = edge
 
         return left_trapezoid, right_trapezoid
 
-    def get_extreme_point(self, top, right):
+    def is_corner_right_of_edge(self, edge, top, right):
         """
-        Calculates one of the four extreme points of the trapezoid.
+        Determines whether one of the four corners of the trapezoid lies to the right of an edge, without building the corner point.
+        A corner that is an end of the side edge is taken as is, and the x-coordinate of any other corner on the side edge is
+        kept rational whenever rounding it could change the result, so the test is exact for every corner.
         """
-        relevant_vertex = self.top_vertex if top else self.bottom_vertex
-        relevant_edge = self.get_right_edge() if right else self.left_edge
-
-        extreme_y = relevant_vertex.y
-        extreme_x = relevant_edge.get_x_by_y(extreme_y)
+        corner_vertex = self.top_vertex if top else self.bottom_vertex
+        side_edge = self.get_right_edge() if right else self.left_edge
 
-        return Vertex(extreme_x, extreme_y)
+        if corner_vertex is side_edge.top_vertex or corner_vertex is side_edge.bottom_vertex:
+            return is_right_of_edge(edge, corner_vertex.x, corner_vertex.y)
 
-    def __register_in_edge_registry(self):
-        """
-        Adds this trapezoid to the global registry of trapezoids mapped by their right edge.
-        """
-        if self.__right_edge is not None: Trapezoid.traps_by_right_edge[self.__right_edge].add(self)
+        return is_right_of_edge_at_side(edge, side_edge, corner_vertex.y)
 
     def __duplicate(self):
         """
         Creates a duplicate of the current trapezoid with the same vertices and edges.
         """
-        return Trapezoid(self.top_vertex, self.bottom_vertex, None, None, self.left_edge, self.get_right_edge())
+        return Trapezoid(self.top_vertex, self.bottom_vertex, None, None, self.left_edge, self.get_right_edge(), self.context)
 
 def manage_adjacent_trapezoids_after_edge_split(edge, created_trap_couples, top_just_inserted, bottom_just_inserted):
     """
@@ -133,15 +189,15 @@ def manage_adjacent_trapezoids_after_edge_split(edge, created_trap_couples, top_
         top_left_trap, top_right_trap = created_trap_couples[trap_couple_index]
         bottom_left_trap, bottom_right_trap = created_trap_couples[trap_couple_index + 1]
 
-        if len(top_right_trap.trapezoids_below) == 2:
+        if len(top_right_trap.get_adjacent_traps(False)) == 2:
             manage_adjacent_trapezoids_on_branch(edge, bottom_left_trap, bottom_right_trap, top_left_trap, top_right_trap, False)
 
-        elif len(bottom_right_trap.trapezoids_above) == 2:
+        elif len(bottom_right_trap.get_adjacent_traps(True)) == 2:
             manage_adjacent_trapezoids_on_branch(edge, top_left_trap, top_right_trap, bottom_left_trap, bottom_right_trap, True,)
 
         else:
-            top_left_trap.trapezoids_below = [bottom_left_trap]
-            bottom_left_trap.trapezoids_above = [top_left_trap]
+            top_left_trap.set_adjacent_traps([bottom_left_trap], False)
+            bottom_left_trap.set_adjacent_traps([top_left_trap], True)
 
 def merge_redundant_trapezoids(created_trap_couples):
     """
@@ -180,13 +236,13 @@ def manage_adjacent_trapezoid_at_inserted_edge_end(edge, end_trap_left, end_trap
     elif get_edge_vertex(end_trap_right.get_right_edge(), top_end) == edge_relevant_end:
         end_trap_left.set_adjacent_traps(exterior_adjacent_traps, top_end)
         end_trap_right.set_adjacent_traps([], top_end)
-        replace(exterior_adjacent_traps[0].get_adjacent_traps(not top_end), end_trap_right, end_trap_left)
+        exterior_adjacent_traps[0].replace_adjacent_trap(end_trap_right, end_trap_left, not top_end)
 
     else:
         left_adjacent, right_adjacent = exterior_adjacent_traps
         end_trap_left.set_adjacent_traps([left_adjacent], top_end)
         end_trap_right.set_adjacent_traps([right_adjacent], top_end)
-        replace(left_adjacent.get_adjacent_traps(not top_end), end_trap_right, end_trap_left)
+        left_adjacent.replace_adjacent_trap(end_trap_right, end_trap_left, not top_end)
 
 def manage_adjacent_trapezoids_on_branch(edge, left_trap_A, right_trap_A, left_trap_B, right_trap_B, upward_branch):
     """
@@ -194,13 +250,13 @@ def manage_adjacent_trapezoids_on_branch(edge, left_trap_A, right_trap_A, left_t
     """
     left_trap_A.set_adjacent_traps([left_trap_B], not upward_branch)
 
-    branch_point = right_trap_B.get_adjacent_traps(upward_branch)[0].get_extreme_point(not upward_branch, True)
+    branch_trap = right_trap_B.get_adjacent_traps(upward_branch)[0]
 
-    if edge.is_vertex_at_the_right(branch_point):
+    if branch_trap.is_corner_right_of_edge(edge, not upward_branch, True):
         left_trap_B.set_adjacent_traps([left_trap_A], upward_branch)
         return
 
-    additional_left_trap_A = right_trap_B.get_adjacent_traps(upward_branch)[0]
+    additional_left_trap_A = branch_trap
 
     right_trap_A.set_adjacent_traps([right_trap_B], not upward_branch)
     right_trap_B.set_adjacent_traps([right_trap_A], upward_branch)
@@ -219,10 +275,10 @@ def merge_trapezoids_stack(trapezoids_stack):
     bottom_trap = trapezoids_stack[-1]
 
     top_trap.bottom_vertex = bottom_trap.bottom_vertex
-    top_trap.trapezoids_below = bottom_trap.trapezoids_below
+    top_trap.set_adjacent_traps(bottom_trap.get_adjacent_traps(False), False)
 
-    for trap in bottom_trap.trapezoids_below: replace(trap.trapezoids_above, bottom_trap, top_trap)
+    for trap in bottom_trap.get_adjacent_traps(False): trap.replace_adjacent_trap(bottom_trap, top_trap, True)
 
     for trap in trapezoids_stack[1:]:
         trap.associated_node.replace_by_another_node_in_tree(top_trap.associated_node)
-        trap.remove_from_edge_registry()
\ No newline at end of file
+        trap.discard(top_trap)
\ No newline at end of file
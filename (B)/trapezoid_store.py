@@ -0,0 +1,653 @@
+from array import array
+
+from node import SearchStats, TRAPEZOID_NODE, VERTEX_NODE, EDGE_NODE
+from predicates import is_above, is_right_of_edge, is_right_of_edge_at_side
+
+NO_ID = -1
+
+UNKNOWN = -1
+OUTSIDE = 0
+INSIDE = 1
+
+FREE_NODE = -1
+
+def new_column(typecode, capacity, fill = NO_ID):
+    """
+    Creates a preallocated column of the given type filled with a default value.
+    """
+    return array(typecode, [fill]) * capacity
+
+class TrapezoidStore:
+    """
+    Compact struct-of-arrays storage for the trapezoids of a decomposition.
+
+    Every trapezoid is an integer id indexing preallocated columns holding its top and bottom vertex ids,
+    its left and right edge ids, up to two trapezoids above and below it and the id of its leaf in the search
+    structure. Vertices and edges are stored once in the store and referred to by id. The ids of trapezoids
+    merged away are recycled.
+    """
+    def __init__(self, capacity = 16):
+        """
+        Initializes an empty store able to hold `capacity` trapezoids before growing.
+        """
+        self.capacity = max(capacity, 1)
+        self.count = 0
+        self.free_ids = []
+        self.trapezoids_created = 0
+        self.trapezoids_merged = 0
+
+        self.top = new_column("i", self.capacity)
+        self.bottom = new_column("i", self.capacity)
+        self.left = new_column("i", self.capacity)
+        self.right = new_column("i", self.capacity)
+        self.above = (new_column("i", self.capacity), new_column("i", self.capacity))
+        self.below = (new_column("i", self.capacity), new_column("i", self.capacity))
+        self.inside = new_column("b", self.capacity, UNKNOWN)
+        self.node = new_column("i", self.capacity)
+
+        self.vertices = []
+        self.vertex_ids = {}
+        self.edges = []
+        self.edge_ids = {}
+        self.edge_top = array("i")
+        self.edge_bottom = array("i")
+        self.trap_by_right_edge = array("i")
+
+    def new_trapezoid(self, top = NO_ID, bottom = NO_ID, left = NO_ID, right = NO_ID):
+        """
+        Allocates a new trapezoid from vertex and edge ids and returns its id.
+        """
+        self.trapezoids_created += 1
+
+        if self.free_ids:
+            trap_id = self.free_ids.pop()
+        else:
+            if self.count == self.capacity: self.__grow()
+            trap_id = self.count
+            self.count += 1
+
+        self.top[trap_id] = top
+        self.bottom[trap_id] = bottom
+        self.left[trap_id] = left
+        self.right[trap_id] = right
+        for column in (*self.above, *self.below): column[trap_id] = NO_ID
+        self.inside[trap_id] = UNKNOWN
+        self.node[trap_id] = NO_ID
+        if right != NO_ID: self.trap_by_right_edge[right] = trap_id
+
+        return trap_id
+
+    def discard(self, trap_id, replacement_id):
+        """
+        Removes a trapezoid from the decomposition after it has been merged into another one.
+        """
+        right_edge_id = self.right[trap_id]
+        if right_edge_id != NO_ID and self.trap_by_right_edge[right_edge_id] == trap_id:
+            self.trap_by_right_edge[right_edge_id] = replacement_id
+
+        self.node[trap_id] = NO_ID
+        self.free_ids.append(trap_id)
+        self.trapezoids_merged += 1
+
+    def get_vertex_id(self, vertex):
+        """
+        Returns the id of a vertex, adding it to the store if necessary.
+        """
+        if vertex is None: return NO_ID
+
+        vertex_id = self.vertex_ids.get(vertex)
+        if vertex_id is None:
+            vertex_id = self.vertex_ids[vertex] = len(self.vertices)
+            self.vertices.append(vertex)
+
+        return vertex_id
+
+    def get_edge_id(self, edge):
+        """
+        Returns the id of an edge, adding it and its vertices to the store if necessary.
+        """
+        if edge is None: return NO_ID
+
+        edge_id = self.edge_ids.get(edge)
+        if edge_id is None:
+            edge_id = self.edge_ids[edge] = len(self.edges)
+            self.edges.append(edge)
+            self.edge_top.append(self.get_vertex_id(edge.top_vertex))
+            self.edge_bottom.append(self.get_vertex_id(edge.bottom_vertex))
+            self.trap_by_right_edge.append(NO_ID)
+
+        return edge_id
+
+    def get_live_count(self):
+        """
+        Returns the number of trapezoids currently part of the decomposition.
+        """
+        return self.count - len(self.free_ids)
+
+    def get_vertex(self, vertex_id):
+        return None if vertex_id == NO_ID else self.vertices[vertex_id]
+
+    def get_edge(self, edge_id):
+        return None if edge_id == NO_ID else self.edges[edge_id]
+
+    def get_memory_usage(self):
+        """
+        Returns the number of bytes used by the per-trapezoid columns.
+        """
+        columns = [self.top, self.bottom, self.left, self.right, *self.above, *self.below, self.inside, self.node]
+        return sum(column.itemsize * len(column) for column in columns)
+
+    def is_inside(self, trap_id):
+        """
+        Determines whether a trapezoid lies inside the polygonal area.
+
+        Walks leftwards through the trapezoids bounded by each left edge until one with a known status is found,
+        then alternates the status back along the walked chain.
+        """
+        inside, left, right, trap_by_right_edge = self.inside, self.left, self.right, self.trap_by_right_edge
+        chain = []
+
+        while inside[trap_id] == UNKNOWN:
+            left_edge_id = left[trap_id]
+
+            if left_edge_id == NO_ID or right[trap_id] == NO_ID:
+                inside[trap_id] = OUTSIDE
+                break
+
+            chain.append(trap_id)
+            trap_id = trap_by_right_edge[left_edge_id]
+
+            # Indexing with NO_ID would read the last entry of the column, so fail like a DecompositionContext lookup
+            if trap_id == NO_ID: raise KeyError(f"No trapezoid is bounded on the right by edge {left_edge_id}")
+
+        result = inside[trap_id] == INSIDE
+
+        for trap_id in reversed(chain):
+            result = not result
+            inside[trap_id] = INSIDE if result else OUTSIDE
+
+        return result
+
+    def set_adjacent_traps(self, trap_id, top, first_id = NO_ID, second_id = NO_ID):
+        """
+        Updates the trapezoids adjacent to a trapezoid in the specified direction.
+        """
+        first_column, second_column = self.above if top else self.below
+        first_column[trap_id] = first_id
+        second_column[trap_id] = second_id
+
+    def replace_adjacent_trap(self, trap_id, to_replace, replace_by, top):
+        """
+        Replaces one of the trapezoids adjacent to a trapezoid in the specified direction.
+        """
+        for column in (self.above if top else self.below):
+            if column[trap_id] == to_replace: column[trap_id] = replace_by
+
+    def split_by_vertex(self, trap_id, vertex_id):
+        """
+        Splits a trapezoid horizontally at a vertex. The trapezoid keeps the top part and the id of the new bottom
+        part is returned.
+        """
+        bottom_id = self.new_trapezoid(self.top[trap_id], self.bottom[trap_id], self.left[trap_id], self.right[trap_id])
+
+        self.bottom[trap_id] = vertex_id
+        self.top[bottom_id] = vertex_id
+
+        for column_below in self.below:
+            below_id = column_below[trap_id]
+            column_below[bottom_id] = below_id
+            column_below[trap_id] = NO_ID
+            if below_id != NO_ID: self.replace_adjacent_trap(below_id, trap_id, bottom_id, True)
+
+        self.above[0][bottom_id] = trap_id
+        self.below[0][trap_id] = bottom_id
+
+        return bottom_id
+
+    def split_by_edge(self, trap_id, edge_id):
+        """
+        Splits a trapezoid obliquely along an edge. The trapezoid keeps the right part and the id of the new left
+        part is returned.
+        """
+        left_id = self.new_trapezoid(self.top[trap_id], self.bottom[trap_id], self.left[trap_id], edge_id)
+        self.left[trap_id] = edge_id
+
+        return left_id
+
+    def is_corner_right_of_edge(self, trap_id, edge, top, right):
+        """
+        Determines whether one of the four corners of a trapezoid lies to the right of an edge, exactly as
+        Trapezoid.is_corner_right_of_edge does.
+        """
+        corner_id = self.top[trap_id] if top else self.bottom[trap_id]
+        side_id = self.right[trap_id] if right else self.left[trap_id]
+        corner_vertex = self.vertices[corner_id]
+
+        if corner_id == self.edge_top[side_id] or corner_id == self.edge_bottom[side_id]:
+            return is_right_of_edge(edge, corner_vertex.x, corner_vertex.y)
+
+        return is_right_of_edge_at_side(edge, self.edges[side_id], corner_vertex.y)
+
+    def __grow(self):
+        """
+        Doubles the capacity of every column.
+        """
+        extra = self.capacity
+
+        for column in [self.top, self.bottom, self.left, self.right, *self.above, *self.below, self.node]:
+            column.extend(new_column("i", extra))
+        self.inside.extend(new_column("b", extra, UNKNOWN))
+
+        self.capacity += extra
+
+class CompactSearchStructure:
+    """
+    Search structure of a trapezoidal decomposition whose nodes and trapezoids are all integer ids.
+
+    The nodes are stored in columns holding their type, their associated trapezoid, vertex or edge id and their
+    left and right children, the root being node 0. The parents of each node are a linked list of links stored in
+    two flat columns. The trapezoids live in a TrapezoidStore. Insertions and point location only handle ids, and
+    CompactTrapezoid handles are only created for the trapezoids returned to the caller.
+
+    It exposes the interface of the root Node used by the trapezoidation, so that both backends are interchangeable.
+    """
+    def __init__(self, capacity = 16):
+        """
+        Initializes a structure made of a single trapezoid covering the whole plane, with room for `capacity`
+        trapezoids before growing.
+        """
+        self.store = TrapezoidStore(capacity)
+        self.search_stats = SearchStats()
+
+        self.node_type = array("b")
+        self.node_obj = array("i")
+        self.left_child = array("i")
+        self.right_child = array("i")
+        self.first_parent_link = array("i")
+        self.free_nodes = []
+
+        self.link_parent = array("i")
+        self.next_link = array("i")
+
+        self.__new_leaf(self.store.new_trapezoid(), NO_ID)
+
+    def insert_vertex(self, vertex):
+        """
+        Inserts a vertex into the trapezoidal decomposition structure and returns the two trapezoids it split.
+        """
+        store = self.store
+        vertex_id = store.get_vertex_id(vertex)
+        node_id = self.__search_area_containing_vertex(vertex.x, vertex.y)
+        top_id = self.node_obj[node_id]
+        bottom_id = store.split_by_vertex(top_id, vertex_id)
+
+        self.node_type[node_id] = VERTEX_NODE
+        self.node_obj[node_id] = vertex_id
+        self.left_child[node_id] = self.__new_leaf(bottom_id, node_id)
+        self.right_child[node_id] = self.__new_leaf(top_id, node_id)
+
+        return CompactTrapezoid(store, bottom_id), CompactTrapezoid(store, top_id)
+
+    def insert_edge(self, edge, top_just_inserted, bottom_just_inserted):
+        """
+        Inserts an edge into the trapezoidal decomposition structure and returns the couples of trapezoids it split,
+        some of which may have been merged away afterwards.
+        """
+        store = self.store
+        edge_id = store.get_edge_id(edge)
+        start_node_id = self.__search_area_containing_vertex(edge.mid_point.x, edge.mid_point.y)
+
+        nodes_to_split_down_direction = self.__find_nodes_to_split_in_direction(start_node_id, edge, edge_id, False)
+        nodes_to_split_up_direction = self.__find_nodes_to_split_in_direction(start_node_id, edge, edge_id, True)
+
+        left_ids, right_ids = [], []
+
+        for node_id in reversed(nodes_to_split_up_direction): self.__split_by_edge(node_id, edge_id, left_ids, right_ids)
+        self.__split_by_edge(start_node_id, edge_id, left_ids, right_ids)
+        for node_id in nodes_to_split_down_direction: self.__split_by_edge(node_id, edge_id, left_ids, right_ids)
+
+        self.__manage_adjacent_trapezoids_after_edge_split(edge, edge_id, left_ids, right_ids, top_just_inserted, bottom_just_inserted)
+        self.__merge_redundant_trapezoids(left_ids)
+        self.__merge_redundant_trapezoids(right_ids)
+
+        return [(CompactTrapezoid(store, left_id), CompactTrapezoid(store, right_id)) for left_id, right_id in zip(left_ids, right_ids)]
+
+    def find_trapezoid(self, point):
+        """
+        Finds the trapezoid of the decomposition containing the given point.
+        """
+        return CompactTrapezoid(self.store, self.node_obj[self.__search_area_containing_vertex(point.x, point.y)])
+
+    def get_all_traps(self, trapezoids_acc = None):
+        """
+        Collects all trapezoids of the decomposition, which are exactly the trapezoids of the store still bound to a leaf.
+        """
+        if trapezoids_acc is None: trapezoids_acc = []
+
+        store = self.store
+        node = store.node
+        trapezoids_acc.extend(CompactTrapezoid(store, trap_id) for trap_id in range(store.count) if node[trap_id] != NO_ID)
+
+        return trapezoids_acc
+
+    def get_node_count_and_depth(self):
+        """
+        Counts the nodes reachable from the root and measures the depth of the structure, the largest number of
+        inner nodes on a path from the root down to a trapezoid.
+        """
+        node_type, left_child, right_child = self.node_type, self.left_child, self.right_child
+        depths = array("i", [NO_ID]) * len(node_type)
+        nodes_to_visit = [0]
+
+        while nodes_to_visit:
+            node_id = nodes_to_visit[-1]
+
+            if node_type[node_id] == TRAPEZOID_NODE:
+                depths[node_id] = 0
+                nodes_to_visit.pop()
+                continue
+
+            left_id, right_id = left_child[node_id], right_child[node_id]
+            pending_children = [child_id for child_id in (left_id, right_id) if depths[child_id] == NO_ID]
+            if pending_children:
+                nodes_to_visit.extend(pending_children)
+                continue
+
+            depths[node_id] = 1 + max(depths[left_id], depths[right_id])
+            nodes_to_visit.pop()
+
+        return sum(1 for depth in depths if depth != NO_ID), depths[0]
+
+    def get_memory_usage(self):
+        """
+        Returns the number of bytes used by the node, parent link and trapezoid columns.
+        """
+        columns = [self.node_type, self.node_obj, self.left_child, self.right_child, self.first_parent_link, self.link_parent, self.next_link]
+        return sum(column.itemsize * len(column) for column in columns) + self.store.get_memory_usage()
+
+    def __new_leaf(self, trap_id, parent_id):
+        """
+        Allocates a leaf node for a trapezoid, below the given parent node, and returns its id.
+        """
+        if self.free_nodes:
+            node_id = self.free_nodes.pop()
+            self.node_type[node_id] = TRAPEZOID_NODE
+            self.node_obj[node_id] = trap_id
+            self.left_child[node_id] = NO_ID
+            self.right_child[node_id] = NO_ID
+            self.first_parent_link[node_id] = NO_ID
+        else:
+            node_id = len(self.node_type)
+            self.node_type.append(TRAPEZOID_NODE)
+            self.node_obj.append(trap_id)
+            self.left_child.append(NO_ID)
+            self.right_child.append(NO_ID)
+            self.first_parent_link.append(NO_ID)
+
+        if parent_id != NO_ID:
+            self.link_parent.append(parent_id)
+            self.next_link.append(NO_ID)
+            self.first_parent_link[node_id] = len(self.link_parent) - 1
+
+        self.store.node[trap_id] = node_id
+
+        return node_id
+
+    def __replace_leaf(self, node_id, new_node_id):
+        """
+        Redirects all the parents of a leaf to another leaf, hands its parent links over and frees the leaf.
+        """
+        link_parent, next_link, left_child, right_child = self.link_parent, self.next_link, self.left_child, self.right_child
+        link = last_link = self.first_parent_link[node_id]
+
+        while link != NO_ID:
+            parent_id = link_parent[link]
+            if left_child[parent_id] == node_id: left_child[parent_id] = new_node_id
+            elif right_child[parent_id] == node_id: right_child[parent_id] = new_node_id
+
+            last_link = link
+            link = next_link[link]
+
+        if last_link != NO_ID:
+            next_link[last_link] = self.first_parent_link[new_node_id]
+            self.first_parent_link[new_node_id] = self.first_parent_link[node_id]
+
+        self.node_type[node_id] = FREE_NODE
+        self.free_nodes.append(node_id)
+
+    def __search_area_containing_vertex(self, x, y):
+        """
+        Finds the id of the leaf of the search structure whose trapezoid contains the point (x, y).
+        """
+        node_type, node_obj, left_child, right_child = self.node_type, self.node_obj, self.left_child, self.right_child
+        vertices, edges = self.store.vertices, self.store.edges
+        node_id = 0
+        depth = 0
+
+        while node_type[node_id] != TRAPEZOID_NODE:
+            if node_type[node_id] == VERTEX_NODE:
+                vertex = vertices[node_obj[node_id]]
+                go_right = is_above(x, y, vertex.x, vertex.y)
+            else:
+                go_right = is_right_of_edge(edges[node_obj[node_id]], x, y)
+
+            node_id = right_child[node_id] if go_right else left_child[node_id]
+            depth += 1
+
+        self.search_stats.record_query(depth)
+
+        return node_id
+
+    def __split_by_edge(self, node_id, edge_id, left_ids, right_ids):
+        """
+        Splits the trapezoid of a leaf into two trapezoids along an edge, turning the leaf into an edge node.
+        """
+        right_id = self.node_obj[node_id]
+        left_id = self.store.split_by_edge(right_id, edge_id)
+
+        left_ids.append(left_id)
+        right_ids.append(right_id)
+
+        self.node_type[node_id] = EDGE_NODE
+        self.node_obj[node_id] = edge_id
+        self.left_child[node_id] = self.__new_leaf(left_id, node_id)
+        self.right_child[node_id] = self.__new_leaf(right_id, node_id)
+
+    def __find_nodes_to_split_in_direction(self, start_node_id, edge, edge_id, up_direction):
+        """
+        Finds the sequence of leaves to split along a given direction for an edge insertion.
+        """
+        store = self.store
+        first_column, second_column = store.above if up_direction else store.below
+        end_column = store.top if up_direction else store.bottom
+        end_vertex_id = store.edge_top[edge_id] if up_direction else store.edge_bottom[edge_id]
+        nodes_to_split = []
+        trap_id = self.node_obj[start_node_id]
+
+        while end_column[trap_id] != end_vertex_id:
+            first_id, second_id = first_column[trap_id], second_column[trap_id]
+
+            if second_id == NO_ID: trap_id = first_id
+            else: trap_id = first_id if store.is_corner_right_of_edge(first_id, edge, not up_direction, True) else second_id
+
+            nodes_to_split.append(store.node[trap_id])
+
+        return nodes_to_split
+
+    def __manage_adjacent_trapezoids_after_edge_split(self, edge, edge_id, left_ids, right_ids, top_just_inserted, bottom_just_inserted):
+        """
+        Updates the adjacency relationships of trapezoids after an edge insertion, as manage_adjacent_trapezoids_after_edge_split does.
+        """
+        store = self.store
+
+        self.__manage_adjacent_trapezoid_at_inserted_edge_end(edge_id, left_ids[0], right_ids[0], top_just_inserted, True)
+        self.__manage_adjacent_trapezoid_at_inserted_edge_end(edge_id, left_ids[-1], right_ids[-1], bottom_just_inserted, False)
+
+        for index in range(len(left_ids) - 1):
+            top_left_id, top_right_id = left_ids[index], right_ids[index]
+            bottom_left_id, bottom_right_id = left_ids[index + 1], right_ids[index + 1]
+
+            if store.below[1][top_right_id] != NO_ID:
+                self.__manage_adjacent_trapezoids_on_branch(edge, bottom_left_id, bottom_right_id, top_left_id, top_right_id, False)
+
+            elif store.above[1][bottom_right_id] != NO_ID:
+                self.__manage_adjacent_trapezoids_on_branch(edge, top_left_id, top_right_id, bottom_left_id, bottom_right_id, True)
+
+            else:
+                store.set_adjacent_traps(top_left_id, False, bottom_left_id)
+                store.set_adjacent_traps(bottom_left_id, True, top_left_id)
+
+    def __manage_adjacent_trapezoid_at_inserted_edge_end(self, edge_id, end_left_id, end_right_id, end_just_inserted, top_end):
+        """
+        Adjusts the adjacency relationships of trapezoids at one endpoint of an inserted edge.
+        """
+        store = self.store
+        first_column, second_column = store.above if top_end else store.below
+        first_exterior_id, second_exterior_id = first_column[end_right_id], second_column[end_right_id]
+
+        if end_just_inserted:
+            store.set_adjacent_traps(end_left_id, top_end, first_exterior_id, second_exterior_id)
+            store.set_adjacent_traps(first_exterior_id, not top_end, end_left_id, end_right_id)
+            return
+
+        end_column = store.edge_top if top_end else store.edge_bottom
+        edge_end_id = end_column[edge_id]
+        left_edge_id, right_edge_id = store.left[end_left_id], store.right[end_right_id]
+
+        if left_edge_id != NO_ID and end_column[left_edge_id] == edge_end_id:
+            pass
+        elif right_edge_id != NO_ID and end_column[right_edge_id] == edge_end_id:
+            store.set_adjacent_traps(end_left_id, top_end, first_exterior_id, second_exterior_id)
+            store.set_adjacent_traps(end_right_id, top_end)
+            store.replace_adjacent_trap(first_exterior_id, end_right_id, end_left_id, not top_end)
+
+        else:
+            store.set_adjacent_traps(end_left_id, top_end, first_exterior_id)
+            store.set_adjacent_traps(end_right_id, top_end, second_exterior_id)
+            store.replace_adjacent_trap(first_exterior_id, end_right_id, end_left_id, not top_end)
+
+    def __manage_adjacent_trapezoids_on_branch(self, edge, left_id_A, right_id_A, left_id_B, right_id_B, upward_branch):
+        """
+        Adjusts the adjacency relationships of trapezoids on a horizontal border with a "branch."
+        """
+        store = self.store
+        store.set_adjacent_traps(left_id_A, not upward_branch, left_id_B)
+
+        branch_id = (store.above if upward_branch else store.below)[0][right_id_B]
+
+        if store.is_corner_right_of_edge(branch_id, edge, not upward_branch, True):
+            store.set_adjacent_traps(left_id_B, upward_branch, left_id_A)
+            return
+
+        store.set_adjacent_traps(right_id_A, not upward_branch, right_id_B)
+        store.set_adjacent_traps(right_id_B, upward_branch, right_id_A)
+
+        store.set_adjacent_traps(left_id_B, upward_branch, branch_id, left_id_A)
+        store.set_adjacent_traps(branch_id, not upward_branch, left_id_B)
+
+    def __merge_redundant_trapezoids(self, trap_ids):
+        """
+        Merges the runs of stacked trapezoids sharing both side edges among those created on one side of an inserted edge.
+        """
+        left, right = self.store.left, self.store.right
+        stack_start = 0
+
+        for index in range(1, len(trap_ids)):
+            previous_id, trap_id = trap_ids[index - 1], trap_ids[index]
+
+            if left[previous_id] != left[trap_id] or right[previous_id] != right[trap_id]:
+                self.__merge_trapezoids_stack(trap_ids, stack_start, index)
+                stack_start = index
+
+        self.__merge_trapezoids_stack(trap_ids, stack_start, len(trap_ids))
+
+    def __merge_trapezoids_stack(self, trap_ids, start, end):
+        """
+        Merges the vertical stack of trapezoids trap_ids[start:end] into its top trapezoid.
+        """
+        if end - start < 2: return
+
+        store = self.store
+        top_id, bottom_id = trap_ids[start], trap_ids[end - 1]
+
+        store.bottom[top_id] = store.bottom[bottom_id]
+        first_below_id, second_below_id = store.below[0][bottom_id], store.below[1][bottom_id]
+        store.set_adjacent_traps(top_id, False, first_below_id, second_below_id)
+
+        for below_id in (first_below_id, second_below_id):
+            if below_id != NO_ID: store.replace_adjacent_trap(below_id, bottom_id, top_id, True)
+
+        top_node_id = store.node[top_id]
+
+        for trap_id in trap_ids[start + 1:end]:
+            self.__replace_leaf(store.node[trap_id], top_node_id)
+            store.discard(trap_id, top_id)
+
+class CompactTrapezoid:
+    """
+    Lightweight read-only handle on a trapezoid held by a TrapezoidStore.
+
+    It exposes the accessors of Trapezoid used once the decomposition is built, so that the consumers of the
+    trapezoids run unchanged on both representations. Handles are created on demand and hold nothing but the id,
+    so they compare by id, and a trapezoid created on a recycled id is the same key as the one merged away before it.
+    """
+    __slots__ = ("store", "id")
+
+    def __init__(self, store, trap_id):
+        self.store = store
+        self.id = trap_id
+
+    def __eq__(self, other):
+        return isinstance(other, CompactTrapezoid) and other.id == self.id and other.store is self.store
+
+    def __hash__(self):
+        return hash(self.id)
+
+    @property
+    def top_vertex(self):
+        return self.store.get_vertex(self.store.top[self.id])
+
+    @property
+    def bottom_vertex(self):
+        return self.store.get_vertex(self.store.bottom[self.id])
+
+    @property
+    def left_edge(self):
+        return self.store.get_edge(self.store.left[self.id])
+
+    @property
+    def context(self):
+        """
+        The store, which holds the state shared by the trapezoids of the decomposition like a DecompositionContext.
+        """
+        return self.store
+
+    @property
+    def associated_node(self):
+        """
+        The id of the leaf of the trapezoid in the search structure, or None once it has been merged away.
+        """
+        node_id = self.store.node[self.id]
+        return None if node_id == NO_ID else node_id
+
+    def get_right_edge(self):
+        return self.store.get_edge(self.store.right[self.id])
+
+    def is_inside(self) -> bool:
+        """
+        Determines whether the trapezoid lies inside the polygonal area.
+        """
+        return self.store.is_inside(self.id)
+
+    def reset_inside(self):
+        """
+        Forgets the cached inside status, which changes when polygons are added around the trapezoid.
+        """
+        self.store.inside[self.id] = UNKNOWN
+
+    def get_adjacent_traps(self, top):
+        """
+        Retrieves the trapezoids adjacent to this one in the specified direction.
+        """
+        first_column, second_column = self.store.above if top else self.store.below
+        return [CompactTrapezoid(self.store, trap_id) for trap_id in (first_column[self.id], second_column[self.id]) if trap_id != NO_ID]
@@ -0,0 +1,379 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from random import shuffle
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from algorithms import *
+from predicates import ORIENTATION_ERROR_BOUND, exact_orientation
+from trapezoid_store import FREE_NODE, CompactSearchStructure, CompactTrapezoid
+
+if TYPE_CHECKING:
+    from polygonal_area import PolygonalArea
+
+NO_FACE = -1
+
+FILE_MAGIC = b"TRAPMAP\0"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<8sIIqqqq")
+FILE_ALIGNMENT = 64
+
+
+class TrapezoidalMap:
+    """
+    Point location structure over the trapezoidal decomposition of a polygonal area.
+
+    The search structure built by the trapezoidation is kept once built and flattened into arrays (node types,
+    child indices and coordinates) so that many points can be located at once with vectorized operations.
+    Each point is reported as inside or outside the polygonal area, together with its face: the index of the
+    innermost polygon containing it (an outline or a hole, in the order of the polygons of the area), or -1
+    if no polygon contains it.
+    """
+
+    def __init__(self, polygonal_area: PolygonalArea, compact: bool = False) -> None:
+        """
+        Builds the trapezoidal decomposition of a polygonal area and its flat search arrays.
+
+        Args:
+            polygonal_area (PolygonalArea): The polygonal area to locate points in.
+            compact (bool): Whether to build a CompactSearchStructure, stored in integer columns.
+        """
+        self.polygonal_area = polygonal_area
+
+        polygons = polygonal_area.get_polygons()
+        edges: list[Edge] = polygonal_area.get_edges()
+
+        self.edge_polygons: dict[Edge, tuple[int, bool]] = {}
+        edge_index = 0
+        for polygon_index, polygon in enumerate(polygons):
+            for vertex in polygon:
+                edge = edges[edge_index]
+                self.edge_polygons[edge] = (polygon_index, edge.bottom_vertex is vertex)
+                edge_index += 1
+
+        insertion_order = edges.copy()
+        shuffle(insertion_order)
+        self.search_structure = build_search_structure(insertion_order, compact)
+
+        self.node_types, self.left_children, self.right_children, self.node_coordinates, self.node_trapezoids, trapezoids = flatten_search_structure(self.search_structure)
+        self.trapezoid_indices = {trapezoid: index for index, trapezoid in enumerate(trapezoids)}
+        self.trapezoid_inside = np.fromiter((trapezoid.is_inside() for trapezoid in trapezoids), dtype=bool, count=len(trapezoids))
+        self.trapezoid_faces = self.__compute_faces(trapezoids)
+        self.vertex_coordinates, self.edge_vertices, self.trapezoid_bounds = flatten_trapezoids(trapezoids, polygonal_area.get_vertex_indices())
+
+    def __getstate__(self) -> dict[str, np.ndarray]:
+        """
+        Pickles only the flat arrays of the map, as `save` does, since the object-based search structure is too deep to pickle.
+        """
+        return {name: np.asarray(getattr(self, name)) for name, _, _ in file_layout(0, 0, 0, 0)}
+
+    def __setstate__(self, state: dict[str, np.ndarray]) -> None:
+        self.__dict__.update(state)
+        self.polygonal_area = None
+        self.search_structure = None
+        self.edge_polygons = None
+        self.trapezoid_indices = None
+
+    @classmethod
+    def load(cls, path: str) -> TrapezoidalMap:
+        """
+        Loads a trapezoidal map saved by `save` by memory-mapping the file read-only.
+
+        The arrays of the map are views on the mapping rather than copies, so loading is immediate whatever the
+        size of the map and every process loading the same file shares one copy of it through the page cache.
+        The loaded map answers `locate` and `locate_point` queries but holds no object-based search structure.
+
+        Args:
+            path (str): The file written by `save`.
+
+        Returns:
+            TrapezoidalMap: The loaded map.
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(buffer) < FILE_HEADER.size: raise ValueError(f"{path} is not a trapezoidal map file")
+
+        magic, version, _, node_count, trapezoid_count, vertex_count, edge_count = FILE_HEADER.unpack_from(buffer)
+        if magic != FILE_MAGIC: raise ValueError(f"{path} is not a trapezoidal map file")
+        if version != FILE_VERSION: raise ValueError(f"Unsupported trapezoidal map file version {version} in {path}")
+
+        arrays = {}
+        offset = FILE_HEADER.size
+        for name, dtype, shape in file_layout(node_count, trapezoid_count, vertex_count, edge_count):
+            offset = -(-offset // FILE_ALIGNMENT) * FILE_ALIGNMENT
+            count = int(np.prod(shape))
+            if offset + count * np.dtype(dtype).itemsize > len(buffer): raise ValueError(f"{path} is truncated")
+            arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+            offset += count * np.dtype(dtype).itemsize
+
+        trapezoidal_map = cls.__new__(cls)
+        trapezoidal_map.__setstate__(arrays)
+        return trapezoidal_map
+
+    def save(self, path: str) -> None:
+        """
+        Saves the search structure and the trapezoids of the map to a flat binary file.
+
+        The file is a fixed header followed by the arrays of the map, each aligned on 64 bytes: the node types,
+        child indices, coordinates and leaf trapezoids of the search structure, then the vertex coordinates, the
+        edges (pairs of vertex indices), the trapezoids (top and bottom vertex, left and right edge indices, -1
+        for none) and their inside status and face. The file can be loaded back with `load`.
+
+        Args:
+            path (str): The file to write.
+        """
+        trapezoid_count = len(self.trapezoid_faces)
+        header = FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 0, len(self.node_types), trapezoid_count, len(self.vertex_coordinates), len(self.edge_vertices))
+
+        with open(path, "wb") as file:
+            file.write(header)
+            offset = len(header)
+
+            for name, dtype, shape in file_layout(len(self.node_types), trapezoid_count, len(self.vertex_coordinates), len(self.edge_vertices)):
+                padding = -offset % FILE_ALIGNMENT
+                file.write(bytes(padding))
+                data = np.ascontiguousarray(getattr(self, name), dtype=dtype).reshape(shape).tobytes()
+                file.write(data)
+                offset += padding + len(data)
+
+    def locate(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Locates many points at once.
+
+        All points descend the search structure together, one level per iteration, so the number of
+        Python-level steps is the depth of the structure rather than the number of points. Edge tests whose
+        floating point result is not certain fall back to the exact orientation predicate.
+
+        Args:
+            points (np.ndarray): An (N, 2) array of (x, y) coordinates.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: A boolean array telling for each point whether it is inside the
+            polygonal area, and an int32 array of the face of each point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        x = points[:, 0]
+        y = points[:, 1]
+
+        current = np.zeros(len(points), dtype=np.int32)
+        pending = np.flatnonzero(self.node_types[current] != TRAPEZOID_NODE)
+
+        while pending.size:
+            nodes = current[pending]
+            types = self.node_types[nodes]
+            px = x[pending]
+            py = y[pending]
+            ax, ay, bx, by = self.node_coordinates[nodes].T
+
+            above = (py > ay) | ((py == ay) & (px > ax))
+
+            det_left = (bx - ax) * (py - ay)
+            det_right = (by - ay) * (px - ax)
+            det = det_left - det_right
+            horizontal = ay == by
+            right_of = np.where(horizontal, px > (ax + bx) / 2, det < 0)
+
+            uncertain = np.flatnonzero((types == EDGE_NODE) & ~horizontal & (np.abs(det) <= ORIENTATION_ERROR_BOUND * (np.abs(det_left) + np.abs(det_right))))
+            for k in uncertain:
+                right_of[k] = exact_orientation(ax[k], ay[k], bx[k], by[k], px[k], py[k]) < 0
+
+            go_right = np.where(types == VERTEX_NODE, above, right_of)
+            current[pending] = np.where(go_right, self.right_children[nodes], self.left_children[nodes])
+            pending = pending[self.node_types[current[pending]] != TRAPEZOID_NODE]
+
+        trapezoids = self.node_trapezoids[current]
+        return self.trapezoid_inside[trapezoids], self.trapezoid_faces[trapezoids]
+
+    def locate_point(self, x: float, y: float) -> tuple[bool, int]:
+        """
+        Locates a single point by walking the search structure.
+
+        Returns:
+            tuple[bool, int]: Whether the point is inside the polygonal area, and its face.
+        """
+        if self.search_structure is None:
+            inside, faces = self.locate(np.array([[x, y]]))
+            return bool(inside[0]), int(faces[0])
+
+        trapezoid_index = self.trapezoid_indices[self.search_structure.find_trapezoid(Point(x, y))]
+        return bool(self.trapezoid_inside[trapezoid_index]), int(self.trapezoid_faces[trapezoid_index])
+
+    def __compute_faces(self, trapezoids: list[Trapezoid]) -> np.ndarray:
+        """
+        Computes the innermost polygon containing each trapezoid.
+
+        The polygon owning the left edge of a trapezoid contains it when its interior lies on the right of that
+        edge, which follows from the direction of the edge and the orientation of the polygon. Otherwise the
+        trapezoid lies in the parent of that polygon, which is the face of the trapezoid right below the
+        polygon's lowest vertex.
+        """
+        polygons = self.polygonal_area.get_polygons()
+
+        counter_clockwise_polygons = [signed_area(polygon) > 0 for polygon in polygons]
+        polygon_by_lowest_vertex = {min(polygon, key=lambda vertex: (vertex.y, vertex.x)): polygon_index for polygon_index, polygon in enumerate(polygons)}
+        trapezoid_below_polygon = {polygon_by_lowest_vertex[trapezoid.top_vertex]: trapezoid for trapezoid in trapezoids if trapezoid.top_vertex in polygon_by_lowest_vertex}
+        parent_faces: dict[int, int] = {}
+
+        def get_face(trapezoid: Trapezoid) -> int:
+            left_edge = trapezoid.left_edge
+            if left_edge is None or trapezoid.get_right_edge() is None: return NO_FACE
+
+            polygon_index, upward = self.edge_polygons[left_edge]
+            if upward != counter_clockwise_polygons[polygon_index]: return polygon_index
+
+            return get_parent_face(polygon_index)
+
+        def get_parent_face(polygon_index: int) -> int:
+            if polygon_index not in parent_faces:
+                trapezoid_below = trapezoid_below_polygon.get(polygon_index)
+                parent_faces[polygon_index] = NO_FACE if trapezoid_below is None else get_face(trapezoid_below)
+
+            return parent_faces[polygon_index]
+
+        return np.fromiter((get_face(trapezoid) for trapezoid in trapezoids), dtype=np.int32, count=len(trapezoids))
+
+
+def flatten_search_structure(root: Node | CompactSearchStructure) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[Trapezoid]]:
+    """
+    Flattens a search structure into arrays indexed by node, the root being node 0.
+
+    Returns:
+        tuple: The node types (int8), the left and right child of each node (int32, -1 for leaves), the
+        coordinates of each node (float64, (n, 4): the vertex of a vertex node, the bottom then top vertex
+        of an edge node), the trapezoid index of each leaf (int32, -1 for inner nodes) and the trapezoids.
+    """
+    if isinstance(root, CompactSearchStructure): return flatten_compact_search_structure(root)
+
+    nodes = [root]
+    node_indices = {id(root): 0}
+    position = 0
+
+    while position < len(nodes):
+        node = nodes[position]
+        position += 1
+
+        if node.node_type == TRAPEZOID_NODE: continue
+
+        for child in (node.left_child, node.right_child):
+            if id(child) not in node_indices:
+                node_indices[id(child)] = len(nodes)
+                nodes.append(child)
+
+    node_types = np.empty(len(nodes), dtype=np.int8)
+    left_children = np.full(len(nodes), -1, dtype=np.int32)
+    right_children = np.full(len(nodes), -1, dtype=np.int32)
+    node_coordinates = np.zeros((len(nodes), 4), dtype=np.float64)
+    node_trapezoids = np.full(len(nodes), -1, dtype=np.int32)
+    trapezoids: list[Trapezoid] = []
+
+    for index, node in enumerate(nodes):
+        node_types[index] = node.node_type
+        obj = node.associated_obj
+
+        if node.node_type == TRAPEZOID_NODE:
+            node_trapezoids[index] = len(trapezoids)
+            trapezoids.append(obj)
+            continue
+
+        left_children[index] = node_indices[id(node.left_child)]
+        right_children[index] = node_indices[id(node.right_child)]
+
+        if node.node_type == VERTEX_NODE: node_coordinates[index] = (obj.x, obj.y, obj.x, obj.y)
+        else: node_coordinates[index] = (obj.bottom_vertex.x, obj.bottom_vertex.y, obj.top_vertex.x, obj.top_vertex.y)
+
+    return node_types, left_children, right_children, node_coordinates, node_trapezoids, trapezoids
+
+
+def flatten_compact_search_structure(structure: CompactSearchStructure) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[Trapezoid]]:
+    """
+    Flattens a compact search structure as flatten_search_structure does, with vectorized operations on its columns.
+
+    Every node of the columns that has not been freed is reachable from the root, so the nodes are only renumbered
+    to skip the freed ones.
+    """
+    store = structure.store
+    all_types = np.frombuffer(structure.node_type, dtype=np.int8)
+    live_nodes = np.flatnonzero(all_types != FREE_NODE)
+    node_indices = np.full(len(all_types), -1, dtype=np.int32)
+    node_indices[live_nodes] = np.arange(len(live_nodes), dtype=np.int32)
+
+    node_types = all_types[live_nodes]
+    node_objects = np.frombuffer(structure.node_obj, dtype=np.intc)[live_nodes]
+    inner = node_types != TRAPEZOID_NODE
+    left_children = np.where(inner, node_indices[np.frombuffer(structure.left_child, dtype=np.intc)[live_nodes]], -1).astype(np.int32)
+    right_children = np.where(inner, node_indices[np.frombuffer(structure.right_child, dtype=np.intc)[live_nodes]], -1).astype(np.int32)
+
+    vertex_coordinates = np.array([(vertex.x, vertex.y) for vertex in store.vertices], dtype=np.float64).reshape(-1, 2)
+    edge_bottoms = np.frombuffer(store.edge_bottom, dtype=np.intc)
+    edge_tops = np.frombuffer(store.edge_top, dtype=np.intc)
+
+    node_coordinates = np.zeros((len(live_nodes), 4), dtype=np.float64)
+    vertex_nodes = np.flatnonzero(node_types == VERTEX_NODE)
+    node_coordinates[vertex_nodes] = np.tile(vertex_coordinates[node_objects[vertex_nodes]], 2)
+    edge_nodes = np.flatnonzero(node_types == EDGE_NODE)
+    edge_ids = node_objects[edge_nodes]
+    node_coordinates[edge_nodes] = np.hstack([vertex_coordinates[edge_bottoms[edge_ids]], vertex_coordinates[edge_tops[edge_ids]]])
+
+    leaves = np.flatnonzero(~inner)
+    node_trapezoids = np.full(len(live_nodes), -1, dtype=np.int32)
+    node_trapezoids[leaves] = np.arange(len(leaves), dtype=np.int32)
+    trapezoids: list[Trapezoid] = [CompactTrapezoid(store, trap_id) for trap_id in node_objects[leaves].tolist()]
+
+    return node_types, left_children, right_children, node_coordinates, node_trapezoids, trapezoids
+
+
+def flatten_trapezoids(trapezoids: list[Trapezoid], vertex_indices: dict[Vertex, int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flattens trapezoids into arrays of vertex and edge indices.
+
+    Returns:
+        tuple: The coordinates of the vertices (float64, (n, 2), numbered as in `vertex_indices`), the edges
+        bounding a trapezoid as pairs of bottom and top vertex indices (int32, (m, 2)) and the top vertex,
+        bottom vertex, left edge and right edge indices of each trapezoid (int32, (k, 4), -1 for none).
+    """
+    vertex_coordinates = np.array([(vertex.x, vertex.y) for vertex in vertex_indices], dtype=np.float64).reshape(-1, 2)
+    edge_indices: dict[Edge, int] = {}
+
+    def get_vertex_index(vertex: Vertex | None) -> int:
+        return -1 if vertex is None else vertex_indices[vertex]
+
+    def get_edge_index(edge: Edge | None) -> int:
+        if edge is None: return -1
+        return edge_indices.setdefault(edge, len(edge_indices))
+
+    trapezoid_bounds = np.array([
+        (get_vertex_index(trapezoid.top_vertex), get_vertex_index(trapezoid.bottom_vertex), get_edge_index(trapezoid.left_edge), get_edge_index(trapezoid.get_right_edge()))
+        for trapezoid in trapezoids
+    ], dtype=np.int32).reshape(-1, 4)
+    edge_vertices = np.array([(vertex_indices[edge.bottom_vertex], vertex_indices[edge.top_vertex]) for edge in edge_indices], dtype=np.int32).reshape(-1, 2)
+
+    return vertex_coordinates, edge_vertices, trapezoid_bounds
+
+
+def file_layout(node_count: int, trapezoid_count: int, vertex_count: int, edge_count: int) -> list[tuple[str, type, tuple[int, ...]]]:
+    """
+    Lists the arrays stored in a trapezoidal map file, in file order, as (attribute name, dtype, shape).
+    """
+    return [
+        ("node_types", np.int8, (node_count,)),
+        ("left_children", np.int32, (node_count,)),
+        ("right_children", np.int32, (node_count,)),
+        ("node_coordinates", np.float64, (node_count, 4)),
+        ("node_trapezoids", np.int32, (node_count,)),
+        ("vertex_coordinates", np.float64, (vertex_count, 2)),
+        ("edge_vertices", np.int32, (edge_count, 2)),
+        ("trapezoid_bounds", np.int32, (trapezoid_count, 4)),
+        ("trapezoid_inside", np.bool_, (trapezoid_count,)),
+        ("trapezoid_faces", np.int32, (trapezoid_count,)),
+    ]
+
+
+def signed_area(polygon: Polygon) -> float:
+    """
+    Computes the signed area of a polygon, positive when its vertices are in counter-clockwise order.
+    """
+    return sum(vertex.x * next_vertex.y - next_vertex.x * vertex.y for vertex, next_vertex in zip(polygon, polygon[1:] + polygon[:1])) / 2
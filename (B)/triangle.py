@@ -7,6 +7,15 @@ class Triangle:
         Initializes a triangle with the given vertices.
         """
         self.vertices = vertices
+        self.__color_str = None
 
-        r, g, b = [int(sum([vertex.color[i] for vertex in self.vertices]) / 3) for i in range(3)]
-        self.color_str = f"#{r:02x}{g:02x}{b:02x}"
\ No newline at end of file
+    @property
+    def color_str(self):
+        """
+        The fill color of the triangle, the average of its vertices colors, computed on first use only.
+        """
+        if self.__color_str is None:
+            r, g, b = [int(sum([vertex.color[i] for vertex in self.vertices]) / 3) for i in range(3)]
+            self.__color_str = f"#{r:02x}{g:02x}{b:02x}"
+
+        return self.__color_str
\ No newline at end of file
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+from rasterizer import rasterize_triangles
+from triangle import Triangle
+
+
+class TrianglesLayer:
+    """
+    RGB image of a set of filled triangles, which can be added and removed one batch at a time.
+
+    Each triangle gets a slot in flat arrays holding its corners, bounding box and color, filled once when it is
+    added. Removing triangles clears the bounding box of the removed triangles and fills again only the remaining
+    triangles overlapping it, so the work done does not depend on the number of triangles elsewhere in the image.
+    The slots of the removed triangles are reused.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Initializes an empty layer, with an empty image until `resize` is called.
+        """
+        self.image: np.ndarray = np.full((0, 0, 3), 255, dtype=np.uint8)
+        self.slots: dict[Triangle, int] = {}
+        self.free_slots: list[int] = []
+        self.slot_count = 0
+        self.corners = np.empty((capacity, 3, 2), dtype=np.float64)
+        self.bounds = np.empty((capacity, 4), dtype=np.float64)
+        self.colors = np.empty((capacity, 3), dtype=np.uint8)
+        self.in_use = np.zeros(capacity, dtype=bool)
+
+    def add(self, triangles: list[Triangle]) -> None:
+        """
+        Adds triangles to the layer and fills them into the image.
+        """
+        if not triangles:
+            return
+
+        n_reused = min(len(self.free_slots), len(triangles))
+        new_slots = np.arange(self.slot_count, self.slot_count + len(triangles) - n_reused)
+        slots = np.concatenate((np.array(self.free_slots[len(self.free_slots) - n_reused:], dtype=np.int64), new_slots))
+        del self.free_slots[len(self.free_slots) - n_reused:]
+        self.slot_count += len(new_slots)
+        if self.slot_count > len(self.in_use): self.__grow(self.slot_count)
+
+        corners = np.array([(vertex.x, vertex.y) for triangle in triangles for vertex in triangle.vertices], dtype=np.float64).reshape(-1, 3, 2)
+        self.corners[slots] = corners
+        self.bounds[slots] = np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1)
+        self.colors[slots] = np.frombuffer(b"".join(bytes.fromhex(triangle.color_str[1:]) for triangle in triangles), dtype=np.uint8).reshape(-1, 3)
+        self.in_use[slots] = True
+        self.slots.update(zip(triangles, slots.tolist()))
+
+        self.__fill(self.image, slots)
+
+    def remove(self, triangles: Iterable[Triangle]) -> None:
+        """
+        Removes triangles from the layer, and fills again the part of the image they covered.
+        """
+        slots = np.array([self.slots.pop(triangle) for triangle in triangles], dtype=np.int64)
+        if not slots.size:
+            return
+
+        self.in_use[slots] = False
+        self.free_slots.extend(slots.tolist())
+
+        height, width = self.image.shape[:2]
+        min_x, min_y = self.bounds[slots, :2].min(axis=0)
+        max_x, max_y = self.bounds[slots, 2:].max(axis=0)
+        x0, y0 = max(math.floor(min_x), 0), max(math.floor(min_y), 0)
+        x1, y1 = min(math.ceil(max_x) + 1, width), min(math.ceil(max_y) + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        overlapping = np.flatnonzero(self.in_use[:self.slot_count]
+                                     & (self.bounds[:self.slot_count, 0] < x1) & (self.bounds[:self.slot_count, 2] > x0)
+                                     & (self.bounds[:self.slot_count, 1] < y1) & (self.bounds[:self.slot_count, 3] > y0))
+
+        # The rasterizer writes through a flat view of its tile, so the region is filled in a contiguous copy
+        region = np.full((y1 - y0, x1 - x0, 3), 255, dtype=np.uint8)
+        self.__fill(region, overlapping, (x0, y0))
+        self.image[y0:y1, x0:x1] = region
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Fills all the triangles again into a blank image of the given size.
+        """
+        self.image = np.full((height, width, 3), 255, dtype=np.uint8)
+        self.__fill(self.image, np.flatnonzero(self.in_use[:self.slot_count]))
+
+    def clear(self) -> None:
+        """
+        Removes all the triangles, keeping the size of the image.
+        """
+        self.slots = {}
+        self.free_slots = []
+        self.slot_count = 0
+        self.in_use[:] = False
+        self.image[:] = 255
+
+    def __fill(self, tile: np.ndarray, slots: np.ndarray, origin: tuple[int, int] = (0, 0)) -> None:
+        """
+        Fills the triangles of the given slots into a tile of the image.
+        """
+        if not len(slots) or not tile.size:
+            return
+
+        rasterize_triangles(tile, self.corners[slots].reshape(-1, 2), np.arange(3 * len(slots)).reshape(-1, 3), self.colors[slots], origin)
+
+    def __grow(self, min_capacity: int) -> None:
+        """
+        Doubles the capacity of the slot arrays until they hold `min_capacity` slots.
+        """
+        capacity = max(2 * len(self.in_use), min_capacity)
+        extra = capacity - len(self.in_use)
+
+        self.corners = np.concatenate((self.corners, np.empty((extra, 3, 2), dtype=np.float64)))
+        self.bounds = np.concatenate((self.bounds, np.empty((extra, 4), dtype=np.float64)))
+        self.colors = np.concatenate((self.colors, np.empty((extra, 3), dtype=np.uint8)))
+        self.in_use = np.concatenate((self.in_use, np.zeros(extra, dtype=bool)))
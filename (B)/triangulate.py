@@ -0,0 +1,138 @@
+import argparse
+import json
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from algorithms import *
+from polygon_io import read_polygon_file
+from polygonal_area import PolygonalArea
+from profiling import TriangulationProfile
+
+
+class StageTimer:
+    """
+    Records the wall time of the successive stages of a run.
+    """
+    def __init__(self):
+        """
+        Initializes an empty record.
+        """
+        self.seconds_by_stage: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Times the enclosed block as the stage `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds_by_stage[name] = self.seconds_by_stage.get(name, 0.0) + time.perf_counter() - start
+
+
+def triangulate_file(input_path: str, timer: StageTimer, compact: bool = False, profile: TriangulationProfile | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reads a polygon file (text or binary) and triangulates the polygonal area it describes, optionally profiling
+    the stages of the triangulation.
+
+    Returns:
+        tuple: The (n, 2) float64 coordinates of all the vertices, polygon after polygon, the (n_triangles, 3)
+        int32 counter-clockwise vertex indices of the triangles, and the number of vertices of each polygon.
+    """
+    with timer.stage("read"):
+        coordinates = [np.array(polygon, dtype=np.float64) for polygon in read_polygon_file(input_path)]
+        if not coordinates: raise ValueError(f"No valid polygons found in {input_path}")
+
+        polygons = [[Vertex(x, y) for x, y in polygon.tolist()] for polygon in coordinates]
+
+    with timer.stage("triangulate"):
+        triangles = triangulate_polygonal_area(PolygonalArea(polygons), compact=compact, as_indices=True, profile=profile)
+
+    return np.concatenate(coordinates), triangles, np.array([len(polygon) for polygon in coordinates], dtype=np.int64)
+
+
+def write_triangulation(output_path: str, vertices: np.ndarray, triangles: np.ndarray, timings: dict[str, float]) -> None:
+    """
+    Writes a triangulation as JSON (to a .json file, or to the standard output for "-") or as a NumPy .npz archive.
+
+    The JSON document holds the "vertices" as [x, y] pairs, the "triangles" as triples of vertex indices and the
+    "timings" of the stages run so far, in seconds. The .npz archive holds the "vertices" and "triangles" arrays.
+    """
+    if output_path.endswith(".npz"):
+        np.savez(output_path, vertices=vertices, triangles=triangles)
+        return
+
+    document = {"vertices": vertices.tolist(), "triangles": triangles.tolist(), "timings": timings}
+
+    if output_path == "-":
+        json.dump(document, sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        with open(output_path, "w") as file:
+            json.dump(document, file)
+
+
+def render_image(image_path: str, vertices: np.ndarray, polygon_sizes: np.ndarray, triangles: np.ndarray) -> None:
+    """
+    Renders the polygons and the triangulation already computed to a PNG file, without triangulating again. The
+    drawing libraries are only imported here.
+    """
+    from polygonal_area_drawer import PolygonalAreaDrawer
+
+    drawer = PolygonalAreaDrawer(use_tkinter=False, output_path=image_path)
+    drawer.draw_triangulation_pil(vertices, polygon_sizes, triangles)
+
+
+def main():
+    """
+    Triangulates a polygon file without any user interface.
+
+    The triangles are written in a machine-readable format and the time spent in each stage is reported on the
+    standard error. No drawing library is imported unless an image is requested.
+    """
+    parser = argparse.ArgumentParser(description="Triangulate a polygonal area without rendering it.")
+    parser.add_argument("input", help="Text or binary polygon file")
+    parser.add_argument("-o", "--output", default="-", help="Output file: .json or .npz, or - for JSON on the standard output (default)")
+    parser.add_argument("--image", help="Also render the triangulation to this PNG file")
+    parser.add_argument("--timings", help="Also write the stage timings and the triangulation profile to this JSON file")
+    parser.add_argument("--memory", action="store_true", help="Also measure the peak memory of each triangulation stage (slower)")
+    parser.add_argument("--compact", action="store_true", help="Store the search structure and the trapezoids in integer columns")
+    parser.add_argument("--seed", type=int, help="Seed of the random edge insertion order")
+    args = parser.parse_args()
+
+    if args.seed is not None: random.seed(args.seed)
+
+    timer = StageTimer()
+    profile = TriangulationProfile(track_memory=args.memory)
+    vertices, triangles, polygon_sizes = triangulate_file(args.input, timer, args.compact, profile)
+
+    # The image is rendered before writing, so that the timings written cover it
+    if args.image:
+        with timer.stage("render"):
+            render_image(args.image, vertices, polygon_sizes, triangles)
+
+    with timer.stage("write"):
+        write_triangulation(args.output, vertices, triangles, timer.seconds_by_stage)
+
+    for name, seconds in timer.seconds_by_stage.items():
+        print(f"{name}: {seconds * 1000:.1f} ms", file=sys.stderr)
+
+        if name == "triangulate":
+            for stage_name, measures in profile.stages.items():
+                memory = f", peak {measures['peak_bytes'] / 2**20:.1f} MiB" if "peak_bytes" in measures else ""
+                print(f"  {stage_name}: {measures['seconds'] * 1000:.1f} ms{memory}", file=sys.stderr)
+
+    print(", ".join(f"{name}: {value}" for name, value in profile.counters.items()), file=sys.stderr)
+
+    if args.timings:
+        with open(args.timings, "w") as file:
+            json.dump({"stages": timer.seconds_by_stage, "triangulation": profile.to_dict()}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,56 @@
 import math
 import random
 
-class Vertex:
+from predicates import orientation
+
+class Point:
     """
-    Represents a vertex in a 2D space with (x, y) coordinates and an associated color
-    used to choose the color of neighboring triangles.
+    Represents a bare position in a 2D space, used for the temporary points computed by the algorithms.
     """
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """
-        Initializes a vertex with given coordinates and a random pastel color.
+        Initializes a point with given coordinates.
         """
         self.x = x
         self.y = y
-        self.color = [random.randint(100, 255) for _ in range(3)]
 
     def __gt__(self, other):
         """
-        Compares two vertices based on their vertical (y) position,
+        Compares two points based on their vertical (y) position,
         and their horizontal (x) position in case of a tie.
         """
         return self.y > other.y or (self.y == other.y and self.x > other.x)
 
+class Vertex(Point):
+    """
+    Represents a vertex in a 2D space with (x, y) coordinates and an associated color
+    used to choose the color of neighboring triangles.
+    """
+    __slots__ = ("__color",)
+
+    def __init__(self, x, y):
+        """
+        Initializes a vertex with given coordinates. Its color is only drawn when first requested.
+        """
+        self.x = x
+        self.y = y
+        self.__color = None
+
+    @property
+    def color(self):
+        """
+        The random pastel color of the vertex, drawn the first time it is requested by a renderer.
+        """
+        if self.__color is None: self.__color = [random.randint(100, 255) for _ in range(3)]
+        return self.__color
+
 def counter_clockwise(pt_a, pt_b, pt_c):
     """
     Determines if three vertices are arranged in a counter-clockwise order.
     """
-    return (pt_c.y - pt_a.y) * (pt_b.x - pt_a.x) > (pt_b.y - pt_a.y) * (pt_c.x - pt_a.x)
+    return orientation(pt_a.x, pt_a.y, pt_b.x, pt_b.y, pt_c.x, pt_c.y) > 0
 
 def segment_intersect(pt_a, pt_b, pt_c, pt_d):
     """